@@ -10,6 +10,8 @@ from .logger import *
 from .regexer import *
 from .schema import *
 from .validator import *
+from .model import *
+from .stream import *
 
 from .field import *  # isort:skip
 
@@ -6,3 +6,4 @@
 
 
 from .descriptors import *
+from .storages import *
@@ -5,7 +5,12 @@
 
 
 
+import datetime
+import decimal
+import enum
 import typing
+import uuid
+import weakref
 from dataclasses import astuple, dataclass, fields
 from pprint import pformat
 from typing import Any
@@ -14,6 +19,8 @@ from typingx import issubclassx
 from valio.error import errors
 from valio.logger import loggers
 
+from .storages import STORAGE, Storage
+
 __all__ = ["Property", "NAME", "DEFAULT", "DOC", "DEBUG"]
 
 T = typing.TypeVar('T')
@@ -26,6 +33,62 @@ DEFAULT = Union[Any, PropBound]
 DOC = Union[str, PropBound]
 DEBUG = Union[bool, PropBound]
 
+_MISSING = object()
+
+# per instance marks of the values validated with the current options of
+# their property, kept in this slot by the slotted models
+VALIDATED = "_valio_validated"
+
+# the marks of the other instances, kept off their namespace: id of the
+# instance -> (weak reference to it, marks), dropped along with it
+_MARKS: typing.Dict[int, typing.Tuple[weakref.ref, dict]] = {}
+
+_SLOT = type(type("_Slotted", (object,), {"__slots__": (VALIDATED,)}).__dict__[VALIDATED])
+
+# values that can not change once validated, an equal one is as valid
+_IMMUTABLE = frozenset({
+    type(None), bool, int, float, complex, str, bytes, decimal.Decimal,
+    datetime.date, datetime.datetime, datetime.time, datetime.timedelta, uuid.UUID,
+})
+
+
+def same_value(old, new) -> bool:
+    """whether ``new`` is an immutable value equal to ``old``, of its type"""
+    if type(old) is not type(new) or not (type(new) in _IMMUTABLE or isinstance(new, enum.Enum)):
+        return False
+    try:
+        return old is new or bool(old == new)
+    except Exception:
+        return False
+
+
+def _validated_marks(obj, create=False) -> typing.Optional[dict]:
+    if type(getattr(type(obj), VALIDATED, None)) is _SLOT:
+        marks = getattr(obj, VALIDATED, None)
+        if marks is None and create:
+            marks = {}
+            object.__setattr__(obj, VALIDATED, marks)
+        return marks
+    key = id(obj)
+    entry = _MARKS.get(key)
+    if entry is not None and entry[0]() is obj:
+        return entry[1]
+    if not create:
+        return None
+    try:
+        ref = weakref.ref(obj, lambda ref, key=key: _forget_marks(key, ref))
+    except TypeError:  # not weakly referenceable, its values are set again
+        return None
+    marks = {}
+    _MARKS[key] = (ref, marks)
+    return marks
+
+
+def _forget_marks(key, ref):
+    entry = _MARKS.get(key)
+    if entry is not None and entry[0] is ref:
+        del _MARKS[key]
+
 
 @dataclass
 class Property(loggers.Logger):
@@ -50,6 +113,13 @@ class Property(loggers.Logger):
     >>> p.name = "some name"
     >>> p.salary = "1000000"
     ...
+
+    Values are kept in the instance ``__dict__`` unless another
+    :class:`~valio.descriptor.storages.Storage` is given as ``storage``.
+
+    Properties giving an :meth:`_unchanged_token` leave an instance as is
+    when it is assigned an immutable value equal to the one it holds, and
+    that it got from them with the same token.
     """
 
     name: NAME = None
@@ -57,6 +127,7 @@ class Property(loggers.Logger):
     doc: DOC = None
     debug: DEBUG = None
     errors: Union[list, None] = None
+    storage = None
 
     def __init__(
             self,
@@ -64,6 +135,7 @@ class Property(loggers.Logger):
             default: DEFAULT = None,
             doc: DOC = None,
             debug: DEBUG = None,
+            storage: STORAGE = None,
             **kwargs,
     ):
         if name is None or isinstance(name, str):
@@ -89,6 +161,13 @@ class Property(loggers.Logger):
                 f"debug expected type {bool.__name__} value, "
                 f"got {type(debug).__name__} type instead"
             )
+        if storage is None or isinstance(storage, Storage):
+            self.storage = storage
+        else:
+            raise TypeError(
+                f"storage expected type {Storage.__name__} value, "
+                f"got {type(storage).__name__} type instead"
+            )
         self.default = default
         self.annotation = getattr(self, "annotation", None)
         self._dict = None
@@ -101,6 +180,22 @@ class Property(loggers.Logger):
         """
         return value
 
+    def _unchanged_token(self, obj):
+        """what the value of ``obj`` must have been set with for an equal
+        one to be left as is, ``None`` when values are always set again.
+        It changes along with anything the outcome of setting depends on."""
+        return None
+
+    def _is_unchanged(self, obj, value, token) -> bool:
+        marks = _validated_marks(obj)
+        if marks is None or marks.get(self.name) is not token:
+            return False
+        if (storage := self.storage) is None:
+            stored = obj.__dict__.get(self.name, _MISSING)
+        else:
+            stored = storage.get(obj, self.name, _MISSING)
+        return same_value(stored, value)
+
     def post_set(self, obj, value):
         """All the post-processing after setting any value is done via
         this api.
@@ -262,8 +357,16 @@ class Property(loggers.Logger):
             value = value or (self.default \
                 if not callable(self.default) else self.default()) \
                 if self.default is not None else value
+            token = self._unchanged_token(obj)
+            if token is not None and self._is_unchanged(obj, value, token):
+                return
             value = self.pre_set(obj, value)
-            obj.__dict__[self.name] = value
+            if (storage := self.storage) is None:
+                obj.__dict__[self.name] = value
+            else:
+                storage.set(obj, self.name, value)
+            if token is not None and (marks := _validated_marks(obj, create=True)) is not None:
+                marks[self.name] = token
             if logger:
                 logger.info(f"set: {class_name}.{attr_name}")
             self.post_set(obj, value)
@@ -286,7 +389,9 @@ class Property(loggers.Logger):
         error = False
         try:
             self.pre_get(obj, self.name)
-            return obj.__dict__[self.name]
+            if (storage := self.storage) is None:
+                return obj.__dict__[self.name]
+            return storage.get(obj, self.name)
         except (errors.GetPropertyError, Exception) as gpe:
             if logger:
                 logger.error(gpe)
@@ -315,7 +420,10 @@ class Property(loggers.Logger):
         error = False
         try:
             self.pre_delete(obj, self.name)
-            del obj.__dict__[self.name]
+            if (storage := self.storage) is None:
+                del obj.__dict__[self.name]
+            else:
+                storage.delete(obj, self.name)
             self.post_delete(obj, self.name)
 
         except (errors.DeletePropertyError, Exception) as dpe:
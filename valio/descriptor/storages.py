@@ -0,0 +1,313 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Where a :class:`~valio.descriptor.descriptors.Property` keeps the values
+it guards.
+
+By default values live in the instance ``__dict__``. :class:`SlotStorage`
+keeps them in hidden ``__slots__`` so instances carry no dict at all, and
+:class:`RecordStorage` keeps the values of every instance in shared per field
+columns, an instance only holding its row number.
+"""
+
+import array
+import typing
+from abc import ABC, abstractmethod
+
+__all__ = [
+    "Storage",
+    "DictStorage",
+    "SlotStorage",
+    "RecordStorage",
+    "StringPool",
+    "STRING_POOL",
+    "STORAGE",
+    "slot_name",
+]
+
+_MISSING = object()
+
+# RecordStorage typecode of the string pooled columns
+STRING_POOL = "pool"
+
+# RecordStorage per row flags, a value never set is flagged 0
+_SET, _NONE = 1, 2
+
+
+def slot_name(name: str) -> str:
+    """the hidden slot holding the value of the ``name`` property"""
+    return f"_valio_{name}"
+
+
+class Storage(ABC):
+    """Storage strategy of a property, ``get`` raises :class:`KeyError` for
+    a value never set unless a ``default`` is given."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get(self, obj, name, default=_MISSING):
+        """the value of ``name`` kept for ``obj``"""
+
+    @abstractmethod
+    def set(self, obj, name, value):
+        """keep ``value`` as the value of ``name`` for ``obj``"""
+
+    @abstractmethod
+    def delete(self, obj, name):
+        """forget the value of ``name`` kept for ``obj``"""
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class DictStorage(Storage):
+    """values kept in the instance ``__dict__``, the default storage"""
+
+    __slots__ = ()
+
+    def get(self, obj, name, default=_MISSING):
+        if default is _MISSING:
+            return obj.__dict__[name]
+        return obj.__dict__.get(name, default)
+
+    def set(self, obj, name, value):
+        obj.__dict__[name] = value
+
+    def delete(self, obj, name):
+        del obj.__dict__[name]
+
+
+class SlotStorage(Storage):
+    """values kept in the ``_valio_<name>`` slot of the instance, see
+    :func:`valio.model.model` with ``slots=True`` which declares them.
+    Instances without such slot fall back to their ``__dict__``."""
+
+    __slots__ = ("_slots",)
+
+    def __init__(self):
+        self._slots: typing.Dict[str, str] = {}
+
+    def _slot(self, name):
+        try:
+            return self._slots[name]
+        except KeyError:
+            slot = self._slots[name] = slot_name(name)
+            return slot
+
+    def get(self, obj, name, default=_MISSING):
+        try:
+            return getattr(obj, self._slot(name))
+        except AttributeError:
+            if default is _MISSING:
+                raise KeyError(name) from None
+            return default
+
+    def set(self, obj, name, value):
+        setattr(obj, self._slot(name), value)
+
+    def delete(self, obj, name):
+        try:
+            delattr(obj, self._slot(name))
+        except AttributeError:
+            raise KeyError(name) from None
+
+
+class StringPool(object):
+    """Column of strings stored once each, every row holding a 4 bytes code
+    of its string (0 for ``None``). Strings are never removed from the pool.
+
+    >>> pool = StringPool()
+    >>> pool.extend(["in", "us", "in", None])
+    >>> list(pool), pool.strings
+    (['in', 'us', 'in', None], [None, 'in', 'us'])
+    """
+
+    __slots__ = ("strings", "codes", "_codes")
+
+    def __init__(self, size: int = 0):
+        self.strings: typing.List[typing.Optional[str]] = [None]
+        self.codes = array.array("I", bytes(array.array("I").itemsize * size))
+        self._codes: typing.Dict[str, int] = {}
+
+    def _code(self, value) -> int:
+        if value is None:
+            return 0
+        if type(value) is not str:
+            raise TypeError(f"{type(self).__name__} only holds str values, got {type(value).__name__}")
+        try:
+            return self._codes[value]
+        except KeyError:
+            code = self._codes[value] = len(self.strings)
+            self.strings.append(value)
+            return code
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.strings[code] for code in self.codes[index]]
+        return self.strings[self.codes[index]]
+
+    def __setitem__(self, index, value):
+        self.codes[index] = self._code(value)
+
+    def __delitem__(self, index):
+        del self.codes[index]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        strings = self.strings
+        return (strings[code] for code in self.codes)
+
+    def append(self, value):
+        self.codes.append(self._code(value))
+
+    def extend(self, values):
+        self.codes.extend(map(self._code, values))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class RecordStorage(Storage):
+    """Values of all the instances kept in shared per field columns.
+
+    Every instance only holds its row number, in the ``row_attribute``
+    attribute (or slot). Columns are lists, ``array.array`` for the fields
+    given a ``typecodes`` entry, so ten millions of ints take 80MB instead of
+    a dict and a boxed int per instance, or a :class:`StringPool` for the
+    :data:`STRING_POOL` ones. A typed column is turned into a list the first
+    time it is given a value it can not hold (``None``, a too large int...).
+    Rows are recycled once :meth:`release` is called for an instance that is
+    no longer used.
+
+    >>> storage = RecordStorage(typecodes={"age": "q"})
+    >>> class Person(object):
+    ...     __slots__ = ("_valio_row",)
+    >>> person = Person()
+    >>> storage.set(person, "age", 30)
+    >>> storage.get(person, "age"), storage.columns["age"]
+    (30, array('q', [30]))
+    """
+
+    __slots__ = ("columns", "typecodes", "row_attribute", "_present", "_free", "_rows")
+
+    def __init__(
+            self,
+            typecodes: typing.Optional[typing.Mapping[str, str]] = None,
+            row_attribute: str = "_valio_row",
+    ):
+        self.columns: typing.Dict[str, typing.MutableSequence] = {}
+        self.typecodes: typing.Dict[str, str] = dict(typecodes or {})
+        self.row_attribute = row_attribute
+        self._present: typing.Dict[str, bytearray] = {}
+        self._free: typing.List[int] = []
+        self._rows = 0
+
+    def __len__(self):
+        """number of rows in use"""
+        return self._rows - len(self._free)
+
+    def column(self, name) -> typing.MutableSequence:
+        """the column of ``name``, created on the first call"""
+        try:
+            return self.columns[name]
+        except KeyError:
+            pass
+        typecode = self.typecodes.get(name)
+        if typecode == STRING_POOL:
+            column = StringPool(self._rows)
+        elif typecode is not None:
+            column = array.array(typecode, bytes(array.array(typecode).itemsize * self._rows))
+        else:
+            column = [None] * self._rows
+        self.columns[name] = column
+        self._present[name] = bytearray(self._rows)
+        return column
+
+    def new_row(self) -> int:
+        """reserve a row, reusing a released one when there is any"""
+        if self._free:
+            return self._free.pop()
+        row = self._rows
+        self._rows += 1
+        for name, column in self.columns.items():
+            column.append(0 if isinstance(column, array.array) else None)
+            self._present[name].append(0)
+        return row
+
+    def truncate(self, rows: int):
+        """drop every row from ``rows`` on"""
+        if rows < self._rows:
+            for name, column in self.columns.items():
+                del column[rows:]
+                del self._present[name][rows:]
+            self._free = [row for row in self._free if row < rows]
+            self._rows = rows
+
+    def row(self, obj, create=False) -> typing.Optional[int]:
+        """row number of ``obj``, reserved on the way when ``create``"""
+        row = getattr(obj, self.row_attribute, None)
+        if row is None and create:
+            row = self.new_row()
+            setattr(obj, self.row_attribute, row)
+        return row
+
+    def release(self, obj):
+        """clear the values of ``obj`` and make its row reusable"""
+        row = self.row(obj)
+        if row is None:
+            return
+        for name, column in self.columns.items():
+            self._present[name][row] = 0
+            if not isinstance(column, array.array):
+                column[row] = None
+        self._free.append(row)
+        delattr(obj, self.row_attribute)
+
+    def get(self, obj, name, default=_MISSING):
+        row = self.row(obj)
+        present = self._present.get(name)
+        if row is None or present is None or not present[row]:
+            if default is _MISSING:
+                raise KeyError(name)
+            return default
+        return self.columns[name][row] if present[row] != _NONE else None
+
+    def set(self, obj, name, value):
+        column = self.column(name)
+        row = self.row(obj, create=True)
+        present = self._present[name]
+        if value is None and isinstance(column, array.array):
+            # typed columns keep None out of the array
+            column[row], present[row] = 0, _NONE
+            return
+        try:
+            column[row] = value
+        except (TypeError, OverflowError):
+            if isinstance(column, list):
+                raise
+            column = self.columns[name] = [
+                item if flag != _NONE else None for item, flag in zip(column, present)
+            ]
+            column[row] = value
+        present[row] = _SET
+
+    def delete(self, obj, name):
+        row = self.row(obj)
+        present = self._present.get(name)
+        if row is None or present is None or not present[row]:
+            raise KeyError(name)
+        present[row] = 0
+        column = self.columns[name]
+        if not isinstance(column, array.array):
+            column[row] = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}(columns={list(self.columns)}, rows={len(self)})"
+
+
+STORAGE = typing.Union[Storage, None]
@@ -29,6 +29,139 @@ class DeleteAttributeError(AttributeError):
     pass
 
 
+class ItemValidationError(ValueError):
+    """Errors found while validating the items of a container, ``errors``
+    holds ``(index or key, error)`` pairs."""
+
+    def __init__(self, error_message=None, errors=None):
+        super(ItemValidationError, self).__init__(error_message)
+        self.errors = list(errors or [])
+
+
+class ValidationError(ValueError):
+    """All the errors found while validating the fields of a model,
+    ``errors`` holds ``(field name, error)`` pairs. Without an
+    ``error_message`` the message is made of the errors, when shown."""
+
+    def __init__(self, error_message=None, errors=None):
+        super(ValidationError, self).__init__(error_message)
+        self.errors = list(errors or [])
+
+    def structured(self):
+        """the errors as ``(field, code, params)`` tuples, fields named as
+        in ``errors`` (``outer.inner`` for nested ones), the code of an error
+        not raised by a valio check is its type name"""
+        return [
+            (name or error.field, error.code, error.params) if isinstance(error, FieldError)
+            else (name, type(error).__name__, {"message": str(error)})
+            for name, error in self.errors
+        ]
+
+    def __str__(self):
+        if self.args and self.args[0] is not None:
+            return str(self.args[0])
+        return "; ".join(f"{name}: {error}" for name, error in self.errors)
+
+
+class FieldError(Exception):
+    """A failed check of a field: ``code`` names the check and ``params``
+    holds what the message is made of, the message is only formatted when
+    the error is shown, errors discarded (``debug=False``) or only counted
+    never pay for it."""
+
+    template = "{field} is invalid"
+
+    def __init__(self, field=None, code=None, params=None, template=None):
+        super(FieldError, self).__init__(field, code)
+        self.field = field
+        self.code = code
+        self.params = params if params is not None else {}
+        if template is not None:
+            self.template = template
+
+    @property
+    def message(self):
+        return self.template.format(field=self.field, **self.params)
+
+    def __str__(self):
+        return self.message
+
+    def __reduce__(self):
+        return type(self), (self.field, self.code, self.params, self.template)
+
+
+class FieldValueError(FieldError, ValueError):
+    pass
+
+
+class FieldTypeError(FieldError, TypeError):
+    pass
+
+
+class FieldAttributeError(FieldError, AttributeError):
+    pass
+
+
+class Ok(object):
+    """Outcome of a check that passed, true in a boolean context."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value=None):
+        self.value = value
+
+    def __bool__(self):
+        return True
+
+    def __eq__(self, other):
+        return type(other) is Ok and other.value == self.value
+
+    def __hash__(self):
+        return hash((Ok, self.value))
+
+    def __repr__(self):
+        return f"Ok({self.value!r})"
+
+
+class Violation(object):
+    """Outcome of a failed check, false in a boolean context: what a
+    :class:`FieldError` is made of, without raising nor formatting anything.
+    ``to_error()`` builds the error to raise, ``error`` keeps the one a
+    check raised when it could only be run by raising."""
+
+    __slots__ = ("field", "code", "params", "template", "error_type", "error")
+
+    def __init__(self, field=None, code=None, params=None, template=None,
+                 error_type=None, error=None):
+        self.field = field
+        self.code = code
+        self.params = params if params is not None else {}
+        self.template = template
+        self.error_type = error_type if error_type is not None else FieldValueError
+        self.error = error
+
+    @classmethod
+    def from_error(cls, error, field=None):
+        if isinstance(error, FieldError):
+            return cls(error.field, error.code, error.params, error.template, type(error), error)
+        return cls(field, type(error).__name__, {"message": str(error)}, "{message}", type(error), error)
+
+    def to_error(self) -> Exception:
+        if self.error is not None:
+            return self.error
+        return self.error_type(self.field, self.code, self.params, self.template)
+
+    @property
+    def message(self):
+        return str(self.to_error())
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return f"Violation(field={self.field!r}, code={self.code!r}, params={self.params!r})"
+
+
 class DustBaseException(Exception):
     """Base Dust exception"""
 
@@ -5,20 +5,22 @@
 
 
 
+import functools
 from typing import Type, Union
 
 from valio import validator as _validator
 from valio.descriptor import DEBUG, DEFAULT, DOC, NAME
 from valio.error import errors
 from valio.logger import LOG_DIR, LOG_LEVEL, LOGGER, loggers
-from valio.validator import (BOOL, BYTES, DATE_TIME_DELTA, FLOAT, INT, PATTERN,
-                             STR, VALUE, UUID_Type)
+from valio.validator import (BOOL, BYTES, DATE_TIME_DELTA, FLOAT, INT,
+                             NETWORKS, PATTERN, STR, VALUE, UUID_Type)
 
 # from tortoise import fields
 
 
 __all__ = [
     "FieldMixin",
+    "LoggingField",
     "Field",
     "IntegerField",
     "FloatField",
@@ -41,32 +43,43 @@ __all__ = [
     "StringEnumField"
 ]
 
-_logger = dict()
-
-
 class FieldBase(loggers.Logger):
-    """This class provides base class for all the Field related stuffs"""
+    """This class provides base class for all the Field related stuffs,
+    a field logging its activity is turned into a :class:`LoggingField` of
+    its class once named, the others keep the plain attribute access."""
 
     def __set_name__(self, owner, name):
         self.name = name
-        _logger[hex(id(self))] = self.get_logger(owner.__name__, name)
+        if self.logger is not False and self.get_logger(owner.__name__, name):
+            self.__class__ = _logging_class(type(self))
 
     def __class_getitem__(cls, key):
         """getattr"""
-        if logger := _logger.get(hex(id(cls)), None):
-            logger.info(f"{cls}: getting: {key}")
-        try:
-            if key not in cls.__dict__:
+        if key not in cls.__dict__:
+            raise AttributeError(key)
+        return cls.__dict__[key]
+
+    def __getitem__(self, key):
+        """getattr"""
+        if key not in self.__dict__:
+            if key not in type(self).__dict__:
                 raise AttributeError(key)
-            return cls.__dict__[key]
-        except (errors.GetAttributeError, Exception) as ge:
-            if logger:
-                logger.error(ge)
-            raise ge
+            return type(self).__dict__[key]
+        return self.__dict__[key]
+
+    def __setitem__(self, key, value):
+        """setattr"""
+        setattr(self, key, value)
+
+
+class LoggingField(object):
+    """Attribute access of a field logging its activity with its
+    ``logger``, mixed in the class of the field by
+    :meth:`FieldBase.__set_name__`."""
 
     def __setattr__(self, key, value):
         """setattr"""
-        if logger := _logger.get(hex(id(self)), None):
+        if logger := self.__dict__.get("logger"):
             logger.info(f"{self}: setting: {key}")
         try:
             object.__setattr__(self, key, value)
@@ -77,14 +90,10 @@ class FieldBase(loggers.Logger):
 
     def __getattr__(self, key):
         """getattr"""
-        if logger := _logger.get(hex(id(self)), None):
+        if logger := self.__dict__.get("logger"):
             logger.info(f"{self}: getting: {key}")
         try:
-            if key not in self.__dict__:
-                if key not in type(self).__dict__:
-                    raise AttributeError(key)
-                return type(self).__dict__[key]
-            return self.__dict__[key]
+            return FieldBase.__getitem__(self, key)
         except (errors.GetAttributeError, Exception) as ge:
             if logger:
                 logger.error(ge)
@@ -92,7 +101,7 @@ class FieldBase(loggers.Logger):
 
     def __delattr__(self, key):
         """delattr"""
-        if logger := _logger.get(hex(id(self)), None):
+        if logger := self.__dict__.get("logger"):
             logger.info(f"{self}: deleting: {key}")
         try:
             del self.__dict__[key]
@@ -104,6 +113,12 @@ class FieldBase(loggers.Logger):
     __getitem__ = __getattr__
     __setitem__ = __setattr__
 
+
+@functools.lru_cache(maxsize=None)
+def _logging_class(cls) -> type:
+    # named as cls, the field only gains the logging attribute access
+    return type(cls.__name__, (LoggingField, cls), {"__qualname__": cls.__qualname__, "__module__": cls.__module__})
+
 VALIDATOR = Union[Type[_validator.Validator], _validator.Validator]
 
 class FieldMixin(FieldBase):
@@ -121,6 +136,23 @@ class FieldMixin(FieldBase):
             log_dir=log_dir,
         )
 
+    @classmethod
+    def from_spec(cls, spec, **attributes):
+        """a field of this class whose validator is built by the
+        :class:`~valio.validator.specs.ValidatorSpec` ``spec``, given
+        ``attributes`` (see :meth:`ValidatorSpec.build`); its logging
+        options are those of the spec"""
+        field = object.__new__(cls)
+        field.validator = spec.build(**attributes)
+        options = spec.options
+        FieldMixin.__init__(
+            field,
+            logger=attributes.get("logger", options.get("logger")),
+            log_levels=options.get("log_levels"),
+            log_dir=options.get("log_dir"),
+        )
+        return field
+
     def add_validator(self, func):
         self.validator.add_validator(func)
         return func
@@ -629,6 +661,8 @@ class IP4AddressField(FieldMixin):
             expire_after: DATE_TIME_DELTA = None,
             expire_on: DATE_TIME_DELTA = None,
             expire_before: DATE_TIME_DELTA = None,
+            in_networks: NETWORKS = None,
+            not_in_networks: NETWORKS = None,
             logger: LOGGER = None,
             log_levels: LOG_LEVEL = None,
             log_dir: LOG_DIR = None,
@@ -651,6 +685,8 @@ class IP4AddressField(FieldMixin):
             expire_after=expire_after,
             expire_on=expire_on,
             expire_before=expire_before,
+            in_networks=in_networks,
+            not_in_networks=not_in_networks,
             name=name,
             doc=doc,
             debug=debug,
@@ -678,6 +714,8 @@ class IP6AddressField(FieldMixin):
             expire_after: DATE_TIME_DELTA = None,
             expire_on: DATE_TIME_DELTA = None,
             expire_before: DATE_TIME_DELTA = None,
+            in_networks: NETWORKS = None,
+            not_in_networks: NETWORKS = None,
             logger: LOGGER = None,
             log_levels: LOG_LEVEL = None,
             log_dir: LOG_DIR = None,
@@ -700,6 +738,8 @@ class IP6AddressField(FieldMixin):
             expire_after=expire_after,
             expire_on=expire_on,
             expire_before=expire_before,
+            in_networks=in_networks,
+            not_in_networks=not_in_networks,
             name=name,
             doc=doc,
             debug=debug,
@@ -727,6 +767,8 @@ class IPAnyAddressField(FieldMixin):
             expire_after: DATE_TIME_DELTA = None,
             expire_on: DATE_TIME_DELTA = None,
             expire_before: DATE_TIME_DELTA = None,
+            in_networks: NETWORKS = None,
+            not_in_networks: NETWORKS = None,
             logger: LOGGER = None,
             log_levels: LOG_LEVEL = None,
             log_dir: LOG_DIR = None,
@@ -749,6 +791,8 @@ class IPAnyAddressField(FieldMixin):
             expire_after=expire_after,
             expire_on=expire_on,
             expire_before=expire_before,
+            in_networks=in_networks,
+            not_in_networks=not_in_networks,
             name=name,
             doc=doc,
             debug=debug,
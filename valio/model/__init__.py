@@ -0,0 +1,10 @@
+# Copyright (c) 2022 Valio
+# 
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+
+
+from .constraints import *
+from .models import *
+from .tables import *
@@ -0,0 +1,144 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Model level constraints over several fields.
+
+A constraint is a method of a model declaring the fields it ``reads``, it
+gets their values and raises for an invalid combination of them; declaring
+fields it ``sets`` it returns their values (a tuple for several), the
+constraints reading them then run after it. The constraints of a model are
+put in dependency order once, when the class is made a model:
+
+* its ``__init__`` runs all of them once, after every field is set;
+* assigning a field of a built instance only runs the constraints reading
+  it, and those reading what they set, none when the field is assigned an
+  equal immutable value;
+* :func:`~valio.model.models.validate_mapping` runs all of them over the
+  checked values.
+
+The errors of the constraints are raised together as one
+:class:`~valio.error.errors.ValidationError`, named after the constraints.
+"""
+
+import graphlib
+import typing
+
+from valio.error import errors
+
+__all__ = ["Constraint", "constraint"]
+
+_CONSTRAINT = "__valio_constraint__"
+
+
+class Constraint(typing.NamedTuple):
+    name: str
+    func: typing.Callable
+    reads: typing.Tuple[str, ...]
+    sets: typing.Tuple[str, ...] = ()
+    after: typing.Tuple[str, ...] = ()
+
+    def run(self, instance, setattr_):
+        values = self.func(instance, *(getattr(instance, name) for name in self.reads))
+        if len(self.sets) == 1:
+            setattr_(instance, self.sets[0], values)
+        elif self.sets:
+            for name, value in zip(self.sets, values):
+                setattr_(instance, name, value)
+
+
+def constraint(*reads: str, sets: typing.Sequence[str] = (), after: typing.Sequence[str] = ()):
+    """Declare a method of a model a constraint over the fields it
+    ``reads``, run after the constraints named in ``after`` and those
+    setting what it reads.
+
+    >>> from valio import StringValidator, model
+    >>> @model
+    ... class Register(object):
+    ...     password: str = StringValidator(logger=False, debug=True)
+    ...     confirm_password: str = StringValidator(logger=False, debug=True)
+    ...
+    ...     @constraint("password", "confirm_password")
+    ...     def passwords_match(self, password, confirm_password):
+    ...         if password != confirm_password:
+    ...             raise ValueError("passwords do not match")
+    ...
+    >>> Register("secret", "secret")
+    Register(password='secret', confirm_password='secret')
+    >>> Register("secret", "Secret")
+    Traceback (most recent call last):
+    ...
+    valio.error.errors.ValidationError: passwords_match: passwords do not match
+    """
+    if not reads:
+        raise TypeError("a constraint reads at least one field")
+
+    def decorator(func):
+        setattr(func, _CONSTRAINT, Constraint(func.__name__, func, tuple(reads), tuple(sets), tuple(after)))
+        return func
+
+    return decorator
+
+
+class ConstraintPlan(typing.NamedTuple):
+    # every constraint, in dependency order
+    ordered: typing.Tuple[Constraint, ...]
+    # field name: the constraints to run once it changed, in order
+    by_field: typing.Mapping[str, typing.Tuple[Constraint, ...]]
+
+    def run(self, instance, constraints, setattr_):
+        found = []
+        for item in constraints:
+            try:
+                item.run(instance, setattr_)
+            except errors.ValidationError as error:
+                found.extend(error.errors or [(item.name, error)])
+            except Exception as error:
+                found.append((item.name, error))
+        if found:
+            raise errors.ValidationError(errors=found)
+
+
+def constraint_plan(cls, field_names) -> typing.Optional[ConstraintPlan]:
+    """the constraints of ``cls`` in dependency order, ``None`` without
+    any; unknown fields and constraints, and cycles, raise ``TypeError``"""
+    found = {}
+    for klass in reversed(cls.__mro__):
+        for attribute in vars(klass).values():
+            item = getattr(attribute, _CONSTRAINT, None)
+            if isinstance(item, Constraint):
+                found[item.name] = item
+    if not found:
+        return None
+
+    setters = {}
+    for item in found.values():
+        for name in item.reads + item.sets:
+            if name not in field_names:
+                raise TypeError(f"constraint {item.name} of {cls.__name__} uses an unknown field {name!r}")
+        for name in item.sets:
+            setters.setdefault(name, []).append(item.name)
+    sorter = graphlib.TopologicalSorter()
+    for item in found.values():
+        for name in item.after:
+            if name not in found:
+                raise TypeError(f"constraint {item.name} of {cls.__name__} runs after an unknown constraint {name!r}")
+        depends = {setter for name in item.reads for setter in setters.get(name, ()) if setter != item.name}
+        sorter.add(item.name, *item.after, *depends)
+    try:
+        ordered = tuple(found[name] for name in sorter.static_order())
+    except graphlib.CycleError as error:
+        raise TypeError(f"constraints of {cls.__name__} depend on each other: {error.args[1]}") from None
+
+    by_field = {}
+    for name in field_names:
+        # the constraints reading the field, then those reading what they set
+        changed, selected = {name}, set()
+        for item in ordered:
+            if changed.intersection(item.reads):
+                selected.add(item.name)
+                changed.update(item.sets)
+        if selected:
+            by_field[name] = tuple(item for item in ordered if item.name in selected)
+    return ConstraintPlan(ordered, by_field)
@@ -0,0 +1,597 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Dataclass models with a generated, single pass ``__init__``.
+
+``@model`` turns a class into a dataclass and replaces its ``__init__``
+with one generated for the class: default resolution, ``pre_set`` (the
+validation plan) and ``post_set`` of every valio field are inlined, values
+are written straight to the instance ``__dict__`` (or the storage of the
+field) and the errors of all the debug fields are raised together as one
+:class:`~valio.error.errors.ValidationError`.
+
+With ``slots=True`` instances have no ``__dict__``, the valio fields keep
+their values in hidden ``_valio_<name>`` slots.
+
+:func:`build` makes a model out of raw data, the mappings and tuples of its
+nested model fields being built into models first, each only validated by
+its own ``__init__``. :func:`validate_mapping` checks such data against the
+fields of a model without building anything.
+"""
+
+import collections.abc
+import copy
+import dataclasses
+import inspect
+import types
+import typing
+
+from valio.descriptor import descriptors, storages
+from valio.error import errors
+from valio.field import fields as _fields
+from valio.validator import validators
+
+from . import constraints as _constraints
+
+__all__ = ["model", "is_model", "build", "validate_mapping", "MAX_DEPTH"]
+
+_MODEL = "__valio_model__"
+
+_NESTED_PLAN = "__valio_nested_plan__"
+
+_MAPPING_PLAN = "__valio_mapping_plan__"
+
+_CONSTRAINTS = "__valio_constraints__"
+
+MAX_DEPTH = 32
+
+_SEQUENCES = (list, tuple, collections.abc.Sequence, collections.abc.MutableSequence)
+
+
+def _property_of(cls, name) -> typing.Optional[descriptors.Property]:
+    attribute = inspect.getattr_static(cls, name, None)
+    return attribute if isinstance(attribute, descriptors.Property) else None
+
+
+def _inlinable(prop) -> bool:
+    # only the stock __set__ implementations are inlined, anything else
+    # (custom descriptors, Fields...) goes through its own __set__
+    return type(prop).__set__ in (descriptors.Property.__set__, validators.Validator.__set__)
+
+
+def _add_error(found, field_name, error):
+    # a field collecting all its errors raised them as one ValidationError
+    if isinstance(error, errors.ValidationError) and error.errors:
+        found.extend(error.errors)
+    else:
+        found.append((field_name, error))
+
+
+def _set_property_lines(index, field_name, prop, fail_fast=False) -> typing.List[str]:
+    v = f"_v{index}"
+    slow_path = f"{v}.logger"
+    if isinstance(prop, validators.Validator):
+        slow_path += f" or {v}.__dict__.get('lazy')"
+    add_error = f"_add_error(_errors, {field_name!r}, _error)"
+    if fail_fast:
+        add_error += "; raise _ValidationError(errors=_errors)"
+    return [
+        f"if {slow_path}:",
+        f"    try:",
+        f"        {v}.__set__(self, {field_name})",
+        f"    except Exception as _error:",
+        f"        {add_error}",
+        f"else:",
+        f"    try:",
+        f"        _default = {v}.default",
+        f"        if _default is not None and not {field_name}:",
+        f"            {field_name} = _default() if callable(_default) else _default",
+        f"        {field_name} = {v}.pre_set(self, {field_name})",
+        f"        _d[{prop.name or field_name!r}] = {field_name}" if prop.storage is None
+        else f"        {v}.storage.set(self, {prop.name or field_name!r}, {field_name})",
+        f"        {v}.post_set(self, {field_name})",
+        f"    except Exception as _error:",
+        f"        {v}.errors.append(_error)",
+        f"        if {v}.debug:",
+        f"            {add_error}",
+    ]
+
+
+def _init_source(cls, namespace, fail_fast=False, constrained=False) -> str:
+    params = inspect.signature(cls.__init__).parameters
+    fields = cls.__dataclass_fields__
+    frozen = cls.__dataclass_params__.frozen
+
+    signature, keyword_only = ["self"], False
+    for name, param in list(params.items())[1:]:
+        if param.kind is inspect.Parameter.KEYWORD_ONLY and not keyword_only:
+            signature.append("*")
+            keyword_only = True
+        if param.default is inspect.Parameter.empty:
+            signature.append(name)
+        else:
+            namespace[f"_param_{name}"] = param.default
+            signature.append(f"{name}=_param_{name}")
+
+    body = ["_errors = []"]
+    init_vars, uses_dict = [], False
+    for index, (name, field) in enumerate(fields.items()):
+        field_type = getattr(field, "_field_type", None)
+        if field_type is dataclasses._FIELD_INITVAR:
+            init_vars.append(name)
+            continue
+        if field_type is dataclasses._FIELD_CLASSVAR:
+            continue
+
+        if field.default_factory is not dataclasses.MISSING:
+            namespace[f"_factory_{name}"] = field.default_factory
+            if field.init:
+                body.append(f"if {name} is _param_{name}:")
+                body.append(f"    {name} = _factory_{name}()")
+            else:
+                body.append(f"{name} = _factory_{name}()")
+        elif not field.init:
+            if field.default is dataclasses.MISSING:
+                continue
+            namespace[f"_default_{name}"] = field.default
+            body.append(f"{name} = _default_{name}")
+
+        prop = _property_of(cls, name)
+        if prop is not None and _inlinable(prop):
+            namespace[f"_v{index}"] = prop
+            uses_dict = uses_dict or prop.storage is None
+            body.extend(_set_property_lines(index, name, prop, fail_fast))
+        elif frozen:
+            body.append(f"object.__setattr__(self, {name!r}, {name})")
+        elif constrained:
+            # constraints only run once every field is set
+            body.append(f"_setattr(self, {name!r}, {name})")
+        else:
+            body.append(f"self.{name} = {name}")
+
+    if uses_dict:
+        body.insert(0, "_d = self.__dict__")
+    body.append("if _errors:")
+    body.append("    raise _ValidationError(errors=_errors)")
+    if constrained:
+        body.append("_constraints.run(self, _constraints.ordered, _setattr)")
+    if hasattr(cls, "__post_init__"):
+        body.append(f"self.__post_init__({', '.join(init_vars)})")
+
+    lines = "\n".join(f"    {line}" for line in body)
+    return f"def __init__({', '.join(signature)}):\n{lines}\n"
+
+
+def _add_slots(cls):
+    # as dataclasses does for slots=True, but the valio fields stay in the
+    # class, a copy storing its values in a hidden slot replacing a field
+    # storing them in the instance __dict__.
+    cls_dict = dict(cls.__dict__)
+    inherited = {slot for base in cls.__mro__[1:] for slot in getattr(base, "__slots__", ())}
+    slots = []
+    for name, field in cls.__dataclass_fields__.items():
+        if getattr(field, "_field_type", None) is not dataclasses._FIELD:
+            continue
+        prop = _property_of(cls, name)
+        if prop is None:
+            cls_dict.pop(name, None)
+            slots.append(name)
+            continue
+        if prop.storage is None:
+            prop = copy.copy(prop)
+            prop.errors = []
+            prop.storage = storages.SlotStorage()
+            cls_dict[name] = prop
+        if isinstance(prop.storage, storages.SlotStorage):
+            slots.append(storages.slot_name(prop.name or name))
+        elif isinstance(prop.storage, storages.RecordStorage):
+            slots.append(prop.storage.row_attribute)
+        # marks of the values validated, filled on reassignment
+        slots.append(descriptors.VALIDATED)
+
+    cls_dict["__slots__"] = tuple(dict.fromkeys(slot for slot in slots if slot not in inherited))
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    slotted.__doc__ = cls.__doc__  # the fields documented themselves again
+    return slotted
+
+
+def _make_model(cls, dataclass_kwargs, slots=False, fail_fast=False):
+    if not dataclasses.is_dataclass(cls) or "__dataclass_fields__" not in cls.__dict__:
+        cls = dataclasses.dataclass(cls, **dataclass_kwargs)
+    if slots and "__slots__" not in cls.__dict__:
+        cls = _add_slots(cls)
+    if not cls.__dataclass_params__.init:
+        return cls
+
+    namespace = {"_ValidationError": errors.ValidationError, "_add_error": _add_error}
+    plan = _constraints.constraint_plan(cls, [field.name for field in dataclasses.fields(cls)])
+    if plan is not None:
+        frozen = cls.__dataclass_params__.frozen
+        namespace["_constraints"] = plan
+        setattr(cls, _CONSTRAINTS, plan)
+        # the setter of a constrained parent model is its wrapper, not the
+        # setter to run constraints with
+        namespace["_setattr"] = object.__setattr__ if frozen \
+            else getattr(cls.__setattr__, "__wrapped__", cls.__setattr__)
+    source = _init_source(cls, namespace, fail_fast, constrained=plan is not None)
+    exec(source, namespace)
+    __init__ = namespace["__init__"]
+    __init__.__qualname__ = f"{cls.__qualname__}.__init__"
+    __init__.__module__ = cls.__module__
+    cls.__init__ = __init__
+    if plan is not None and not cls.__dataclass_params__.frozen:
+        cls.__setattr__ = _constrained_setattr(cls, plan, namespace["_setattr"])
+    setattr(cls, _MODEL, True)
+    return cls
+
+
+_NOT_SET = object()
+
+
+def _stored(instance, name, prop):
+    # the value as stored: reading a Property through __get__ would resolve
+    # (validate) a lazy pending value, which is then taken as changed
+    if prop is None:
+        return getattr(instance, name, _NOT_SET)
+    storage = prop.storage if prop.storage is not None else validators._dict_storage
+    stored = storage.get(instance, prop.name, _NOT_SET)
+    return _NOT_SET if type(stored) is validators._Pending else stored
+
+
+def _constrained_setattr(cls, plan, setattr_):
+    by_field = plan.by_field
+    props = {name: _property_of(cls, name) for name in by_field}
+
+    def __setattr__(self, name, value):
+        constraints = by_field.get(name)
+        if constraints is None:
+            return setattr_(self, name, value)
+        prop = props[name]
+        previous = _stored(self, name, prop)
+        setattr_(self, name, value)
+        # the constraints reading an unchanged value would pass again
+        if previous is _NOT_SET or not descriptors.same_value(previous, _stored(self, name, prop)):
+            plan.run(self, constraints, setattr_)
+
+    __setattr__.__qualname__ = f"{cls.__qualname__}.__setattr__"
+    __setattr__.__module__ = cls.__module__
+    __setattr__.__wrapped__ = setattr_
+    return __setattr__
+
+
+def model(cls=None, *, slots=False, fail_fast=False, **dataclass_kwargs):
+    """Class decorator building a dataclass whose ``__init__`` validates all
+    its valio fields in one pass, ``slots=True`` builds it with
+    ``__slots__`` instead of a ``__dict__`` and ``fail_fast=True`` raises on
+    the first invalid field instead of collecting all of them, extra keyword
+    arguments go to :func:`dataclasses.dataclass`.
+
+    Usage:
+
+    >>> from valio import IntegerValidator, StringValidator
+    >>> @model
+    ... class Account(object):
+    ...     name: str = StringValidator(logger=False, debug=True, min_length=3)
+    ...     age: int = IntegerValidator(logger=False, debug=True, min_value=18)
+    ...
+    >>> Account(name="Ajay", age=30)
+    Account(name='Ajay', age=30)
+    >>> Account(name="A", age=3)  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    ...
+    valio.error.errors.ValidationError: name: ...; age: ...
+
+    Fields logging their activity or validated lazily keep going through
+    their own ``__set__``. The :func:`~valio.model.constraints.constraint`
+    methods of the class run once every field is set, and again on
+    assignment for those reading the assigned field.
+    """
+    if cls is None:
+        return lambda klass: _make_model(klass, dataclass_kwargs, slots, fail_fast)
+    return _make_model(cls, dataclass_kwargs, slots, fail_fast)
+
+
+def is_model(cls) -> bool:
+    return bool(cls.__dict__.get(_MODEL, False)) if isinstance(cls, type) \
+        else is_model(type(cls))
+
+
+def _annotation_of(cls, field, hints) -> typing.Any:
+    # the annotation checked by the valio field, the dataclass one otherwise
+    attribute = inspect.getattr_static(cls, field.name, None)
+    if isinstance(attribute, _fields.FieldMixin):
+        attribute = attribute.validator
+    annotation = getattr(attribute, "annotation", None) if isinstance(attribute, descriptors.Property) else None
+    return hints.get(field.name, field.type) if annotation is None else annotation
+
+
+def _nested_model(annotation) -> typing.Tuple[typing.Optional[type], bool]:
+    """the dataclass a field holds, and whether it holds a list of them"""
+    for member in validators._union_members(annotation):
+        if isinstance(member, type) and dataclasses.is_dataclass(member):
+            return member, False
+        args = typing.get_args(member)
+        if typing.get_origin(member) in _SEQUENCES and args and args[1:] in ((), (Ellipsis,)):
+            if isinstance(args[0], type) and dataclasses.is_dataclass(args[0]):
+                return args[0], True
+    return None, False
+
+
+def _nested_plan(cls) -> typing.Tuple[typing.Tuple[str, int, type, bool], ...]:
+    """``(name, position, model, many)`` of the fields of ``cls`` holding
+    dataclasses, cached on the class"""
+    plan = cls.__dict__.get(_NESTED_PLAN)
+    if plan is None:
+        try:
+            hints = typing.get_type_hints(cls, localns={cls.__name__: cls})
+        except (NameError, TypeError):  # unresolvable forward references
+            hints = {}
+        found, position = [], 0
+        for field in dataclasses.fields(cls):
+            if not field.init:
+                continue
+            nested, many = _nested_model(_annotation_of(cls, field, hints))
+            if nested is not None:
+                found.append((field.name, position, nested, many))
+            position += 1
+        plan = tuple(found)
+        setattr(cls, _NESTED_PLAN, plan)
+    return plan
+
+
+def _nested_errors(prefix, error) -> typing.List[typing.Tuple[str, Exception]]:
+    if error.errors:
+        return [(f"{prefix}.{name}", inner) for name, inner in error.errors]
+    return [(prefix, error)]
+
+
+def _is_raw(value) -> bool:
+    return isinstance(value, (collections.abc.Mapping, list, tuple))
+
+
+def _build(cls, data, depth, max_depth, building):
+    if depth > max_depth:
+        raise errors.ValidationError(f"{cls.__name__} is nested deeper than {max_depth} levels")
+    if id(data) in building:
+        raise errors.ValidationError(f"{cls.__name__} data contains itself")
+    building = building | {id(data)}
+
+    if isinstance(data, collections.abc.Mapping):
+        args, kwargs = [], dict(data)
+    else:
+        args, kwargs = list(data), {}
+
+    found = []
+    for name, position, nested, many in _nested_plan(cls):
+        if name in kwargs:
+            values, key = kwargs, name
+        elif position < len(args):
+            values, key = args, position
+        else:
+            continue
+        value = values[key]
+        try:
+            if many and isinstance(value, (list, tuple)):
+                built = []
+                for index, item in enumerate(value):
+                    try:
+                        built.append(
+                            _build(nested, item, depth + 1, max_depth, building) if _is_raw(item) else item
+                        )
+                    except errors.ValidationError as error:
+                        found.extend(_nested_errors(f"{name}.{index}", error))
+                values[key] = type(value)(built)
+            elif _is_raw(value):
+                values[key] = _build(nested, value, depth + 1, max_depth, building)
+        except errors.ValidationError as error:
+            found.extend(_nested_errors(name, error))
+
+    if found:
+        raise errors.ValidationError(errors=found)
+    return cls(*args, **kwargs)
+
+
+def build(cls: type, data: typing.Union[typing.Mapping, typing.Sequence], *, max_depth: int = MAX_DEPTH):
+    """Build the dataclass ``cls`` out of ``data``, a mapping of keyword
+    arguments or a sequence of positional ones. Fields annotated with
+    another dataclass (or a list of them) are built out of their own
+    mappings and sequences first, in one pass over the payload: a nested
+    model is validated once by its ``__init__``, its type only being checked
+    by the field holding it.
+
+    Errors of nested models are raised together as one
+    :class:`~valio.error.errors.ValidationError`, named ``outer.inner``
+    (``outer.index.inner`` in lists), before the outer model is built; data
+    nested deeper than ``max_depth`` levels or containing itself is
+    rejected.
+
+    >>> from valio import StringValidator, Validator
+    >>> @model
+    ... class Owner(object):
+    ...     name: str = StringValidator(logger=False, debug=True, min_length=3)
+    ...
+    >>> @model
+    ... class Pet(object):
+    ...     name: str = StringValidator(logger=False, debug=True)
+    ...     owner: Owner = Validator(logger=False, debug=True)
+    ...
+    >>> build(Pet, {"name": "Rex", "owner": {"name": "Ajay"}})
+    Pet(name='Rex', owner=Owner(name='Ajay'))
+    """
+    return _build(cls, data, 0, max_depth, frozenset())
+
+
+def _mapping_plan(cls) -> typing.Tuple[tuple, ...]:
+    """``(name, validator, default, factory, nested)`` of the ``__init__``
+    fields of ``cls``, ``nested`` being the ``(model, many)`` pair of
+    :func:`_nested_model` or ``None``, cached on the class"""
+    plan = cls.__dict__.get(_MAPPING_PLAN)
+    if plan is None:
+        nested = {name: (model_cls, many) for name, _, model_cls, many in _nested_plan(cls)}
+        found = []
+        for field in dataclasses.fields(cls):
+            if not field.init or getattr(field, "_field_type", None) is dataclasses._FIELD_INITVAR:
+                continue
+            attribute = inspect.getattr_static(cls, field.name, None)
+            if isinstance(attribute, _fields.FieldMixin):
+                attribute = attribute.validator
+            validator = attribute if isinstance(attribute, descriptors.Property) else None
+            found.append((field.name, validator, field.default, field.default_factory, nested.get(field.name)))
+        plan = tuple(found)
+        setattr(cls, _MAPPING_PLAN, plan)
+    return plan
+
+
+def _check_field(validator, instance, value, hooks):
+    """the value ``validator`` would set, raising what it would raise"""
+    default = validator.default
+    if default is not None and not value:
+        value = default() if callable(default) else default
+    if hooks:
+        return validator.pre_set(instance, value)
+    if isinstance(validator, validators.Validator):
+        outcome = validator.check(value, instance)
+        if not outcome:
+            raise outcome.to_error()
+    elif isinstance(validator, validators.ValidateProperty):
+        validator.validate(instance, value)
+    return value
+
+
+def _validate_mapping(cls, mapping, hooks, depth, max_depth, building):
+    if depth > max_depth:
+        raise errors.ValidationError(f"{cls.__name__} is nested deeper than {max_depth} levels")
+    if id(mapping) in building:
+        raise errors.ValidationError(f"{cls.__name__} data contains itself")
+    building = building | {id(mapping)}
+
+    plan = _mapping_plan(cls)
+    # custom validators and hooks are keyed by the class of the instance,
+    # they (and the checks reading it, as the region of phone numbers) are
+    # given one that is never initialised
+    instance = object.__new__(cls) if any(
+        validator is not None and isinstance(validator, validators.Validator)
+        and (validator._custom_validators.get(cls.__name__) or hooks
+             or not type(validator)._type_checks_value_only)
+        for _, validator, _, _, _ in plan
+    ) else None
+
+    values, found = {}, []
+    unknown = set(mapping).difference(name for name, _, _, _, _ in plan)
+    for name in sorted(unknown):
+        found.append((name, TypeError(f"{cls.__name__} got an unexpected field {name!r}")))
+
+    for name, validator, default, factory, nested in plan:
+        if name in mapping:
+            value = mapping[name]
+        elif default is not dataclasses.MISSING:
+            value = default
+        elif factory is not dataclasses.MISSING:
+            value = factory()
+        else:
+            found.append((name, TypeError(f"{cls.__name__} is missing the field {name!r}")))
+            continue
+
+        if nested is not None and value is not None:
+            model_cls, many = nested
+            try:
+                if many and isinstance(value, (list, tuple)):
+                    checked = []
+                    for index, item in enumerate(value):
+                        try:
+                            checked.append(
+                                _validate_mapping(model_cls, item, hooks, depth + 1, max_depth, building)
+                                if isinstance(item, collections.abc.Mapping) else item
+                            )
+                        except errors.ValidationError as error:
+                            found.extend(_nested_errors(f"{name}.{index}", error))
+                    values[name] = checked
+                    continue
+                if isinstance(value, collections.abc.Mapping):
+                    values[name] = _validate_mapping(model_cls, value, hooks, depth + 1, max_depth, building)
+                    continue
+            except errors.ValidationError as error:
+                found.extend(_nested_errors(name, error))
+                continue
+
+        if validator is None:
+            values[name] = value
+            continue
+        try:
+            values[name] = _check_field(validator, instance, value, hooks)
+        except Exception as error:
+            # an invalid value of a field not debugging is left out, as it
+            # is left unset by __init__
+            if validator.debug:
+                _add_error(found, name, error)
+
+    if found:
+        raise errors.ValidationError(errors=found)
+    if (constraints := cls.__dict__.get(_CONSTRAINTS)) is not None:
+        _check_constraints(constraints, plan, values, instance, hooks)
+    return values
+
+
+def _check_constraints(constraints, plan, values, instance, hooks):
+    """run ``constraints`` over the checked ``values`` as ``__init__`` runs
+    them over the fields, the values they set are checked and put in
+    ``values``"""
+    checks = {name: validator for name, validator, _, _, _ in plan}
+    # a field left out is read as an unset field not debugging is
+    checked = types.SimpleNamespace(**{name: values.get(name) for name in checks})
+
+    def set_value(namespace, name, value):
+        if (validator := checks.get(name)) is not None:
+            try:
+                value = _check_field(validator, instance, value, hooks)
+            except Exception:
+                if validator.debug:
+                    raise
+                return
+        setattr(namespace, name, value)
+        values[name] = value
+
+    constraints.run(checked, constraints.ordered, set_value)
+
+
+def validate_mapping(
+        cls: type,
+        mapping: typing.Mapping[str, typing.Any],
+        *,
+        hooks: bool = False,
+        max_depth: int = MAX_DEPTH,
+) -> typing.Dict[str, typing.Any]:
+    """Check ``mapping``, the keyword arguments of the dataclass ``cls``,
+    without building it: defaults are resolved and each value goes through
+    the validation plan of its field (:meth:`Validator.check`), nothing is
+    set, no ``post_set`` processor nor task runs. With ``hooks=True`` the
+    pre and post validators (and their tasks) run too, as on assignment.
+
+    The values ``cls`` would hold are returned, those of nested dataclass
+    fields given as mappings as dicts of their own checked values. The
+    errors of all the debug fields are raised together as one
+    :class:`~valio.error.errors.ValidationError`, named as by :func:`build`;
+    invalid values of the other fields are left out. Once every field is
+    valid the constraints of a model run over the values (given as the
+    attributes of a plain namespace, not an instance), the values they
+    set are checked and returned too.
+
+    >>> from valio import IntegerValidator, StringValidator
+    >>> @model
+    ... class Account(object):
+    ...     name: str = StringValidator(logger=False, debug=True, min_length=3)
+    ...     age: int = IntegerValidator(logger=False, debug=True, min_value=18, default=18)
+    ...
+    >>> validate_mapping(Account, {"name": "Ajay"})
+    {'name': 'Ajay', 'age': 18}
+    >>> validate_mapping(Account, {"name": "A", "age": 3})  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    ...
+    valio.error.errors.ValidationError: name: ...; age: ...
+    """
+    return _validate_mapping(cls, mapping, hooks, 0, max_depth, frozenset())
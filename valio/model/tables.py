@@ -0,0 +1,175 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Columnar containers of validated rows.
+
+A :class:`ValidatedTable` keeps the rows of a valio-annotated dataclass in
+typed columns of a :class:`~valio.descriptor.storages.RecordStorage` instead
+of one object per row. Rows are validated by the very same descriptors on
+append, and read back through lightweight views holding only their row
+number, so code reading ``row.email`` keeps working.
+"""
+
+import copy
+import dataclasses
+import typing
+
+from valio.descriptor import descriptors, storages
+from valio.error import errors
+
+from .models import _property_of, model
+
+__all__ = ["ValidatedTable"]
+
+# column typecodes picked from the field annotations
+_TYPECODES = {int: "q", float: "d", str: storages.STRING_POOL}
+
+ROW = typing.Union[typing.Mapping[str, typing.Any], typing.Sequence, typing.Any]
+
+
+def _row_type(cls, storage) -> type:
+    # a model with the fields of ``cls``, all of them storing their values
+    # in ``storage``; named as ``cls`` so the custom validators registered
+    # for it keep running.
+    namespace = {"__slots__": (storage.row_attribute,), "__annotations__": {}, "__doc__": cls.__doc__}
+    for field in dataclasses.fields(cls):
+        prop = _property_of(cls, field.name)
+        if prop is not None:
+            prop = copy.copy(prop)
+            prop.errors = []
+        else:
+            default = field.default if field.default_factory is dataclasses.MISSING \
+                else field.default_factory
+            prop = descriptors.Property(
+                name=field.name,
+                default=default if default is not dataclasses.MISSING else None,
+                debug=True,
+                logger=False,
+            )
+        prop.storage = storage
+        namespace["__annotations__"][field.name] = field.type
+        namespace[field.name] = prop
+    row_type = model(type(cls.__name__, (object,), namespace), repr=True, eq=True)
+    row_type.__qualname__ = cls.__qualname__
+    row_type.__module__ = cls.__module__
+    return row_type
+
+
+class ValidatedTable(object):
+    """Rows of the valio-annotated dataclass ``cls`` kept in typed columns.
+
+    ``int`` and ``float`` fields are kept in ``array.array`` columns and
+    ``str`` fields in a :class:`~valio.descriptor.storages.StringPool`,
+    ``typecodes`` overriding the picked ones (``None`` for a plain list).
+    ``numpy.asarray(table.column("age"))`` gives the array column without a
+    copy.
+
+    Usage:
+
+    >>> from dataclasses import dataclass
+    >>> from valio import IntegerValidator, StringValidator
+    >>> @dataclass
+    ... class Account(object):
+    ...     name: str = StringValidator(logger=False, debug=True, min_length=3)
+    ...     age: int = IntegerValidator(logger=False, debug=True, min_value=18)
+    ...
+    >>> table = ValidatedTable(Account, [{"name": "Ajay", "age": 30}])
+    >>> table.append(("Vijay", 40))
+    Account(name='Vijay', age=40)
+    >>> [row.name for row in table], table.column("age")
+    (['Ajay', 'Vijay'], array('q', [30, 40]))
+    >>> table.append({"name": "A", "age": 3})  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    ...
+    valio.error.errors.ValidationError: name: ...; age: ...
+    >>> len(table)
+    2
+    """
+
+    def __init__(
+            self,
+            cls: type,
+            rows: typing.Iterable[ROW] = (),
+            typecodes: typing.Optional[typing.Mapping[str, typing.Optional[str]]] = None,
+    ):
+        if not dataclasses.is_dataclass(cls):
+            raise TypeError(f"{type(self).__name__} expects a dataclass, got {cls!r} instead")
+
+        picked = {field.name: _TYPECODES.get(field.type) for field in dataclasses.fields(cls)}
+        picked.update(typecodes or {})
+        self.model = cls
+        self.storage = storages.RecordStorage(
+            typecodes={name: code for name, code in picked.items() if code is not None},
+        )
+        self.row_type = _row_type(cls, self.storage)
+        self.fields: typing.Tuple[str, ...] = tuple(field.name for field in dataclasses.fields(cls))
+        self.extend(rows)
+
+    def _view(self, row: int):
+        view = self.row_type.__new__(self.row_type)
+        setattr(view, self.storage.row_attribute, row)
+        return view
+
+    def _append(self, row: ROW):
+        size = len(self.storage)
+        view = self._view(self.storage.new_row())
+        try:
+            if isinstance(row, typing.Mapping):
+                view.__init__(**row)
+            elif isinstance(row, (tuple, list)):
+                view.__init__(*row)
+            else:
+                view.__init__(**{name: getattr(row, name) for name in self.fields})
+        except BaseException:
+            self.storage.truncate(size)
+            raise
+        return view
+
+    def append(self, row: ROW):
+        """Validate and append a row given as a mapping, a sequence of the
+        field values or an instance of the dataclass, return its view."""
+        return self._append(row)
+
+    def extend(self, rows: typing.Iterable[ROW]):
+        """Validate and append ``rows``, none of them is kept when any of
+        them is invalid; the raised :class:`~valio.error.errors.ValidationError`
+        lists ``(index, error)`` for every invalid row."""
+        size, found = len(self.storage), []
+        for index, row in enumerate(rows):
+            try:
+                self._append(row)
+            except (errors.ValidationError, TypeError, ValueError, AttributeError) as error:
+                found.append((index, error))
+        if found:
+            self.storage.truncate(size)
+            raise errors.ValidationError(
+                "; ".join(f"row {index}: {error}" for index, error in found), errors=found,
+            )
+        return self
+
+    def column(self, name: str) -> typing.MutableSequence:
+        """the column holding the ``name`` values, an ``array.array``,
+        a :class:`~valio.descriptor.storages.StringPool` or a list"""
+        if name not in self.fields:
+            raise KeyError(f"{name!r} is not a field of {self.model.__name__}")
+        return self.storage.column(name)
+
+    def __len__(self):
+        return len(self.storage)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._view(row) for row in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._view(index)
+
+    def __iter__(self):
+        return map(self._view, range(len(self)))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.model.__name__}, rows={len(self)})"
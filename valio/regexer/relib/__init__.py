@@ -9,7 +9,9 @@ from .control_chars import *
 from .dates import *
 from .emails import *
 from .ipaddresses import *
+from .ipnetworks import *
 from .pancard import *
 from .patterns import *
 from .paymentcards import *
+from .scanner import *
 from .special_chars import *
@@ -3,12 +3,15 @@
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 
+import re
 from datetime import datetime
 from re import IGNORECASE
 
 import pyparsing as pp
 from valio.regexer.regexps import (NamedCapturingGroup, NonCapturingGroup,
                                    Pattern, SetOf, WordBoundary)
+from valio.regexer.relib.scanner import (DEFAULT_CHUNK_SIZE, finditer_chunks,
+                                         iter_text_chunks)
 
 __all__ = [
     "months",
@@ -32,7 +35,8 @@ __all__ = [
     "times",
     "eu_date",
     "ind_date",
-    "get_date"
+    "get_date",
+    "get_date_stream"
 ]
 
 #####################################################################################
@@ -255,16 +259,29 @@ optional_words = WordBoundary(space & NonCapturingGroup(Pattern(r"\w", count_min
 dates = date_prefix & optional_words & (eu_date | ind_date) & optional_words & times
 
 
-def get_date(date_str):
-    delimiters = (hyphen | colon | dot | backslash | space | ((space & comma & space) | comma))
-    eu_y_m_d = NamedCapturingGroup("year", years) & delimiters \
-               & NamedCapturingGroup("month", months) & delimiters \
-               & NamedCapturingGroup("day", day_numbers) & delimiters & day_postfix
+delimiters = (hyphen | colon | dot | backslash | space | ((space & comma & space) | comma))
+eu_y_m_d = NamedCapturingGroup("year", years) & delimiters \
+           & NamedCapturingGroup("month", months) & delimiters \
+           & NamedCapturingGroup("day", day_numbers) & delimiters & day_postfix
+
+in_d_m_y = NamedCapturingGroup("day", day_numbers) & delimiters & day_postfix & delimiters \
+           & NamedCapturingGroup("month", months) & delimiters \
+           & NamedCapturingGroup("year", years)
+
 
-    in_d_m_y = NamedCapturingGroup("day", day_numbers) & delimiters & day_postfix & delimiters \
-               & NamedCapturingGroup("month", months) & delimiters \
-               & NamedCapturingGroup("year", years)
+def _to_datetime(txt):
+    try:
+        month = int(txt["month"])
+        return datetime(year=int(txt["year"]), month=month, day=int(txt["day"]))
+    except (Exception,):
+        try:
+            month = _monthsToNum[txt["month"][:3].lower()]
+            return datetime(year=int(txt["year"]), month=month, day=int(txt["day"]))
+        except (Exception,):
+            return None
 
+
+def get_date(date_str):
     grp_list = pp.Regex(dates.pattern, flags=IGNORECASE).scanString(date_str)
 
     if grp_list:  # if grp items is False skip it
@@ -272,37 +289,57 @@ def get_date(date_str):
             dt = {}
             if eu_date.name in text and any([text[eu_date.name]]):
                 for txt, st, en in pp.Regex(eu_y_m_d.pattern, flags=IGNORECASE).scanString(text[eu_date.name]):
-                    d = None
-                    try:
-                        month = int(txt["month"])
-                        d = datetime(year=int(txt["year"]), month=month, day=int(txt["day"]))
-                    except (Exception,):
-                        try:
-                            month = _monthsToNum[txt["month"][:3].lower()]
-                            d = datetime(year=int(txt["year"]), month=month, day=int(txt["day"]))
-                        except (Exception,):
-                            pass
+                    d = _to_datetime(txt)
                     if d is not None:
                         dt.update(dict(datetime=d, **txt))
 
             if ind_date.name in text and any([text[ind_date.name]]):
                 for txt, st, en in pp.Regex(in_d_m_y.pattern, flags=IGNORECASE).scanString(text[ind_date.name]):
-                    d = None
-                    try:
-                        month = int(txt["month"])
-                        d = datetime(year=int(txt["year"]), month=month, day=int(txt["day"]))
-                    except (Exception,):
-                        try:
-                            month = _monthsToNum[txt["month"][:3].lower()]
-                            d = datetime(year=int(txt["year"]), month=month, day=int(txt["day"]))
-                        except (Exception,):
-                            pass
+                    d = _to_datetime(txt)
                     if d is not None:
                         dt.update(dict(datetime=d, **txt))
             if any(dt):
                 date_dict = dict(span=[start, end], **text, **dt)
                 yield date_dict
 
+
+# pyparsing's scanString skips leading whitespace before every match attempt,
+# the look-ahead makes a plain re.finditer report the very same matches.
+_skip_white = "(?=[^ \\n\\t\\r])"
+_dates_regex = re.compile(f"{_skip_white}(?:{dates.pattern})", IGNORECASE)
+_eu_y_m_d_regex = re.compile(f"{_skip_white}(?:{eu_y_m_d.pattern})", IGNORECASE)
+_in_d_m_y_regex = re.compile(f"{_skip_white}(?:{in_d_m_y.pattern})", IGNORECASE)
+
+
+def get_date_stream(
+        source,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        overlap: int = 1024,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+):
+    """Streaming :func:`get_date` over a file object, an ``mmap``, bytes or
+    an iterable of text chunks.
+
+    The source is read ``chunk_size`` characters at a time and ``overlap``
+    characters are kept between chunks, so dates split across two chunks are
+    still found. The same dicts as :func:`get_date` are yielded, with spans
+    being absolute offsets in the decoded text.
+    """
+    chunks = iter_text_chunks(source, chunk_size=chunk_size, encoding=encoding, errors=errors)
+    for offset, match in finditer_chunks(_dates_regex, chunks, overlap=overlap):
+        text = match.groupdict()
+        dt = {}
+        for name, regex in ((eu_date.name, _eu_y_m_d_regex), (ind_date.name, _in_d_m_y_regex)):
+            if any([text[name]]):
+                for txt in regex.finditer(text[name]):
+                    txt = txt.groupdict()
+                    d = _to_datetime(txt)
+                    if d is not None:
+                        dt.update(dict(datetime=d, **txt))
+        if any(dt):
+            yield dict(span=[offset + match.start(), offset + match.end()], **text, **dt)
+
 # if __name__ == '__main__':
 #     print(ind_date | eu_date )
 #     get_date("2020/feb/29")
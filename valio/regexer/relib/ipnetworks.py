@@ -0,0 +1,183 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Parse free ip address checks and network membership lookups.
+
+Addresses given as ``str`` are checked with ``socket.inet_pton``, the
+version being picked by the presence of ``:``, so no ``ipaddress`` objects
+are built on the hot path. Anything else (ints, packed bytes, scoped IPv6
+addresses) falls back to the ``ipaddress`` module, giving the very same
+results.
+"""
+
+import ipaddress
+import socket
+import typing
+from bisect import bisect_right
+
+__all__ = [
+    "ip_version",
+    "ip_to_int",
+    "is_ipv4_address",
+    "is_ipv6_address",
+    "is_ip_address",
+    "valid_ip_addresses",
+    "NetworkIndex",
+]
+
+_inet_pton = getattr(socket, "inet_pton", None)
+_PTON_ERRORS = (OSError, ValueError, TypeError, UnicodeError)
+
+NETWORK = typing.Union[str, ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def _fast(value) -> bool:
+    # inet_pton does not know about IPv6 scope ids ("fe80::1%eth0")
+    return _inet_pton is not None and isinstance(value, str) and "%" not in value
+
+
+def _pton(family, value) -> typing.Optional[bytes]:
+    try:
+        return _inet_pton(family, value)
+    except _PTON_ERRORS:
+        return None
+
+
+def _parse(address_type, value):
+    try:
+        return address_type(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def ip_to_int(value) -> typing.Optional[typing.Tuple[int, int]]:
+    """Return ``(version, integer)`` for a valid ip address, ``None`` otherwise."""
+    if _fast(value):
+        if ":" in value:
+            packed, version = _pton(socket.AF_INET6, value), 6
+        else:
+            packed, version = _pton(socket.AF_INET, value), 4
+        return (version, int.from_bytes(packed, "big")) if packed is not None else None
+    address = _parse(ipaddress.ip_address, value)
+    return (address.version, int(address)) if address is not None else None
+
+
+def ip_version(value) -> typing.Optional[int]:
+    """Return 4 or 6 for a valid ip address, ``None`` otherwise."""
+    parsed = ip_to_int(value)
+    return parsed[0] if parsed is not None else None
+
+
+def is_ipv4_address(value) -> bool:
+    if _fast(value):
+        return ":" not in value and _pton(socket.AF_INET, value) is not None
+    return _parse(ipaddress.IPv4Address, value) is not None
+
+
+def is_ipv6_address(value) -> bool:
+    if _fast(value):
+        return ":" in value and _pton(socket.AF_INET6, value) is not None
+    return _parse(ipaddress.IPv6Address, value) is not None
+
+
+def is_ip_address(value) -> bool:
+    if _fast(value):
+        if ":" in value:
+            return _pton(socket.AF_INET6, value) is not None
+        return _pton(socket.AF_INET, value) is not None
+    return _parse(ipaddress.IPv4Address, value) is not None \
+        or _parse(ipaddress.IPv6Address, value) is not None
+
+
+_checks = {4: is_ipv4_address, 6: is_ipv6_address, None: is_ip_address}
+
+
+def valid_ip_addresses(values: typing.Iterable, version: typing.Optional[int] = None) -> typing.List[bool]:
+    """Check a whole column of addresses, ``version`` may be 4, 6 or ``None``
+    for any of them.
+
+    >>> valid_ip_addresses(["10.0.0.1", "::1", "10.0.0.256"])
+    [True, True, False]
+    """
+    try:
+        check = _checks[version]
+    except KeyError:
+        raise ValueError(f"expect version to be 4, 6 or None, got {version} instead") from None
+    return list(map(check, values))
+
+
+class NetworkIndex(object):
+    """Sorted interval index over ip networks.
+
+    Every network is turned into an integer ``[first, last]`` address
+    interval, overlapping and adjacent intervals are merged, so membership
+    is a single binary search, O(log n) even for tens of thousands of
+    networks.
+
+    >>> index = NetworkIndex(["10.0.0.0/8", "192.168.1.0/24", "fd00::/8"])
+    >>> "10.20.30.40" in index, "192.168.2.1" in index, "fd12::1" in index
+    (True, False, True)
+    """
+
+    def __init__(self, networks: typing.Iterable[NETWORK] = ()):
+        self.networks: typing.List[NETWORK] = list(networks)
+        self._starts: typing.Dict[int, typing.List[int]] = {}
+        self._ends: typing.Dict[int, typing.List[int]] = {}
+        self.rebuild()
+
+    def add(self, *networks: NETWORK):
+        """Add networks and rebuild the index."""
+        self.networks.extend(networks)
+        return self.rebuild()
+
+    def discard(self, *networks: NETWORK):
+        """Remove networks, when present, and rebuild the index."""
+        discarded = {ipaddress.ip_network(network, strict=False) for network in networks}
+        self.networks = [
+            network for network in self.networks
+            if ipaddress.ip_network(network, strict=False) not in discarded
+        ]
+        return self.rebuild()
+
+    def rebuild(self):
+        """Rebuild the index from ``networks``, to be called after the list
+        is changed in place."""
+        intervals = {4: [], 6: []}
+        for network in self.networks:
+            try:
+                network = ipaddress.ip_network(network, strict=False)
+            except (ValueError, TypeError):
+                raise ValueError(f"{network!r} is not a valid ip network") from None
+            intervals[network.version].append(
+                (int(network.network_address), int(network.broadcast_address))
+            )
+
+        for version, spans in intervals.items():
+            starts, ends = [], []
+            for start, end in sorted(spans):
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            self._starts[version], self._ends[version] = starts, ends
+        return self
+
+    def __contains__(self, address) -> bool:
+        parsed = ip_to_int(address)
+        if parsed is None:
+            return False
+        version, number = parsed
+        position = bisect_right(self._starts[version], number) - 1
+        return position >= 0 and number <= self._ends[version][position]
+
+    def __len__(self):
+        return len(self.networks)
+
+    def __bool__(self):
+        return bool(self.networks)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.networks!r})"
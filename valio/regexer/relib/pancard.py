@@ -38,7 +38,7 @@ from valio.regexer.regexps import Pattern, WordBoundary
 A_Z = list(chr(i) for i in range(65, 65 + 26))
 A_Z_MAP = dict(zip(A_Z, range(1, 26)))
 
-__all__ = ["is_valid_pan_number"]
+__all__ = ["is_valid_pan_number", "pan_pattern"]
 
 decimal_decoder = lambda s: int(s) if s not in A_Z_MAP else A_Z_MAP[s]
 decimal_encoder = lambda i: str(i)
@@ -112,6 +112,8 @@ def verify(string, base=10, decoder=decimal_decoder):
     return luhn_sum_mod_base(string, base=base, decoder=decoder) == 0
 
 
+pan_pattern = WordBoundary(Pattern(r"[A-Z]{3}[ABCFGHLJPTK]{1}[A-Z]{1}[0-9]{4}[A-Z]{1}"))
+
+
 def is_valid_pan_number(par):
-    re_exp = WordBoundary(Pattern(r"[A-Z]{3}[ABCFGHLJPTK]{1}[A-Z]{1}[0-9]{4}[A-Z]{1}"))
-    return any(re.findall(re_exp.pattern, par))
+    return any(re.findall(pan_pattern.pattern, par))
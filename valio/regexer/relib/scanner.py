@@ -0,0 +1,335 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""One pass, multi pattern scanning over text and text streams.
+
+All the patterns handed to a :class:`MultiPatternScanner` are compiled into
+a single alternation of named groups, so the text is walked only once no
+matter how many extractors are run over it. Streams are scanned chunk by
+chunk, keeping an ``overlap`` window between chunks so that matches crossing
+a chunk boundary are still found (and reported only once).
+"""
+
+import codecs
+import re
+import typing
+
+from valio.regexer.regexps import PatternType
+
+__all__ = [
+    "ScanMatch",
+    "MultiPatternScanner",
+    "iter_text_chunks",
+    "finditer_chunks",
+    "relib_scanner",
+]
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_OVERLAP = 4096
+
+_SCOPED_FLAGS = {
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+    re.VERBOSE: "x",
+}
+
+# inner named groups, back references and conditionals are renamed so that
+# several patterns using the same group names can live in one alternation.
+_named_group = re.compile(r"(?<!\\)((?:\\\\)*)\(\?P<([A-Za-z_]\w*)>")
+_named_backref = re.compile(r"(?<!\\)((?:\\\\)*)\(\?P=([A-Za-z_]\w*)\)")
+_named_condition = re.compile(r"(?<!\\)((?:\\\\)*)\(\?\(([A-Za-z_]\w*)\)")
+
+PATTERN = typing.Union[str, PatternType]
+SOURCE = typing.Union[str, bytes, typing.IO, typing.Iterable[typing.Union[str, bytes]]]
+
+
+class ScanMatch(typing.NamedTuple):
+    """A single typed match found by :class:`MultiPatternScanner`.
+
+    ``name`` is the name the pattern was registered with, ``span`` the
+    absolute ``(start, end)`` offsets in the scanned text and ``groups`` the
+    named groups of the pattern itself.
+    """
+
+    name: str
+    span: typing.Tuple[int, int]
+    text: str
+    groups: typing.Dict[str, typing.Optional[str]]
+
+    @property
+    def start(self):
+        return self.span[0]
+
+    @property
+    def end(self):
+        return self.span[1]
+
+
+def _pattern_text(pattern: PATTERN) -> str:
+    while isinstance(pattern, PatternType):
+        pattern = pattern.pattern
+    if isinstance(pattern, bytes):
+        pattern = pattern.decode()
+    if not isinstance(pattern, str):
+        raise TypeError(
+            f"expected {str.__name__} or {PatternType.__name__} type pattern, "
+            f"got {type(pattern).__name__} type instead"
+        )
+    return pattern
+
+
+def _scoped(pattern: str, flags: int) -> str:
+    letters = "".join(letter for flag, letter in _SCOPED_FLAGS.items() if flags & flag)
+    unsupported = flags & ~sum(_SCOPED_FLAGS)
+    if unsupported:
+        raise ValueError(
+            f"only {', '.join(str(flag) for flag in _SCOPED_FLAGS)} can be set per pattern, "
+            f"got {re.RegexFlag(unsupported)!s} instead"
+        )
+    return f"(?{letters}:{pattern})" if letters else f"(?:{pattern})"
+
+
+def iter_text_chunks(
+        source: SOURCE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+) -> typing.Iterator[str]:
+    """Yield ``source`` as text chunks of about ``chunk_size`` characters.
+
+    ``source`` may be a ``str``, ``bytes``, a text or binary file object, a
+    ``mmap.mmap`` or any iterable of ``str``/``bytes`` chunks. Bytes are
+    decoded incrementally so multi-byte characters split across two chunks
+    are decoded correctly.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"expect chunk_size to be greater than 0, got {chunk_size} instead")
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+
+    def decode(chunk, final=False):
+        return decoder.decode(chunk, final) if not isinstance(chunk, str) else chunk
+
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+        return
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            text = decode(bytes(view[start:start + chunk_size]))
+            if text:
+                yield text
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            text = decode(chunk)
+            if text:
+                yield text
+    else:
+        for chunk in source:
+            text = decode(chunk)
+            if text:
+                yield text
+
+    tail = decoder.decode(b"", True)
+    if tail:
+        yield tail
+
+
+def finditer_chunks(
+        regex: typing.Pattern,
+        chunks: typing.Iterable[str],
+        overlap: int = DEFAULT_OVERLAP,
+) -> typing.Iterator[typing.Tuple[int, typing.Match]]:
+    """Run ``regex.finditer`` over a stream of text chunks.
+
+    Yields ``(offset, match)`` pairs where ``offset`` is the absolute position
+    of the buffer the match was found in, so ``offset + match.start()`` is the
+    absolute start of the match. Matches no longer than ``overlap`` characters
+    are found exactly as a single ``finditer`` over the joined text would find
+    them; ``overlap`` characters of context are also kept ahead of every
+    buffer for look-behinds and word boundaries.
+    """
+    if overlap < 0:
+        raise ValueError(f"expect overlap to be equal to or greater than 0, got {overlap} instead")
+
+    buffer = ""
+    offset = 0  # absolute position of buffer[0]
+    resume = 0  # position in buffer where the next search starts
+    chunks = iter(chunks)
+    final = False
+
+    while not final:
+        chunk = next(chunks, None)
+        if chunk is None:
+            final = True
+        else:
+            buffer += chunk
+            if len(buffer) - resume <= overlap:
+                continue
+
+        limit = len(buffer) if final else len(buffer) - overlap
+        for match in regex.finditer(buffer, resume):
+            # a match starting inside the overlap window may still grow with
+            # the next chunk, it is searched again on the next buffer.
+            if not final and match.start() >= limit:
+                break
+            yield offset, match
+            resume = match.end() if match.end() > match.start() else match.end() + 1
+
+        if not final:
+            resume = max(resume, limit)
+            context = max(resume - overlap, 0)
+            buffer = buffer[context:]
+            offset += context
+            resume -= context
+
+
+class MultiPatternScanner(object):
+    """Scan text for several named patterns in a single pass.
+
+    Usage:
+
+    >>> from valio.regexer.relib.emails import email_pattern
+    >>> scanner = MultiPatternScanner(
+    ...     {"email": email_pattern, "pin": r"\\b\\d{6}\\b"},
+    ...     validators={"pin": lambda pin: not pin.startswith("0")},
+    ... )
+    >>> [(m.name, m.text) for m in scanner.scan("a@b.com 560001")]
+    [('email', 'a@b.com'), ('pin', '560001')]
+
+    :param patterns: mapping of match name to a regex string or PatternType,
+        earlier patterns win when two of them match at the same position.
+    :param flags: flags applied to every pattern.
+    :param pattern_flags: per pattern flags, only IGNORECASE, MULTILINE,
+        DOTALL and VERBOSE can be scoped to a single pattern.
+    :param validators: per pattern callables, a match is only yielded when
+        its validator returns a truthy value for the matched text.
+    :param overlap: the longest expected match, used as the overlap window
+        between chunks when scanning streams.
+    """
+
+    def __init__(
+            self,
+            patterns: typing.Mapping[str, PATTERN],
+            flags: int = 0,
+            pattern_flags: typing.Mapping[str, int] = None,
+            validators: typing.Mapping[str, typing.Callable[[str], typing.Any]] = None,
+            overlap: int = DEFAULT_OVERLAP,
+    ):
+        if not patterns:
+            raise ValueError(f"{type(self).__name__} expects at least one pattern")
+
+        pattern_flags = dict(pattern_flags or {})
+        self.validators = dict(validators or {})
+        unknown = (set(pattern_flags) | set(self.validators)) - set(patterns)
+        if unknown:
+            raise KeyError(f"{sorted(unknown)} are not scanned pattern names")
+
+        self.names = tuple(patterns)
+        self.overlap = overlap
+        self._inner_groups: typing.Dict[str, typing.Tuple[typing.Tuple[str, str], ...]] = {}
+
+        alternation = []
+        for name in self.names:
+            if not name.isidentifier() or "__" in name:
+                raise ValueError(f"pattern name {name!r} must be an identifier without '__'")
+            text = _pattern_text(patterns[name])
+            prefix = f"{name}__"
+            inner = tuple(
+                (f"{prefix}{group}", group)
+                for group in dict.fromkeys(m.group(2) for m in _named_group.finditer(text))
+            )
+            text = _named_group.sub(lambda m: f"{m.group(1)}(?P<{prefix}{m.group(2)}>", text)
+            text = _named_backref.sub(lambda m: f"{m.group(1)}(?P={prefix}{m.group(2)})", text)
+            text = _named_condition.sub(lambda m: f"{m.group(1)}(?({prefix}{m.group(2)})", text)
+            self._inner_groups[name] = inner
+            alternation.append(f"(?P<{name}>{_scoped(text, pattern_flags.get(name, 0))})")
+
+        self.pattern = "|".join(alternation)
+        self.regex = re.compile(self.pattern, flags)
+
+    def _to_match(self, offset, match):
+        name = match.lastgroup
+        text = match.group(name)
+        validator = self.validators.get(name)
+        if validator is not None and not validator(text):
+            return None
+        start, end = match.span(name)
+        return ScanMatch(
+            name=name,
+            span=(offset + start, offset + end),
+            text=text,
+            groups={group: match.group(full) for full, group in self._inner_groups[name]},
+        )
+
+    def scan(self, text: str) -> typing.Iterator[ScanMatch]:
+        """Yield every match found in ``text``, in order of position."""
+        for match in self.regex.finditer(text):
+            scanned = self._to_match(0, match)
+            if scanned is not None:
+                yield scanned
+
+    def scan_stream(
+            self,
+            source: SOURCE,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            encoding: str = "utf-8",
+            errors: str = "strict",
+    ) -> typing.Iterator[ScanMatch]:
+        """Yield every match found in a file, mmap, bytes or iterable of
+        chunks without loading the whole text in memory, see
+        :func:`iter_text_chunks` for the accepted sources."""
+        chunks = iter_text_chunks(source, chunk_size=chunk_size, encoding=encoding, errors=errors)
+        for offset, match in finditer_chunks(self.regex, chunks, overlap=self.overlap):
+            scanned = self._to_match(offset, match)
+            if scanned is not None:
+                yield scanned
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(self.names)})"
+
+
+def relib_scanner(*names: str, **kwargs) -> MultiPatternScanner:
+    """Build a scanner out of the relib extractors: ``email``, ``date``,
+    ``uri``, ``payment_card`` and ``pan_card``. All of them are used when no
+    ``names`` are given, extra ``kwargs`` go to :class:`MultiPatternScanner`.
+    """
+    from valio.regexer.relib import ipaddresses
+    from valio.regexer.relib.dates import eu_date, ind_date
+    from valio.regexer.relib.emails import email_pattern
+    from valio.regexer.relib.pancard import pan_pattern
+    from valio.regexer.relib.paymentcards import luhn_correctness
+
+    # the relib URI pattern is anchored to the whole string, text scanning
+    # only picks up URIs carrying an authority (scheme://...).
+    uri = (
+        fr"{ipaddresses.scheme.pattern} : // {ipaddresses.authority.pattern} "
+        fr"{ipaddresses.path_abempty.pattern} (?: \? {ipaddresses.query.pattern} )? "
+        fr"(?: \# {ipaddresses.fragment.pattern} )?"
+    )
+    extractors = {
+        "email": (email_pattern, 0, None),
+        "date": (eu_date | ind_date, re.IGNORECASE, None),
+        "uri": (uri, re.VERBOSE, None),
+        "payment_card": (r"\b\d{13,19}\b", 0, luhn_correctness),
+        "pan_card": (pan_pattern, 0, None),
+    }
+    unknown = set(names) - set(extractors)
+    if unknown:
+        raise KeyError(f"{sorted(unknown)} are not relib extractors, expected any of {list(extractors)}")
+
+    selected = names or tuple(extractors)
+    return MultiPatternScanner(
+        patterns={name: extractors[name][0] for name in selected},
+        pattern_flags={name: extractors[name][1] for name in selected},
+        validators={name: extractors[name][2] for name in selected if extractors[name][2] is not None},
+        **kwargs,
+    )
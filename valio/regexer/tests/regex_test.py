@@ -5,9 +5,13 @@
 
 
 
+import io
+
 import pytest
 from valio.regexer import regexps, relib
 from valio.regexer.relib import patterns
+from valio.regexer.relib.dates import get_date, get_date_stream
+from valio.regexer.relib.paymentcards import luhn_correctness
 
 
 def assert_pattern_has(
@@ -173,6 +177,39 @@ def test_preceded_by():
     ), fr"{pattern_b} != (?(special_chars_set)[\w]??|[a-zA-Z])"
 
 
+def test_multi_pattern_scanner():
+    scanner = relib.MultiPatternScanner(
+        {
+            "email": relib.email_pattern,
+            "pan": relib.pan_pattern,
+            "card": regexps.WordBoundary(regexps.Pattern(r"\d", count_min=13, count_max=19)),
+        },
+        validators={"card": luhn_correctness},
+        overlap=64,
+    )
+    text = "write to a.b@x.com, pan ABCPE1234F, cards 4111111111111111 4111111111111112. " * 5
+    matches = [(m.name, m.span, m.text) for m in scanner.scan(text)]
+    assert [name for name, _, _ in matches[:3]] == ["email", "pan", "card"]
+    assert len(matches) == 15
+    assert all(text[start:end] == found for _, (start, end), found in matches)
+
+    # matches crossing chunk boundaries are found once, with absolute spans
+    for chunk_size in (1, 7, 33, 1024):
+        streamed = scanner.scan_stream(io.StringIO(text), chunk_size=chunk_size)
+        assert [(m.name, m.span, m.text) for m in streamed] == matches
+        streamed = scanner.scan_stream(io.BytesIO(text.encode()), chunk_size=chunk_size)
+        assert [(m.name, m.span, m.text) for m in streamed] == matches
+
+
+def test_get_date_stream():
+    text = "my date: 2022-10-15 and dated 15th March, 2021, joined on 01 Feb 2010. " * 3
+    dates = [dict(found) for found in get_date(text)]
+    assert len(dates) == 3
+    for chunk_size in (1, 11, 4096):
+        assert list(get_date_stream(io.StringIO(text), chunk_size=chunk_size)) == dates
+    assert list(get_date_stream(io.BytesIO(text.encode()), chunk_size=5)) == dates
+
+
 def main_test():
     test_pattern()
     test_set_of()
@@ -7,3 +7,5 @@
 
 # from .schemas import *
 from .schemas_v2 import *
+from .parsers import *
+from .plans import *
@@ -0,0 +1,163 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Extraction of validated schema values out of free text.
+
+Every schema builds a ``regex`` from ``REGEX_MAP`` (word or digit groups
+sized by ``min_length``/``max_length``, narrowed by ``pattern``). A scalar
+schema finds its values with it, a schema made of schema fields puts the
+regexes of its fields together, one named group per field in declaration
+order (a nested schema inlining its own), joined by a separator. The composed
+regex is compiled once per class and separator, the groups of every match are
+converted to the annotation of their field and validated by it.
+"""
+
+import decimal
+import re
+import typing
+
+from valio.error import errors
+from valio.regexer import regexps
+
+from .plans import CompiledSchema, schema_plan
+
+__all__ = ["ParserMixin"]
+
+_PARSERS = "__valio_schema_parsers__"
+
+# named groups of the field regexes, left anonymous once put together
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+_CONVERTERS = {int: int, float: float, decimal.Decimal: decimal.Decimal}
+
+SEPARATOR = r"\s+"
+
+
+def _builder(annotation):
+    # schemas of a class build instances of it, the others dicts
+    if isinstance(annotation, type) and annotation.__module__ != "builtins":
+        return lambda values: annotation(**values)
+    return dict
+
+
+def _compose(groups, separator, prefix=""):
+    """the pattern of ``(name, field)`` groups and the steps extracting
+    them: ``(name, group, convert, check)`` for a field, ``(name, steps,
+    build)`` for a nested schema, whose groups are prefixed by its name"""
+    parts, steps = [], []
+    for name, field in groups:
+        group = f"{prefix}{name}"
+        plan = schema_plan(type(field))
+        if plan.fields:
+            pattern, nested_steps = _compose(plan.fields, separator, f"{group}__")
+            parts.append(f"(?:{pattern})")
+            steps.append((name, nested_steps, _builder(field.annotation)))
+            continue
+        if not isinstance(field.regex, regexps.PatternType):
+            raise TypeError(f"{name} has no regex to parse with, "
+                            f"{type(field).__name__} is not a word or digit schema")
+        parts.append(f"(?P<{group}>{_NAMED_GROUP.sub('(?:', str(field.regex))})")
+        steps.append((name, group, _CONVERTERS.get(getattr(field, "annotation", None)), field._check_value))
+    return separator.join(parts), tuple(steps)
+
+
+def _extract(match, steps, found, prefix=""):
+    values = {}
+    for step in steps:
+        if len(step) == 3:
+            name, nested_steps, build = step
+            nested_found = []
+            value = _extract(match, nested_steps, nested_found, f"{prefix}{name}.")
+            if nested_found:
+                found.extend(nested_found)
+            else:
+                value = build(value)
+        else:
+            name, group, convert, check = step
+            value = match.group(group)
+            try:
+                if convert is not None and value is not None:
+                    value = convert(value)
+                check(value)
+            except (TypeError, ValueError, ArithmeticError, AttributeError) as error:
+                found.append((f"{prefix}{name}", error))
+        values[name] = value
+    return values
+
+
+class _Parser(object):
+    __slots__ = ("regex", "steps", "build")
+
+    def __init__(self, groups, separator, build=None):
+        pattern, self.steps = _compose(groups, separator)
+        self.regex = re.compile(pattern)
+        self.build = build
+
+    def parse(self, text, skip_invalid) -> typing.Iterator:
+        steps, build = self.steps, self.build
+        for match in self.regex.finditer(text):
+            found = []
+            values = _extract(match, steps, found)
+            if found:
+                if skip_invalid:
+                    continue
+                raise errors.ValidationError(errors=found)
+            yield values["value"] if build is None else build(values)
+
+
+def _plan_parser(cls, annotation, separator) -> _Parser:
+    # the parser of a schema made of fields only depends on its class, the
+    # parsers are kept on it as its plan is
+    parsers = cls.__dict__.get(_PARSERS)
+    if parsers is None:
+        parsers = {}
+        setattr(cls, _PARSERS, parsers)
+    try:
+        return parsers[annotation, separator]
+    except KeyError:
+        parser = parsers[annotation, separator] = _Parser(schema_plan(cls).fields, separator, _builder(annotation))
+        return parser
+
+
+class ParserMixin(CompiledSchema):
+    """``parse`` and ``parse_iter`` for schemas, a schema made of fields
+    (the schemas among its class attributes, see
+    :class:`~valio.schema.plans.SchemaPlan`) sharing its parsers with every
+    instance of its class."""
+
+    _parsers = None
+
+    def _parser(self, separator) -> _Parser:
+        if self.plan.fields:
+            return _plan_parser(type(self), self.annotation, separator)
+        parsers = self.__dict__.get("_parsers")
+        if parsers is None:
+            parsers = self._parsers = {}
+        try:
+            return parsers[separator]
+        except KeyError:
+            parser = parsers[separator] = _Parser((("value", self),), separator)
+            return parser
+
+    def parse(self, text: str, separator: str = SEPARATOR, skip_invalid: bool = False) -> typing.List:
+        """the validated values found in ``text``, instances of the
+        annotation of a schema made of fields (dicts when it is no class)
+        built from the groups of each match. A match with invalid values
+        raises :class:`~valio.error.errors.ValidationError` listing them,
+        or is left out with ``skip_invalid=True``; fields not debugging
+        keep their invalid values, as on assignment."""
+        return list(self._parser(separator).parse(text, skip_invalid))
+
+    def parse_iter(
+            self,
+            stream: typing.Iterable[str],
+            separator: str = SEPARATOR,
+            skip_invalid: bool = False,
+    ) -> typing.Iterator:
+        """:meth:`parse` every text of ``stream`` (the lines of a file...)
+        lazily, matches do not span two texts"""
+        parser = self._parser(separator)
+        for text in stream:
+            yield from parser.parse(text, skip_invalid)
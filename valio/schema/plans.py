@@ -0,0 +1,147 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""The schema compiler shared by ``schemas`` and ``schemas_v2``.
+
+Everything a schema needs that only depends on its class is built once per
+class into an immutable :class:`SchemaPlan`: the schema fields in declaration
+order, their regexes and which of them are schemas made of fields
+themselves. Instances share the plan of their class, they only build what
+their own options change: the word or digit groups of a scalar schema are
+cached by annotation and lengths, a ``pattern`` is the one thing composed
+per instance.
+"""
+
+import abc
+import functools
+import types
+import typing
+
+from valio.error import errors
+from valio.regexer import regexps
+from valio.regexer.relib import patterns
+
+__all__ = ["CompiledSchema", "SchemaPlan", "schema_plan"]
+
+REGEX_MAP = {str: patterns.WordGroups, int: patterns.DigitGroups}
+
+_PLAN = "__valio_schema_plan__"
+
+REGEX = typing.Union[regexps.PatternType, typing.Dict[str, regexps.PatternType]]
+
+
+class SchemaPlan(typing.NamedTuple):
+    """What validating and parsing a schema class is made of."""
+    schema: type
+    # (name, field schema) in declaration order
+    fields: typing.Tuple[typing.Tuple[str, "CompiledSchema"], ...]
+    # the fields that are schemas made of fields themselves
+    nested: typing.FrozenSet[str]
+    # the regexes of the fields that have one
+    regexes: typing.Mapping[str, regexps.PatternType]
+
+    def validate(self, values: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """a loop over the fields checking ``values``, the values of nested
+        fields being mappings too; all the failed checks are raised together
+        as one :class:`~valio.error.errors.ValidationError`, nested field
+        errors named ``outer.inner``"""
+        checked, found = {}, []
+        for name, field in self.fields:
+            value = values.get(name)
+            try:
+                if name in self.nested and value is not None:
+                    value = field.plan.validate(value)
+                else:
+                    field._check_value(value)
+            except errors.ValidationError as error:
+                found.extend((f"{name}.{inner}", inner_error) for inner, inner_error in error.errors)
+            except (TypeError, ValueError, ArithmeticError, AttributeError) as error:
+                found.append((name, error))
+            checked[name] = value
+        if found:
+            raise errors.ValidationError(errors=found)
+        return checked
+
+
+def _build_plan(cls, building) -> SchemaPlan:
+    if cls in building:
+        raise TypeError(f"{cls.__name__} can not be a field of itself")
+    building = building | {cls}
+    found, nested, regexes = [], set(), {}
+    attributes = {}
+    for klass in reversed(cls.__mro__):
+        attributes.update(vars(klass))
+    for name, field in attributes.items():
+        if not isinstance(field, CompiledSchema):
+            continue
+        found.append((name, field))
+        field_plan = schema_plan(type(field), building)
+        if field_plan.fields:
+            nested.add(name)
+        elif isinstance(field.regex, regexps.PatternType):
+            regexes[name] = field.regex
+    return SchemaPlan(cls, tuple(found), frozenset(nested), types.MappingProxyType(regexes))
+
+
+def schema_plan(cls: type, _building: typing.FrozenSet[type] = frozenset()) -> SchemaPlan:
+    """the plan of the schema class ``cls``, built on first use"""
+    plan = cls.__dict__.get(_PLAN)
+    if plan is None:
+        plan = _build_plan(cls, _building)
+        setattr(cls, _PLAN, plan)
+    return plan
+
+
+@functools.lru_cache(maxsize=None)
+def _groups(annotation, min_length, max_length, name) -> regexps.PatternType:
+    # a group is never empty
+    return REGEX_MAP[annotation](count_min=min_length or 1, count_max=max_length, name=name).named_capturing_group
+
+
+def compile_regex(schema, pattern=None, min_length=None, max_length=None, name=None) -> REGEX:
+    """the regex of ``schema``: word or digit groups for a ``str`` or
+    ``int`` one, the regexes of its fields for a schema made of fields,
+    narrowed by ``pattern``"""
+    if pattern is not None and not isinstance(pattern, (str, regexps.PatternType)):
+        raise TypeError(
+            f"expected 'pattern' of {str.__name__} or {regexps.Pattern.__name__} types,"
+            f" got {type(pattern).__name__} type instead"
+        )
+    plan = schema.plan
+    if schema.annotation not in REGEX_MAP:
+        return {
+            key: regex & getattr(pattern, key) if getattr(pattern, key, None) is not None else regex
+            for key, regex in plan.regexes.items()
+        }
+
+    regex = _groups(schema.annotation, min_length, max_length, name or str(schema))
+    if any(getattr(pattern, key, None) is not None for key, _ in plan.fields):
+        raise AttributeError(f"{name or schema} and {pattern} fields did not match")
+    if pattern is None:
+        return regex
+    if not isinstance(pattern, regexps.PatternType):
+        return regexps.IfFollowedBy(regexps.Pattern(pattern)) & regex
+    return regexps.IfFollowedBy(pattern) & regex
+
+
+class CompiledSchema(abc.ABC):
+    """Base of the schemas of both schema modules: ``plan`` is the shared
+    plan of the class, ``validate_values`` a loop over it."""
+
+    annotation = None
+    regex: REGEX = None
+
+    @property
+    def plan(self) -> SchemaPlan:
+        return schema_plan(type(self))
+
+    @abc.abstractmethod
+    def _check_value(self, value):
+        """raise for an invalid ``value`` of this schema as a field"""
+
+    def validate_values(self, values: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """check the field values of a schema made of fields, see
+        :meth:`SchemaPlan.validate`"""
+        return self.plan.validate(values)
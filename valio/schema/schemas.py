@@ -7,14 +7,16 @@
 import abc
 import datetime
 import pathlib
-from dataclasses import dataclass, make_dataclass
+from dataclasses import dataclass
 from typing import Any, Type
 
-from valio.regexer.regexps import IfFollowedBy, Pattern, PatternType
-from valio.regexer.relib import DigitGroups, WordGroups
+from valio.regexer.regexps import Pattern
 from valio.validator import validators
 
-REGEX_MAP = {str: WordGroups, int: DigitGroups}
+from . import plans
+from .parsers import ParserMixin
+
+REGEX_MAP = plans.REGEX_MAP
 
 __all__ = [
     "BytesSchema",
@@ -31,27 +33,68 @@ __all__ = [
 ]
 
 
+def _compile_check(validator, instance):
+    """validate values as assigning them to ``instance`` does, without
+    assigning them: default, pre-validation processing, the validation plan
+    and post-validation processing, errors raised only when debugging."""
+    pre_validation = validator.pre_validation_processing
+    validate = validator.validate
+    post_validation = validator.post_validation_processing
+
+    def check(values):
+        default = validator.default
+        for value in values:
+            if default is not None and not value:
+                value = default() if callable(default) else default
+            try:
+                value = pre_validation(instance, value)
+                validate(instance, value)
+                post_validation(instance, value)
+            except Exception as error:
+                validator.errors.append(error)
+                if validator.debug:
+                    raise
+
+    return check
+
+
 class SchemaValidator(object):
     name = validators.StringValidator(logger=False)
     validator = Type[validators.Validator]
     annotation = Any
+    _check = None
 
     def __set_name__(self, owner, name):
         self.name = name
-        self.validator = make_dataclass(
-            "validator", [(self.name, self.annotation, self.validator(**self.kwargs))]
-        )
+        self._compile()
+
+    def _compile(self):
+        # the field validator is built once, for a class named "validator"
+        # holding it, so its custom validators and logs keep their names;
+        # values are checked against one instance of that class, never set.
+        validator_type = self.validator if isinstance(self.validator, type) else type(self.validator)
+        owner = type("validator", (object,), {"__annotations__": {self.name: self.annotation}})
+        validator = validator_type(**self.kwargs)
+        validator.__set_name__(owner, self.name)
+        self.validator = validator
+        self._check = _compile_check(validator, owner())
 
     def __init__(self, **kwargs):
         self.name = kwargs.pop("name", None) or self.name or type(self).__name__
         self.kwargs = kwargs
 
 
-class SchemaBase(SchemaValidator):
+class SchemaBase(SchemaValidator, ParserMixin):
 
     def _is_valid(self, *args):
-        for v in args:
-            self.validator(v)
+        if not args:
+            return
+        if self._check is None:
+            self._compile()
+        self._check(args)
+
+    def _check_value(self, value):
+        self._is_valid(value)
 
     @property
     def args(self):
@@ -64,73 +107,14 @@ class SchemaBase(SchemaValidator):
 
     def __init__(self, *args, **kwargs):
         self.kwargs = kwargs
-        regex_map = (
-            {self.annotation: REGEX_MAP[self.annotation]}
-            if self.annotation in REGEX_MAP
-            else {
-                self.annotation: {
-                    v: REGEX_MAP[self.__class__.__dict__[v].annotation]
-                    for v in self.__class__.__dict__
-                    if isinstance(self.__class__.__dict__[v], SchemaBase)
-                       and self.__class__.__dict__[v].annotation in REGEX_MAP
-                }
-            }
+        self.regex = plans.compile_regex(
+            self,
+            pattern=self.kwargs.get("pattern", None),
+            min_length=self.kwargs.get("min_length", None),
+            max_length=self.kwargs.get("max_length", None),
+            name=str(self),
         )
 
-        self.regex = (
-            REGEX_MAP[self.annotation](
-                count_min=self.kwargs.get("min_length", None),
-                count_max=self.kwargs.get("max_length", None),
-                name=str(self),
-            ).named_capturing_group
-            if self.annotation in REGEX_MAP
-            else regex_map[self.annotation]
-        )
-        if isinstance(self.regex, dict):
-            self.regex.update({k: getattr(self, k).regex for k in self.regex})
-
-        pattern_field = self.kwargs.get("pattern", None)
-        if pattern_field is not None and not isinstance(
-                pattern_field, (str, PatternType)
-        ):
-            raise TypeError(
-                f"expected 'pattern' of {str.__name__} or {Pattern.__name__} types,"
-                f" got {type(pattern_field).__name__} type instead"
-            )
-        if not isinstance(self.regex, dict):
-            if any(
-                    {
-                        v: getattr(pattern_field, v)
-                        for v in self.__class__.__dict__
-                        if (
-                            isinstance(self.__class__.__dict__[v], SchemaBase)
-                            and getattr(pattern_field, v, None) is not None
-                    )
-                    }
-            ):
-                raise AttributeError(
-                    f"{self.regex.__name__} and {pattern_field.__name__} fields did not match"
-                )
-
-        regex = (
-            (
-                self.regex
-                if pattern_field is None
-                else IfFollowedBy(Pattern(pattern=pattern_field)) & self.regex
-                if not isinstance(pattern_field, PatternType)
-                else IfFollowedBy(pattern=pattern_field) & self.regex
-            )
-            if not isinstance(self.regex, dict)
-            else {
-                k: self.regex[k] & getattr(pattern_field, k)
-                if getattr(pattern_field, k, None) is not None
-                else self.regex[k]
-                for k in self.regex
-            }
-        )
-
-        self.regex = regex
-
         super(SchemaBase, self).__init__(**self.kwargs)
         if hasattr(self, "schema"):
             self._validate = getattr(self, "schema")
@@ -210,7 +194,7 @@ class DateSchema(SchemaBase):
 
 class FileSchema(SchemaBase):
     annotation = pathlib.Path
-    validators = validators.PathValidator
+    validator = validators.PathValidator
 
 
 class EmailSchema(SchemaBase):
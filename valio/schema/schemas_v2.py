@@ -12,13 +12,15 @@ from valio.descriptor import DEBUG, DEFAULT, DOC, NAME
 from valio.field import fields
 from valio.logger import LOG_DIR, LOG_LEVEL, LOGGER
 from valio.regexer import regexps
-from valio.regexer.relib import patterns
 from valio.validator import BOOL, DATE_TIME_DELTA, INT, PATTERN, VALUE
 
-REGEX_MAP = {str: patterns.WordGroups, int: patterns.DigitGroups}
+from . import plans
+from .parsers import ParserMixin
 
+REGEX_MAP = plans.REGEX_MAP
 
-class Schema(fields.Field):
+
+class Schema(fields.Field, ParserMixin):
     """
     """
     annotation = None
@@ -69,62 +71,14 @@ class Schema(fields.Field):
             **kwargs,
         )
 
-        # creating the regex mapping for types
-        regex_map = (
-            {self.annotation: REGEX_MAP[self.annotation]}
-            if self.annotation in REGEX_MAP
-            else {
-                self.annotation: {
-                    v: REGEX_MAP[self.__class__.__dict__[v].validator.annotation]
-                    for v in self.__class__.__dict__
-                    if isinstance(self.__class__.__dict__[v], Schema)
-                       and self.__class__.__dict__[v].validator.annotation in REGEX_MAP
-                }
-            }
-        )
-        self.regex = (
-            REGEX_MAP[self.annotation](
-                count_min=min_length, count_max=max_length, name=name or str(self),
-            ).named_capturing_group
-            if self.annotation in REGEX_MAP
-            else regex_map[self.annotation]
-        )
-        if isinstance(self.regex, dict):
-            self.regex.update({k: getattr(self, k).regex for k in self.regex})
-
-        if not isinstance(self.regex, dict):
-            if any(
-                    {
-                        v: getattr(pattern, v)
-                        for v in self.__class__.__dict__
-                        if (
-                            isinstance(self.__class__.__dict__[v], Schema)
-                            and getattr(pattern, v, None) is not None
-                    )
-                    }
-            ):
-                raise AttributeError(
-                    f"{self.regex.__name__} and {pattern.__name__} fields did not match"
-                )
-
-        _regex = (
-            (
-                self.regex
-                if pattern is None
-                else regexps.IfFollowedBy(regexps.Pattern(pattern)) & self.regex
-                if not isinstance(pattern, regexps.PatternType)
-                else regexps.IfFollowedBy(pattern) & self.regex
-            )
-            if not isinstance(self.regex, dict)
-            else {
-                k: self.regex[k] & getattr(pattern, k)
-                if getattr(pattern, k, None) is not None
-                else self.regex[k]
-                for k in self.regex
-            }
+        self.regex = plans.compile_regex(
+            self, pattern=pattern, min_length=min_length, max_length=max_length, name=name,
         )
 
-        self.regex = _regex
+    def _check_value(self, value):
+        outcome = self.validator.check(value)
+        if not outcome and self.validator.debug:
+            raise outcome.to_error()
 
     def __str__(self):
         return str(type(self).__name__)
@@ -0,0 +1,464 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Validation of CSV and JSON lines streams against valio models.
+
+:func:`validate_stream` reads the rows of a CSV or JSON lines file (or of any
+iterable of rows), maps their columns to the fields of a valio-annotated
+dataclass, or to a :class:`~valio.schema.Schema`, and validates them chunk by
+chunk, so only ``chunk_size * max_pending`` rows are ever held in memory.
+Valid rows and rejected ones, annotated with their errors, go to separate
+sinks. Chunks may be validated by worker processes, the file being read only
+as fast as they keep up.
+"""
+
+import collections
+import concurrent.futures
+import csv
+import dataclasses
+import decimal
+import gzip
+import itertools
+import json
+import os
+import typing
+from abc import ABC, abstractmethod
+
+from valio.error import errors
+from valio.field import fields
+
+__all__ = [
+    "Rejected",
+    "StreamReport",
+    "Sink",
+    "CSVSink",
+    "JSONLinesSink",
+    "read_csv",
+    "read_json",
+    "read_json_lines",
+    "validate_chunks",
+    "validate_stream",
+]
+
+SOURCE = typing.Union[str, os.PathLike, typing.Iterable]
+SINK = typing.Union["Sink", typing.List, typing.Callable[[typing.List], typing.Any], None]
+
+# file formats told by the path suffix
+_FORMATS = {".csv": "csv", ".tsv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "json"}
+
+# errors rejecting a row, anything else stops the stream
+_ROW_ERRORS = (errors.ValidationError, TypeError, ValueError, AttributeError)
+
+_TRUE = frozenset({"true", "t", "yes", "y", "on", "1"})
+_FALSE = frozenset({"false", "f", "no", "n", "off", "0"})
+
+
+class Rejected(typing.NamedTuple):
+    """A row that did not validate: its ``index`` in the stream, the row as
+    read and ``(field, code, message)`` for each of its errors."""
+    index: int
+    row: typing.Any
+    errors: typing.Tuple[typing.Tuple[typing.Optional[str], str, str], ...]
+
+    def record(self) -> typing.Dict[str, typing.Any]:
+        row = self.row
+        if isinstance(row, str):
+            try:
+                row = json.loads(row)
+            except ValueError:
+                pass
+        return {
+            "index": self.index,
+            "row": row,
+            "errors": [{"field": field, "code": code, "message": message}
+                       for field, code, message in self.errors],
+        }
+
+
+class StreamReport(typing.NamedTuple):
+    rows: int
+    valid: int
+    rejected: int
+    chunks: int
+
+
+def _is_path(source) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+def _open(path, mode="r", newline=None):
+    path = os.fspath(path)
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", newline=newline)
+    return open(path, mode, encoding="utf-8", newline=newline)
+
+
+def read_csv(source: SOURCE, **fmtparams) -> typing.Iterator[typing.Dict[str, str]]:
+    """the rows of a CSV file as dicts keyed by its header, ``source`` being
+    a path (``.gz`` ones are decompressed), a text file or lines"""
+    if _is_path(source):
+        with _open(source, newline="") as file:
+            yield from csv.DictReader(file, **fmtparams)
+    else:
+        yield from csv.DictReader(source, **fmtparams)
+
+
+def read_json_lines(source: SOURCE) -> typing.Iterator[str]:
+    """the non blank lines of a JSON lines file, they are decoded along with
+    their validation, by the workers when there are any"""
+    if _is_path(source):
+        with _open(source) as file:
+            yield from (line for line in file if line.strip())
+    else:
+        yield from (line for line in source if line.strip())
+
+
+def read_json(source: SOURCE) -> typing.Iterator[typing.Any]:
+    """the rows of a JSON document holding an array of them, ``source``
+    being a path (``.gz`` ones are decompressed), a text file or lines. The
+    whole document is decoded at once, JSON lines stream."""
+    if _is_path(source):
+        with _open(source) as file:
+            rows = json.load(file)
+    elif hasattr(source, "read"):
+        rows = json.load(source)
+    else:
+        rows = json.loads("".join(source))
+    if not isinstance(rows, list):
+        raise ValueError(f"expect a JSON document holding an array of rows, got {type(rows).__name__} instead")
+    yield from rows
+
+
+def _records(source, format, fmtparams):
+    if format is None and _is_path(source):
+        path = os.fspath(source)
+        suffix = os.path.splitext(path[:-3] if path.endswith(".gz") else path)[1].lower()
+        format = _FORMATS.get(suffix)
+        if format is None:
+            raise ValueError(f"can not tell the format of {path!r}, expect format to be 'csv', 'json' or 'jsonl'")
+        if suffix == ".tsv":
+            fmtparams.setdefault("delimiter", "\t")
+    if format == "csv":
+        return read_csv(source, **fmtparams), format
+    if format == "jsonl":
+        return read_json_lines(source), format
+    if format == "json":
+        return read_json(source), format
+    if format is None:
+        return iter(source), format
+    raise ValueError(f"expect format to be 'csv', 'json', 'jsonl' or None, got {format!r} instead")
+
+
+def _to_bool(value):
+    lowered = value.lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    return value
+
+
+_CONVERTERS = {int: int, float: float, decimal.Decimal: decimal.Decimal, bool: _to_bool}
+
+
+def _converter(annotation):
+    for candidate in (annotation, *typing.get_args(annotation)):
+        try:
+            converter = _CONVERTERS.get(candidate)
+        except TypeError:  # unhashable annotation
+            converter = None
+        if converter is not None:
+            return converter
+    return None
+
+
+def _convert(converter, value):
+    # a text value that does not convert is kept, the validator rejects it
+    if not isinstance(value, str):
+        return value
+    if not value:
+        return None
+    if converter is None:
+        return value
+    try:
+        return converter(value.strip())
+    except (ValueError, ArithmeticError):
+        return value
+
+
+class _Target(object):
+    """What the rows are validated against, built once per stream and sent
+    along with every chunk to the workers."""
+
+    def __init__(self, target, columns=None, convert=False):
+        if isinstance(target, fields.FieldMixin):
+            self.model, self.validator = None, target.validator
+            self.fields = (target.validator.name or "value",)
+            annotations = {self.fields[0]: getattr(target, "annotation", None)}
+        elif isinstance(target, type) and dataclasses.is_dataclass(target):
+            self.model, self.validator = target, None
+            init_fields = [field for field in dataclasses.fields(target) if field.init]
+            self.fields = tuple(field.name for field in init_fields)
+            annotations = {field.name: field.type for field in init_fields}
+        else:
+            raise TypeError(f"expect a valio-annotated dataclass or a Schema, got {target!r} instead")
+        self.columns: typing.Dict[str, str] = dict(columns or {})
+        self.converters = {name: _converter(annotation) for name, annotation in annotations.items()} \
+            if convert else None
+
+    def values(self, record) -> typing.Dict[str, typing.Any]:
+        if isinstance(record, (str, bytes)):
+            record = json.loads(record)
+        if isinstance(record, typing.Mapping):
+            columns = self.columns
+            values = {columns.get(column, column): value for column, value in record.items()}
+            values = {name: values[name] for name in self.fields if name in values}
+        elif isinstance(record, (list, tuple)):
+            values = dict(zip(self.fields, record))
+        else:
+            raise TypeError(f"expect a row to be a mapping, a sequence or a JSON line, "
+                            f"got {type(record).__name__} instead")
+        if self.converters is not None:
+            for name, value in values.items():
+                values[name] = _convert(self.converters[name], value)
+        return values
+
+    def validate(self, values):
+        if self.model is not None:
+            return self.model(**values)
+        value = values.get(self.fields[0])
+        outcome = self.validator.check(value)
+        if not outcome:
+            raise outcome.to_error()
+        return value
+
+
+def _annotations(error) -> typing.Tuple[typing.Tuple[typing.Optional[str], str, str], ...]:
+    if isinstance(error, errors.ValidationError) and error.errors:
+        found = error.errors
+    else:
+        found = [(getattr(error, "field", None), error)]
+    return tuple(
+        (getattr(error, "field", None) or name,
+         error.code if isinstance(error, errors.FieldError) else type(error).__name__,
+         str(error))
+        for name, error in found
+    )
+
+
+def _validate_chunk(target, start, records):
+    valid, rejected = [], []
+    for index, record in enumerate(records, start):
+        try:
+            valid.append(target.validate(target.values(record)))
+        except _ROW_ERRORS as error:
+            rejected.append(Rejected(index, record, _annotations(error)))
+    return valid, rejected
+
+
+def _chunks(records, size):
+    iterator, start = iter(records), 0
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def validate_chunks(
+        source: SOURCE,
+        target,
+        *,
+        format: typing.Optional[str] = None,
+        columns: typing.Optional[typing.Mapping[str, str]] = None,
+        convert: typing.Optional[bool] = None,
+        chunk_size: int = 10000,
+        workers: int = 0,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        max_pending: typing.Optional[int] = None,
+        **fmtparams,
+) -> typing.Iterator[typing.Tuple[typing.List, typing.List[Rejected]]]:
+    """Validate ``source`` and yield ``(valid, rejected)`` for each chunk of
+    ``chunk_size`` rows, in the order of the rows, see :func:`validate_stream`."""
+    if chunk_size <= 0:
+        raise ValueError(f"expect chunk_size to be greater than 0, got {chunk_size} instead")
+    records, format = _records(source, format, dict(fmtparams))
+    compiled = _Target(target, columns, convert if convert is not None else format == "csv")
+
+    own = None
+    if executor is None and workers:
+        executor = own = concurrent.futures.ProcessPoolExecutor(workers)
+    if executor is None:
+        for start, chunk in _chunks(records, chunk_size):
+            yield _validate_chunk(compiled, start, chunk)
+        return
+
+    # at most max_pending chunks are read ahead of the slowest one
+    max_pending = max_pending or 2 * (workers or os.cpu_count() or 1)
+    pending = collections.deque()
+    try:
+        for start, chunk in _chunks(records, chunk_size):
+            pending.append(executor.submit(_validate_chunk, compiled, start, chunk))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own is not None:
+            own.shutdown(wait=True)
+
+
+def _writer(sink: SINK):
+    if sink is None:
+        return None
+    if isinstance(sink, Sink):
+        return sink.write
+    if isinstance(sink, list):
+        return sink.extend
+    if callable(sink):
+        return sink
+    raise TypeError(f"expect a sink to be a Sink, a list or a callable, got {type(sink).__name__} instead")
+
+
+def validate_stream(source: SOURCE, target, valid: SINK = None, rejected: SINK = None, **options) -> StreamReport:
+    """Validate the rows of ``source`` against ``target``, a valio-annotated
+    dataclass (a :func:`~valio.model.model` one validates all its fields in
+    one pass) or a :class:`~valio.schema.Schema`, and send them to the
+    ``valid`` and ``rejected`` sinks: a :class:`Sink`, a list or a callable
+    given the rows one chunk at a time. Valid rows are instances of
+    ``target`` (values for a Schema), rejected ones :class:`Rejected`.
+
+    ``source`` is a ``.csv``, ``.tsv``, ``.json`` (an array of rows) or
+    ``.jsonl`` path (``.gz`` ones are decompressed), or an iterable of mappings, sequences or JSON lines with
+    ``format`` telling which when needed. ``columns`` maps the columns to
+    the fields, columns no field is named after are left out. CSV values are
+    converted to the ``int``, ``float``, ``Decimal`` or ``bool`` annotation
+    of their field, empty ones to ``None``, unless ``convert=False``.
+
+    ``workers`` processes (or the ``executor`` given) validate the chunks,
+    at most ``max_pending`` of them (twice the workers by default) are in
+    flight, the target and the rows being pickled on the way.
+
+    Usage:
+
+    >>> from dataclasses import dataclass
+    >>> from valio import IntegerValidator, StringValidator
+    >>> @dataclass
+    ... class Account(object):
+    ...     name: str = StringValidator(logger=False, debug=True, min_length=3)
+    ...     age: int = IntegerValidator(logger=False, debug=True, min_value=18)
+    ...
+    >>> lines = ["name,age", "Ajay,30", "A,31", "Vijay,x"]
+    >>> valid, rejected = [], []
+    >>> validate_stream(lines, Account, valid, rejected, format="csv", chunk_size=2)
+    StreamReport(rows=3, valid=1, rejected=2, chunks=2)
+    >>> valid
+    [Account(name='Ajay', age=30)]
+    >>> [(row.index, [code for _, code, _ in row.errors]) for row in rejected]
+    [(1, ['min_length']), (2, ['type'])]
+    """
+    write_valid, write_rejected = _writer(valid), _writer(rejected)
+    rows = valid_rows = rejected_rows = chunks = 0
+    for valid_chunk, rejected_chunk in validate_chunks(source, target, **options):
+        chunks += 1
+        valid_rows += len(valid_chunk)
+        rejected_rows += len(rejected_chunk)
+        rows += len(valid_chunk) + len(rejected_chunk)
+        if write_valid is not None and valid_chunk:
+            write_valid(valid_chunk)
+        if write_rejected is not None and rejected_chunk:
+            write_rejected(rejected_chunk)
+    return StreamReport(rows, valid_rows, rejected_rows, chunks)
+
+
+def _record(item) -> typing.Dict[str, typing.Any]:
+    if isinstance(item, Rejected):
+        return item.record()
+    if dataclasses.is_dataclass(item) and not isinstance(item, type):
+        return {field.name: getattr(item, field.name) for field in dataclasses.fields(item)}
+    if isinstance(item, typing.Mapping):
+        return dict(item)
+    return {"value": item}
+
+
+class Sink(ABC):
+    """Destination of the valid or rejected rows of a stream, written one
+    chunk at a time; a file sink opened on a path closes it on ``close()``
+    or when used as a context manager."""
+
+    _newline = None
+
+    def __init__(self, destination):
+        self._owned = _is_path(destination)
+        self.file = _open(destination, "w", newline=self._newline) if self._owned else destination
+        self.written = 0
+
+    def write(self, items: typing.List):
+        for item in items:
+            self.write_record(self.record(item))
+        self.written += len(items)
+
+    def record(self, item) -> typing.Dict[str, typing.Any]:
+        """the record written for a valid or rejected row"""
+        return _record(item)
+
+    @abstractmethod
+    def write_record(self, record: typing.Dict[str, typing.Any]):
+        """write one ``record`` to the destination"""
+
+    def close(self):
+        if self._owned:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class JSONLinesSink(Sink):
+    """rows written as JSON lines, rejected ones as ``{"index", "row",
+    "errors"}`` objects, values JSON does not know written as strings"""
+
+    def write_record(self, record):
+        self.file.write(json.dumps(record, default=str, ensure_ascii=False))
+        self.file.write("\n")
+
+
+class CSVSink(Sink):
+    """rows written as CSV, the header made of ``fieldnames`` or of the
+    columns of the first row; rejected rows keep their columns along with
+    ``_index`` and ``_errors``, a JSON list of their errors."""
+
+    _newline = ""
+
+    def __init__(self, destination, fieldnames: typing.Optional[typing.Sequence[str]] = None, **fmtparams):
+        super(CSVSink, self).__init__(destination)
+        self.fieldnames = list(fieldnames) if fieldnames is not None else None
+        self.fmtparams = fmtparams
+        self._writer = None
+
+    def record(self, item):
+        if not isinstance(item, Rejected):
+            return super(CSVSink, self).record(item)
+        rejected = item.record()
+        row = rejected["row"]
+        record = dict(row) if isinstance(row, typing.Mapping) \
+            else {"_row": row if isinstance(row, str) else json.dumps(row, default=str)}
+        record["_index"] = rejected["index"]
+        record["_errors"] = json.dumps(rejected["errors"], default=str, ensure_ascii=False)
+        return record
+
+    def write_record(self, record):
+        if self._writer is None:
+            if self.fieldnames is None:
+                self.fieldnames = list(record)
+            self._writer = csv.DictWriter(self.file, self.fieldnames, extrasaction="ignore", **self.fmtparams)
+            self._writer.writeheader()
+        self._writer.writerow(record)
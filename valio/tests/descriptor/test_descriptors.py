@@ -10,7 +10,7 @@ import unittest
 from dataclasses import dataclass
 from typing import Union
 
-from valio.descriptor import Property
+from valio.descriptor import Property, RecordStorage, SlotStorage
 
 
 class PropertyClass(Property):
@@ -185,6 +185,45 @@ class TestClassProperty(unittest.TestCase):
         self.assertIsNotNone(self.test_class.prop)
         del self.test_class.prop
         self.assertIsNone(self.test_class.prop)
+
+
+
+class TestPropertyStorage(unittest.TestCase):
+
+    def test_slot_storage(self):
+        class Slotted(object):
+            __slots__ = ("_valio_prop",)
+            prop: str = Property(name="prop", storage=SlotStorage(), debug=True)
+
+        slotted = Slotted()
+        slotted.prop = "Chef"
+        self.assertEqual(slotted.prop, "Chef")
+        self.assertEqual(slotted._valio_prop, "Chef")
+        del slotted.prop
+        self.assertRaises(KeyError, getattr, slotted, "prop")
+
+    def test_record_storage(self):
+        storage = RecordStorage(typecodes={"salary": "q"})
+
+        class Record(object):
+            __slots__ = ("_valio_row",)
+            name: str = Property(name="name", storage=storage)
+            salary: int = Property(name="salary", storage=storage)
+
+        first, second = Record(), Record()
+        first.name, first.salary = "Banker", 10
+        second.salary = 20
+        self.assertEqual((first.name, first.salary, second.salary), ("Banker", 10, 20))
+        self.assertIsNone(second.name)
+        self.assertEqual(list(storage.columns["salary"]), [10, 20])
+
+        storage.release(first)
+        self.assertEqual(len(storage), 1)
+        third = Record()
+        third.salary = 30
+        self.assertEqual(third._valio_row, 0)
+        self.assertIsNone(third.name)
+        self.assertRaises(TypeError, Property, storage={})
         
         
 if __name__ == '__main__':
@@ -0,0 +1,40 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+
+import logging
+import unittest
+
+from valio import LoggingField, StringField, StringValidator, ValidatorSpec
+
+
+class TestField(unittest.TestCase):
+
+    def test_logging_class(self):
+        class Account(object):
+            name = StringField(logger=False, debug=True)
+            email = StringField(logger=logging.getLogger("valio.tests.email"), debug=True)
+
+        name, email = Account.__dict__["name"], Account.__dict__["email"]
+        self.assertNotIsInstance(name, LoggingField)
+        self.assertIsInstance(email, LoggingField)
+        self.assertIsInstance(email, StringField)
+        self.assertEqual(type(email).__name__, "StringField")
+        with self.assertLogs("valio.tests.email", level="INFO") as logs:
+            email.doc = "email"
+        self.assertIn("setting: doc", logs.output[0])
+        name.doc = "name"
+        self.assertEqual((name["doc"], email["doc"]), ("name", "email"))
+
+    def test_from_spec(self):
+        spec = ValidatorSpec(StringValidator, logger=False, debug=True, min_length=3)
+        field = StringField.from_spec(spec, default="Ajay")
+        self.assertIsInstance(field, StringField)
+        self.assertEqual((field.validator.default, field.logger), ("Ajay", False))
+        self.assertFalse(field.validator.check("A"))
+
+
+if __name__ == '__main__':
+    unittest.main()
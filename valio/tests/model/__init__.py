@@ -0,0 +1,7 @@
+# Copyright (c) 2022 Valio
+# 
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+
+
@@ -0,0 +1,226 @@
+# Copyright (c) 2022 Valio
+# 
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+
+import typing
+import unittest
+from dataclasses import field
+
+from valio import (IntegerValidator, IP4AddressValidator, ListValidator,
+                   PhoneNumberValidator, StringValidator, Validator, build,
+                   constraint, is_model, model, validate_mapping)
+from valio.error import ValidationError
+
+
+class TestModel(unittest.TestCase):
+
+    def setUp(self) -> None:
+        @model
+        class Account(object):
+            name: str = StringValidator(logger=False, debug=True, min_length=3)
+            age: int = IntegerValidator(logger=False, debug=True, min_value=18)
+            tags: list = field(default_factory=list)
+        self.Account = Account
+
+    def test_model(self):
+        account = self.Account("Ajay", 30)
+        self.assertEqual(account.name, "Ajay")
+        self.assertEqual(account.age, 30)
+        self.assertEqual(account.tags, [])
+        self.assertIsNot(account.tags, self.Account("Ajay", 30).tags)
+        self.assertTrue(is_model(self.Account))
+        self.assertTrue(is_model(account))
+
+    def test_model_collects_errors(self):
+        with self.assertRaises(ValidationError) as context:
+            self.Account("A", 3)
+        self.assertEqual([name for name, _ in context.exception.errors], ["name", "age"])
+
+    def test_model_logging_field(self):
+        @model
+        class Basket(object):
+            items: typing.List[int] = ListValidator(debug=True, max_length=2)
+
+        self.assertEqual(Basket([1, 2]).items, [1, 2])
+        self.assertRaises(ValidationError, Basket, [1, 2, 3])
+
+    def test_model_slots(self):
+        @model(slots=True)
+        class Account(object):
+            name: str = StringValidator(logger=False, debug=True, min_length=3)
+            age: int = IntegerValidator(logger=False, debug=True, min_value=18)
+            tags: list = field(default_factory=list)
+
+        account = Account("Ajay", 30)
+        self.assertFalse(hasattr(account, "__dict__"))
+        self.assertEqual((account.name, account.age, account.tags), ("Ajay", 30, []))
+        self.assertEqual(account, Account("Ajay", 30))
+        self.assertRaises(ValidationError, Account, "A", 30)
+        with self.assertRaises(ValueError):
+            account.age = 3
+
+    def test_model_error_modes(self):
+        @model
+        class Collected(object):
+            name: str = Validator(logger=False, debug=True, min_length=3, in_choice=["Ajay"],
+                                  collect_errors=True)
+            age: int = IntegerValidator(logger=False, debug=True, min_value=18)
+
+        with self.assertRaises(ValidationError) as context:
+            Collected("A", 3)
+        self.assertEqual(
+            [(field, code) for field, code, _ in context.exception.structured()],
+            [("name", "min_length"), ("name", "in_choice"), ("age", "min_value")],
+        )
+
+        @model(fail_fast=True)
+        class FailFast(object):
+            name: str = StringValidator(logger=False, debug=True, min_length=3)
+            age: int = IntegerValidator(logger=False, debug=True, min_value=18)
+
+        with self.assertRaises(ValidationError) as context:
+            FailFast("A", 3)
+        self.assertEqual(context.exception.structured(), [("name", "min_length", {"min_length": 3, "length": 1})])
+
+    def test_build_nested(self):
+        @model
+        class Pet(object):
+            name: str = StringValidator(logger=False, debug=True)
+            owner: self.Account = Validator(logger=False, debug=True)
+            friends: typing.List[self.Account] = ListValidator(logger=False, debug=True, default=list)
+
+        pet = build(Pet, ("Rex", {"name": "Ajay", "age": 30}, [{"name": "Vijay", "age": 40}]))
+        self.assertEqual(pet, Pet("Rex", self.Account("Ajay", 30), [self.Account("Vijay", 40)]))
+        with self.assertRaises(ValidationError) as context:
+            build(Pet, {"name": "Rex", "owner": {"name": "A", "age": 30}, "friends": [{"name": "Bob", "age": 3}]})
+        self.assertEqual([field for field, _, _ in context.exception.structured()], ["owner.name", "friends.0.age"])
+
+        @model
+        class Node(object):
+            name: str = StringValidator(logger=False, debug=True)
+            child: typing.Optional["Node"] = None
+
+        self.assertEqual(build(Node, {"name": "a", "child": {"name": "b"}}).child, Node("b"))
+        cyclic = {"name": "a"}
+        cyclic["child"] = cyclic
+        self.assertRaises(ValidationError, build, Node, cyclic)
+        self.assertRaises(ValidationError, build, Node, {"name": "a", "child": {"name": "b"}}, max_depth=0)
+
+    def test_validate_mapping(self):
+        @model
+        class Pet(object):
+            name: str = StringValidator(logger=False, debug=True)
+            owner: self.Account = Validator(logger=False, debug=True)
+            age: int = IntegerValidator(logger=False, debug=False, min_value=1, default=1)
+
+        sets = []
+        Pet.__dict__["name"].add_post_set(lambda instance, value: sets.append(value), namespace="Pet")
+        self.assertEqual(validate_mapping(Pet, {"name": "Rex", "owner": {"name": "Ajay", "age": 30}}),
+                         {"name": "Rex", "owner": {"name": "Ajay", "age": 30, "tags": []}, "age": 1})
+        self.assertEqual(validate_mapping(Pet, {"name": "Rex", "owner": None, "age": -1}), {"name": "Rex", "owner": None})
+        self.assertEqual(sets, [])
+        with self.assertRaises(ValidationError) as context:
+            validate_mapping(Pet, {"name": 1, "owner": {"name": "A", "age": 30}, "color": "red"})
+        self.assertEqual([field for field, _, _ in context.exception.structured()], ["color", "name", "owner.name"])
+
+    def test_validate_mapping_type_checks(self):
+        @model
+        class Host(object):
+            ip: str = IP4AddressValidator(logger=False, debug=True)
+            phone: str = PhoneNumberValidator(logger=False, debug=True)
+
+        valid = {"ip": "10.0.0.1", "phone": "9876543210"}
+        self.assertEqual(validate_mapping(Host, valid), valid)
+        Host(**valid)
+        invalid = {"ip": "garbage", "phone": "nope"}
+        with self.assertRaises(ValidationError):
+            Host(**invalid)
+        with self.assertRaises(ValidationError) as context:
+            validate_mapping(Host, invalid)
+        self.assertEqual([name for name, _ in context.exception.errors], ["ip", "phone"])
+
+    def test_constraints(self):
+        calls = []
+
+        @model
+        class Person(object):
+            first: str = StringValidator(logger=False, debug=True)
+            last: str = StringValidator(logger=False, debug=True)
+            full: str = None
+            age: int = IntegerValidator(logger=False, debug=True)
+
+            @constraint("full")
+            def short_name(self, full):
+                calls.append("short_name")
+                if len(full) > 12:
+                    raise ValueError("name is too long")
+
+            @constraint("first", "last", sets=("full",))
+            def full_name(self, first, last):
+                calls.append("full_name")
+                return f"{first} {last}"
+
+            @constraint("age")
+            def adult(self, age):
+                calls.append("adult")
+                if age < 18:
+                    raise ValueError("not an adult")
+
+        person = Person("Ajay", "K", age=30)
+        self.assertEqual(person.full, "Ajay K")
+        self.assertCountEqual(calls, ["full_name", "short_name", "adult"])
+        self.assertLess(calls.index("full_name"), calls.index("short_name"))
+        calls.clear()
+        person.first = "Vijay"
+        self.assertEqual((person.full, calls), ("Vijay K", ["full_name", "short_name"]))
+        calls.clear()
+        person.age = 40
+        self.assertEqual(calls, ["adult"])
+        with self.assertRaises(ValidationError) as context:
+            Person("Ajay", "Kumarswamy", age=3)
+        self.assertCountEqual([name for name, _ in context.exception.errors], ["adult", "short_name"])
+        self.assertEqual(
+            validate_mapping(Person, {"first": "Ajay", "last": "K", "age": 30}),
+            {"first": "Ajay", "last": "K", "full": "Ajay K", "age": 30},
+        )
+        with self.assertRaises(ValidationError) as context:
+            validate_mapping(Person, {"first": "Ajay", "last": "Kumarswamy", "age": 3})
+        self.assertCountEqual([name for name, _ in context.exception.errors], ["adult", "short_name"])
+
+    def test_constraints_subclass(self):
+        calls = []
+
+        @model
+        class Base(object):
+            x: str
+            y: str = StringValidator(logger=False, debug=True)
+
+            @constraint("x", "y")
+            def both(self, x, y):
+                calls.append((x, y))
+
+        @model
+        class Child(Base):
+            pass
+
+        child = Child("a", "b")
+        self.assertEqual(calls, [("a", "b")])
+        calls.clear()
+        child.x = "q"
+        self.assertEqual(calls, [("q", "b")])
+
+    def test_constraints_lazy(self):
+        @model
+        class Lazy(object):
+            a: str = StringValidator(logger=False, debug=True, lazy=True, min_length=3)
+
+            @constraint("a")
+            def checked(self, a):
+                pass
+
+        lazy = Lazy("abcd")
+        with self.assertRaises(ValidationError):
+            lazy.a = "x"
+        self.assertEqual(lazy.a, "abcd")
@@ -0,0 +1,52 @@
+# Copyright (c) 2022 Valio
+# 
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+
+import array
+import unittest
+from dataclasses import dataclass
+
+from valio import (IntegerValidator, StringPool, StringValidator,
+                   ValidatedTable)
+from valio.error import ValidationError
+
+
+@dataclass
+class Account(object):
+    name: str = StringValidator(logger=False, debug=True, min_length=3)
+    age: int = IntegerValidator(logger=False, debug=True, min_value=18)
+    note: str = "-"
+
+
+class TestValidatedTable(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.table = ValidatedTable(Account, [("Ajay", 30), {"name": "Vijay", "age": 40, "note": "vip"}])
+
+    def test_table(self):
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual([row.name for row in self.table], ["Ajay", "Vijay"])
+        self.assertEqual(self.table[-1].note, "vip")
+        self.assertIsInstance(self.table.column("age"), array.array)
+        self.assertIsInstance(self.table.column("name"), StringPool)
+
+        self.table.append(Account("Sujay", 50))
+        self.assertEqual(self.table[2].age, 50)
+        self.table.append(("Vinay", None))
+        self.assertIsNone(self.table[3].age)
+        self.assertIsInstance(self.table.column("age"), array.array)
+
+    def test_table_validation(self):
+        self.assertRaises(ValidationError, self.table.append, ("A", 30))
+        with self.assertRaises(ValidationError) as context:
+            self.table.extend([("Sujay", 50), ("Vinay", 3)])
+        self.assertEqual([index for index, _ in context.exception.errors], [1])
+        self.assertEqual(len(self.table), 2)
+
+        row = self.table[0]
+        row.age = 31
+        self.assertEqual(self.table.column("age")[0], 31)
+        with self.assertRaises(ValueError):
+            row.age = 3
@@ -0,0 +1,120 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+
+import unittest
+from dataclasses import dataclass
+
+from valio import IP4AddressValidator
+from valio.error import FieldTypeError, FieldValueError, ValidationError
+from valio.schema import schemas_v2
+from valio.schema.schemas import CharSchema, IntegerSchema, SchemaMixin
+
+
+class Account(SchemaMixin):
+    name = CharSchema(min_length=3, logger=False, debug=True)
+    age = IntegerSchema(min_value=18, logger=False, debug=True, reassign=False)
+    annotation = str
+
+    def schema(self, *args, **kwargs):
+        pass
+
+
+@dataclass
+class Login(object):
+    user: str
+    age: int
+
+
+class LoginSchema(SchemaMixin):
+    user = CharSchema(min_length=3, max_length=10, logger=False, debug=True)
+    age = IntegerSchema(min_value=18, logger=False, debug=True)
+    annotation = Login
+
+    def schema(self, *args, **kwargs):
+        pass
+
+
+class TestSchemaBase(unittest.TestCase):
+
+    def test_compiled_check(self):
+        self.assertEqual(Account.age(18, 30, 40), (18, 30, 40))
+        self.assertEqual(Account.age.validator.name, "age")
+        with self.assertRaises(FieldValueError):
+            Account.age(20, 3)
+        with self.assertRaises(FieldTypeError):
+            Account.name("Ajay", 30)
+
+    def test_standalone_schema(self):
+        schema = IntegerSchema(5, min_value=3, logger=False, debug=True)
+        self.assertEqual(tuple(schema), (5,))
+        with self.assertRaises(FieldValueError):
+            schema(1)
+
+
+
+class TestSchemaParse(unittest.TestCase):
+
+    def test_parse(self):
+        schema = LoginSchema()
+        self.assertEqual(schema.parse("ajay 30; vijay 40"), [Login("ajay", 30), Login("vijay", 40)])
+        with self.assertRaises(ValidationError) as raised:
+            schema.parse("ajay 3")
+        self.assertEqual(raised.exception.structured()[0][:2], ("age", "min_value"))
+        self.assertEqual(IntegerSchema(min_value=5, logger=False, debug=True).parse("1 22 333", skip_invalid=True),
+                         [22, 333])
+
+    def test_parse_iter(self):
+        class LoginV2(schemas_v2.Schema):
+            user = schemas_v2.CharSchema(min_length=3, logger=False, debug=True)
+            age = schemas_v2.IntegerSchema(min_value=18, logger=False, debug=True)
+
+        lines = ["ajay=30 bob=2", "vijay=44"]
+        self.assertEqual(
+            list(LoginV2(logger=False).parse_iter(lines, separator="=", skip_invalid=True)),
+            [{"user": "ajay", "age": 30}, {"user": "vijay", "age": 44}],
+        )
+
+
+class TestSchemaPlan(unittest.TestCase):
+
+    def test_shared_nested_plan(self):
+        class Age(schemas_v2.Schema):
+            years = schemas_v2.IntegerSchema(min_value=18, logger=False, debug=True)
+
+        class Person(schemas_v2.Schema):
+            user = schemas_v2.CharSchema(min_length=3, logger=False, debug=True)
+            age = Age(logger=False)
+
+        person = Person(logger=False)
+        self.assertIs(person.plan, Person(logger=False).plan)
+        self.assertEqual([name for name, _ in person.plan.fields], ["user", "age"])
+        self.assertEqual(person.parse("ajay 30 vijay 44"),
+                         [{"user": "ajay", "age": {"years": 30}}, {"user": "vijay", "age": {"years": 44}}])
+        with self.assertRaises(ValidationError) as raised:
+            person.validate_values({"user": "aj", "age": {"years": 3}})
+        self.assertEqual([name for name, _ in raised.exception.errors], ["user", "age.years"])
+        self.assertIs(LoginSchema().plan, LoginSchema().plan)
+
+    def test_type_checks(self):
+        class AddressSchema(schemas_v2.Schema):
+            annotation = str
+            validator = IP4AddressValidator
+
+        class Host(schemas_v2.Schema):
+            user = schemas_v2.CharSchema(min_length=3, logger=False, debug=True)
+            ip = AddressSchema(logger=False, debug=True)
+
+        host = Host(logger=False)
+        self.assertEqual(host.validate_values({"user": "ajay", "ip": "10.0.0.1"}), {"user": "ajay", "ip": "10.0.0.1"})
+        with self.assertRaises(ValidationError) as raised:
+            host.validate_values({"user": "ajay", "ip": "garbage"})
+        self.assertEqual([name for name, _ in raised.exception.errors], ["ip"])
+        with self.assertRaises(ValidationError):
+            host.parse("ajay garbage")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+
+import concurrent.futures
+import json
+import os
+import tempfile
+import unittest
+
+from valio import (CSVSink, IntegerValidator, IP4AddressField, JSONLinesSink,
+                   StringValidator, model, validate_chunks, validate_stream)
+
+
+@model
+class Account(object):
+    name: str = StringValidator(logger=False, debug=True, min_length=3)
+    age: int = IntegerValidator(logger=False, debug=True, min_value=18)
+
+
+class TestValidateStream(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def test_csv_stream(self):
+        with open(self.path("accounts.csv"), "w") as file:
+            file.write("full_name,age,city\nAjay,30,Pune\nA,3,Goa\nVijay,,Delhi\n")
+
+        with CSVSink(self.path("valid.csv")) as valid, JSONLinesSink(self.path("rejected.jsonl")) as rejected:
+            report = validate_stream(self.path("accounts.csv"), Account, valid, rejected,
+                                     columns={"full_name": "name"}, chunk_size=2)
+        self.assertEqual(tuple(report), (3, 2, 1, 2))
+        with open(self.path("valid.csv")) as file:
+            self.assertEqual(file.read().splitlines(), ["name,age", "Ajay,30", "Vijay,"])
+        with open(self.path("rejected.jsonl")) as file:
+            rejected = [json.loads(line) for line in file]
+        self.assertEqual(rejected[0]["index"], 1)
+        self.assertEqual(rejected[0]["row"], {"full_name": "A", "age": "3", "city": "Goa"})
+        self.assertEqual([error["code"] for error in rejected[0]["errors"]], ["min_length", "min_value"])
+
+    def test_json_lines_chunks(self):
+        lines = [json.dumps({"name": "Ajay", "age": age}) for age in range(10, 30)] + ["{broken"]
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            chunks = list(validate_chunks(lines, Account, format="jsonl", chunk_size=4,
+                                          executor=executor, max_pending=2))
+        self.assertEqual(len(chunks), 6)
+        valid = [account.age for chunk_valid, _ in chunks for account in chunk_valid]
+        rejected = [row.index for _, chunk_rejected in chunks for row in chunk_rejected]
+        self.assertEqual(valid, list(range(18, 30)))
+        self.assertEqual(rejected, list(range(8)) + [20])
+
+    def test_json_document(self):
+        with open(self.path("accounts.json"), "w") as file:
+            json.dump([{"name": "Ajay", "age": 30}, {"name": "Vijay", "age": 3}], file, indent=2)
+        valid, rejected = [], []
+        self.assertEqual(tuple(validate_stream(self.path("accounts.json"), Account, valid, rejected)), (2, 1, 1, 1))
+        self.assertEqual([account.name for account in valid], ["Ajay"])
+
+    def test_field_target(self):
+        valid, rejected = [], []
+        validate_stream([["10.0.0.1"], ["garbage"]], IP4AddressField(logger=False, debug=True), valid, rejected)
+        self.assertEqual(valid, ["10.0.0.1"])
+        self.assertEqual([row.index for row in rejected], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,13 +4,22 @@
 # https://opensource.org/licenses/MIT
 
 
+import os
+import tempfile
 import typing
 import unittest
 from dataclasses import dataclass
 
 from toml import load
-from valio import (PatternValidator, ReassignValidator, RequiredValidator,
-                   TypeValidator, __version__)
+from valio import (ChoiceValidator, DictionaryValidator, EmailIDValidator,
+                   HexColorValidator, IntegerValidator, IP4AddressValidator,
+                   IPAnyAddressValidator, ListValidator, PANCardValidator,
+                   PatternValidator, PhoneNumberValidator, ReassignValidator,
+                   RequiredValidator, SharedValidationCache, TypePredicate,
+                   TypeValidator, ValidationCache, Validator, ValidatorSpec,
+                   __version__, type_predicate, validate_now)
+from valio.error import (FieldValueError, ItemValidationError, Ok,
+                         ValidationError, Violation)
 from valio.validator.validators import MultipleValidator
 
 
@@ -134,6 +143,16 @@ class TestTypeValidator(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.assertEqual(self.type_class_common_validator(typ=typing.Union[str, int], tp="a").tp, "a")
 
+    def test_type_predicate(self):
+        annotation = typing.Union[int, dict[str, list[int]], TypeValidator, None]
+        predicate = type_predicate(annotation)
+        self.assertIs(predicate, type_predicate(annotation))
+        for value in (1, True, None, {"a": [1]}, {}):
+            self.assertTrue(predicate(value))
+        for value in ("1", 1.0, {"a": ["1"]}, [1]):
+            self.assertFalse(predicate(value))
+        self.assertTrue(TypePredicate(typing.Any)(object()))
+
 
 class TestRequiredValidator(unittest.TestCase):
     
@@ -555,6 +574,332 @@ class TestMultipleValidator(unittest.TestCase):
         self.assertEqual(MultipleEmptyDebugEmpty(value="Abc").value, 'Abc') # no typechecks
         self.assertEqual(MultipleEmptyDebugEmpty(value=1).value, 1)            
 
+
+class TestChoiceValidator(unittest.TestCase):
+
+    def test_choice_validator(self):
+        validator = ChoiceValidator(
+            in_choice=["INR", "USD", "Straße", ["unhashable"]],
+            not_in_choice=["XXX"],
+            case_insensitive=True,
+            normalize_unicode="NFKC",
+            debug=True,
+        )
+
+        @dataclass
+        class Price(object):
+            currency: str = validator
+
+        price = Price(currency="inr")
+        for currency in ("USD", "STRASSE", ["unhashable"]):
+            price.currency = currency
+            self.assertEqual(price.currency, currency)
+        for currency in ("EUR", "xxx", ["other"]):
+            with self.assertRaises(ValueError):
+                price.currency = currency
+
+        validator.add_choices("EUR")
+        price.currency = "eur"
+        validator.discard_choices("INR")
+        with self.assertRaises(ValueError):
+            price.currency = "INR"
+        validator.update_choices(["JPY", "GBP"])
+        self.assertEqual(validator.in_choice, ["JPY", "GBP"])
+        price.currency = "gbp"
+        with self.assertRaises(ValueError):
+            price.currency = "USD"
+
+
+class TestItemValidator(unittest.TestCase):
+
+    def test_item_validator(self):
+        @dataclass
+        class Payload(object):
+            emails: list = ListValidator(item_validator=EmailIDValidator, debug=True)
+            scores: dict = DictionaryValidator(
+                key_validator=str,
+                value_validator=IntegerValidator(min_value=1),
+                max_item_errors=2,
+                debug=True,
+            )
+
+        payload = Payload(emails=["a@b.com", "c@d.com"], scores={"a": 1})
+        with self.assertRaises(ItemValidationError) as error:
+            payload.emails = ["a@b.com", "bad", "worse"]
+        self.assertEqual([index for index, _ in error.exception.errors], [1])
+
+        with self.assertRaises(ItemValidationError) as error:
+            payload.scores = {"a": 0, 1: 2, "c": 0}
+        self.assertEqual([key for key, _ in error.exception.errors], ["a", 1])
+        self.assertIsInstance(error.exception.errors[1][1], TypeError)
+        self.assertEqual(payload.scores, {"a": 1})
+
+        # item validators checking values in their own validate plan
+        hosts = ListValidator(item_validator=IP4AddressValidator, logger=False)
+        self.assertEqual(hosts.check(["10.0.0.1"]), Ok(["10.0.0.1"]))
+        self.assertFalse(hosts.check(["10.0.0.1", "not-an-ip"]))
+
+    def test_validation_plan(self):
+        validator = Validator(logger=False)
+        self.assertEqual(validator._validation_plan(), ())
+        validator.required = True
+        self.assertEqual(
+            [check.__name__ for check in validator._validation_plan()], ["_validate_required"]
+        )
+
+
+class TestLazyValidator(unittest.TestCase):
+
+    def test_lazy_validator(self):
+        calls = []
+        validator = IntegerValidator(lazy=True, min_value=5, debug=True)
+
+        @dataclass
+        class Row(object):
+            value: int = validator
+
+        def double(instance, value):
+            calls.append(value)
+            return value * 2
+
+        validator.add_post_validator(double, namespace="Row")
+
+        row = Row(value=1)
+        self.assertEqual(calls, [])
+        with self.assertRaises(ValueError):
+            row.value
+
+        row = Row(value=10)
+        self.assertEqual(row.value, 20)
+        self.assertEqual(row.value, 20)
+        self.assertEqual(calls, [10])
+
+        row.value = 3
+        with self.assertRaises(ValueError):
+            validate_now(row)
+        self.assertEqual(row.value, 20)
+
+
+class TestIPAddressValidator(unittest.TestCase):
+
+    def test_ip_address_validator(self):
+        @dataclass
+        class Hosts(object):
+            ip4: str = IP4AddressValidator(
+                debug=True, in_networks=["10.0.0.0/8", "192.168.0.0/16"])
+            ip: str = IPAnyAddressValidator(debug=True)
+
+        hosts = Hosts(ip4="10.1.2.3", ip="::1")
+        for address in ("10.0.0.1", "192.168.10.1", "10.255.255.255"):
+            hosts.ip4 = address
+            self.assertEqual(hosts.ip4, address)
+        for address in ("1.2.3.4", "10.0.0.256", "::1", "010.0.0.1"):
+            with self.assertRaises(ValueError):
+                hosts.ip4 = address
+        hosts.ip = "fe80::1%eth0"
+        self.assertEqual(hosts.ip, "fe80::1%eth0")
+        with self.assertRaises(ValueError):
+            hosts.ip = "1::2::3"
+        # the address check is in the plan, nothing is registered for the class
+        self.assertFalse(Hosts.__dict__["ip4"]._custom_validators.get("Hosts"))
+        self.assertEqual(
+            Hosts.__dict__["ip4"].is_valid_many(["10.0.0.1", "11.0.0.1", "x", None]),
+            [True, False, False, True],
+        )
+
+    def test_ip_address_networks(self):
+        validator = IPAnyAddressValidator(
+            debug=True, in_networks=["10.0.0.0/8", "fd00::/8"], not_in_networks=["10.10.0.0/16"])
+
+        @dataclass
+        class Hosts(object):
+            ip: str = validator
+
+        hosts = Hosts(ip="10.0.0.1")
+        hosts.ip = "fd00::1"
+        for address in ("10.10.1.1", "11.0.0.1", "fe80::1"):
+            with self.assertRaises(ValueError):
+                hosts.ip = address
+
+        # assigning the lists rebuilds the indexes
+        validator.not_in_networks = []
+        hosts.ip = "10.10.1.1"
+        validator.in_networks.append("11.0.0.0/8")
+        validator.rebuild_networks()
+        hosts.ip = "11.0.0.1"
+        self.assertEqual(hosts.ip, "11.0.0.1")
+
+
+class TestUnchangedValue(unittest.TestCase):
+
+    def test_equal_value_not_validated_again(self):
+        validator = Validator(logger=False, debug=True, min_length=3, cache_validation=True)
+
+        @dataclass
+        class Named(object):
+            name: typing.Any = validator
+
+        named = Named("Ajay")
+        named.name = "Ajay"
+        named.name = "Ajay"
+        info = validator.cache_info()
+        self.assertEqual(info.hits + info.misses, 1)
+        # the marks of the values validated are kept off the instance
+        self.assertEqual(vars(named), {"name": "Ajay"})
+        validator.min_length = 5
+        with self.assertRaises(ValueError):
+            named.name = "Ajay"
+        # mutable values are always validated again
+        names = named.name = ["Ajay", "Vijay", "Sujay", "Ajit", "Amit"]
+        names.clear()
+        with self.assertRaises(ValueError):
+            named.name = names
+
+
+class TestValidationCache(unittest.TestCase):
+
+    def test_validation_cache(self):
+        validator = Validator(logger=False, debug=True, min_length=3, cache_validation=True, cache_size=2)
+
+        @dataclass
+        class Cached(object):
+            name: str = validator
+
+        cached = Cached("Ajay")
+        Cached("Ajay")  # an equal value assigned again is left as is, not validated
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cached.name = "A"
+        info = validator.cache_info()
+        self.assertEqual((info.hits, info.misses, info.size), (2, 2, 2))
+        cached.name = "Vijay"
+        self.assertEqual(validator.cache_info().evictions, 1)
+
+        validator.max_length = 4
+        self.assertIsNone(validator.cache_info())
+        with self.assertRaises(ValueError):
+            cached.name = "Vijay"
+
+    def test_validation_cache_bypass(self):
+        validator = Validator(logger=False, debug=True, reassign=True, cache_validation=True)
+
+        @dataclass
+        class Reassigned(object):
+            name: str = validator
+
+        Reassigned("Ajay").name = "Ajay"
+        self.assertIsNone(validator.cache_info())
+        cache = ValidationCache(maxsize=1, ttl=0)
+        cache.put("a", None)
+        self.assertIs(cache.get("a", "missing"), None)
+
+    def test_shared_validation_cache(self):
+        path = os.path.join(tempfile.mkdtemp(), "validation.cache")
+        cache = SharedValidationCache(path, slots=64)
+        validator = Validator(logger=False, debug=True, min_length=3, cache_validation=True,
+                              cache_backend=cache)
+
+        @dataclass
+        class Shared(object):
+            name: str = validator
+
+        shared = Shared("Ajay")
+        with self.assertRaises(ValueError):
+            shared.name = "A"
+        self.assertEqual(len(cache), 2)
+
+        other = SharedValidationCache(path)
+        self.assertIsNone(other.get(other.key(validator, "Ajay"), "missing"))
+        self.assertIsInstance(other.get(other.key(validator, "A")), ValueError)
+        validator.min_length = 4
+        self.assertEqual(other.get(other.key(validator, "Ajay"), "missing"), "missing")
+        other.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_cache_fingerprint(self):
+        sensitive = Validator(name="code", logger=False, in_choice=["IN", "US"])
+        insensitive = Validator(name="code", logger=False, in_choice=["IN", "US"], case_insensitive=True)
+        self.assertNotEqual(sensitive._cache_fingerprint(), insensitive._cache_fingerprint())
+        self.assertEqual(sensitive._cache_fingerprint(),
+                         Validator(name="code", logger=False, in_choice=["IN", "US"])._cache_fingerprint())
+
+
+
+class TestCheck(unittest.TestCase):
+
+    def test_check(self):
+        validator = Validator(name="name", logger=False, debug=True, min_length=3, in_choice=["Ajay", "Vijay"])
+        self.assertEqual(validator.check("Ajay"), Ok("Ajay"))
+        violation = validator.check("A")
+        self.assertIsInstance(violation, Violation)
+        self.assertFalse(violation)
+        self.assertEqual((violation.field, violation.code), ("name", "min_length"))
+        self.assertEqual(validator.check("Ravi").code, "in_choice")
+        self.assertIsInstance(violation.to_error(), FieldValueError)
+
+        @dataclass
+        class Named(object):
+            name: str = validator
+
+        with self.assertRaises(FieldValueError):
+            Named("A")
+        self.assertEqual(IP4AddressValidator(logger=False).check("::1", Named("Ajay")).code, "ValueError")
+
+    def test_check_type_checks(self):
+        # the checks of validator types run without an instance too
+        self.assertEqual(IP4AddressValidator(logger=False).check("garbage").code, "ValueError")
+        self.assertEqual(IP4AddressValidator(logger=False).check("10.0.0.1"), Ok("10.0.0.1"))
+        self.assertEqual(PhoneNumberValidator(logger=False).check("abc").code, "ValueError")
+        self.assertEqual(PhoneNumberValidator(logger=False).check("9876543210"), Ok("9876543210"))
+        self.assertFalse(HexColorValidator(logger=False).check("#ggg"))
+        self.assertFalse(PANCardValidator(logger=False).check("nope"))
+        self.assertFalse(IP4AddressValidator(logger=False, collect_errors=True).check("garbage"))
+
+    def test_collect_errors(self):
+        validator = Validator(name="name", logger=False, debug=True, min_length=3, in_choice=["Ajay"],
+                              collect_errors=True)
+        # the checks with a tester collect their violations without raising
+        self.assertTrue(all(not raises for _, raises in validator._check_plan()))
+        with self.assertRaises(ValidationError) as context:
+            validator.validate(None, "A")
+        self.assertEqual([(field, code) for field, code, _ in context.exception.structured()],
+                         [("name", "min_length"), ("name", "in_choice")])
+
+
+class TestValidatorSpec(unittest.TestCase):
+
+    def test_build(self):
+        spec = ValidatorSpec(IP4AddressValidator, logger=False, debug=True, in_choice=["10.0.0.1", "10.0.0.2"])
+        self.assertRaises(AttributeError, setattr, spec, "options", {})
+        self.assertRaises(TypeError, ValidatorSpec, dict)
+
+        @dataclass
+        class Hosts(object):
+            first: str = spec.build()
+            second: str = spec.build(name="second")
+
+        hosts = Hosts("10.0.0.1", "10.0.0.2")
+        self.assertEqual((hosts.first, hosts.second), ("10.0.0.1", "10.0.0.2"))
+        with self.assertRaises(ValueError):
+            hosts.second = "10.0.0.3"
+        with self.assertRaises(ValueError):
+            hosts.first = "host"
+        first, second = Hosts.__dict__["first"], Hosts.__dict__["second"]
+        self.assertEqual((first.name, second.name), ("first", "second"))
+        self.assertIsNot(first._custom_validators, second._custom_validators)
+        self.assertEqual(spec.replace(in_choice=None).build().check("10.0.0.3"), Ok("10.0.0.3"))
+
+    def test_build_indexes(self):
+        spec = ValidatorSpec(IP4AddressValidator, logger=False, in_choice=["10.0.0.1"], in_networks=["10.0.0.0/8"])
+        first, second = spec.build(), spec.build()
+        first.add_choices("192.168.0.1")
+        first._in_networks_index.add("192.168.0.0/16")
+        self.assertEqual(first.check("192.168.0.1"), Ok("192.168.0.1"))
+        for validator in (second, spec.build()):
+            self.assertNotIsInstance(validator.check("192.168.0.1"), Ok)
+            self.assertEqual(validator.check("10.0.0.1"), Ok("10.0.0.1"))
+
+
 if __name__ == '__main__':
     unittest.main()
     
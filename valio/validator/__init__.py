@@ -6,3 +6,5 @@
 
 
 from .validators import *
+from .caches import *
+from .specs import *
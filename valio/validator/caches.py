@@ -0,0 +1,243 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Validation cache shared by all the processes of a box.
+
+:class:`SharedValidationCache` is a fixed size open addressing hash table
+living in an mmap'd file (``/dev/shm`` by default, so in memory), every
+worker opening the same path sees the outcomes the others computed. Keys are
+a blake2b digest of the validator configuration fingerprint and the value,
+reads take no lock: every slot carries a sequence number bumped before and
+after a write (a seqlock), a read racing a write is simply a miss. Writers
+lock the slot they write with ``fcntl.lockf``.
+"""
+
+import builtins
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+import typing
+
+from .validators import CacheInfo
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover, not available on windows
+    fcntl = None
+
+__all__ = ["SharedValidationCache"]
+
+_MAGIC = b"VALIOVC1"
+_HEADER = struct.Struct("<8sQQ")  # magic, slots, payload size
+# sequence number, payload length (0 for a valid value), expiry, key digest
+_SLOT = struct.Struct("<IId16s")
+_KEY_SIZE = 16
+# values whose pickle is the same in every process
+_SHAREABLE = (str, bytes, int, float, bool, type(None))
+
+
+def _dump_error(error: BaseException) -> typing.Optional[bytes]:
+    # valio errors (FieldValueError...) are kept as their builtin base
+    for error_type in type(error).__mro__:
+        if getattr(builtins, error_type.__name__, None) is error_type:
+            break
+    else:
+        return None
+    if not issubclass(error_type, Exception) or error_type is Exception:
+        return None
+    return f"{error_type.__name__}\0{error}".encode("utf-8", "surrogatepass")
+
+
+def _load_error(payload: bytes) -> typing.Optional[BaseException]:
+    name, _, message = payload.decode("utf-8", "surrogatepass").partition("\0")
+    error_type = getattr(builtins, name, None)
+    if not isinstance(error_type, type) or not issubclass(error_type, Exception):
+        return None
+    return error_type(message)
+
+
+def _shared_dir() -> str:
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+class SharedValidationCache(object):
+    """Cross process cache of validation outcomes, given to validators as
+    ``cache_backend`` along with ``cache_validation=True``.
+
+    Only ``str``, ``bytes``, ``int``, ``float``, ``bool`` and ``None``
+    values of validators whose options can be fingerprinted are shared.
+    Errors are kept as their builtin exception type name and message, when
+    they fit in ``payload_size`` bytes, so nothing is ever unpickled. When
+    all the ``probes`` slots of a key are taken its first slot is reused.
+    Hits and misses are counted per process.
+
+    Usage:
+
+    >>> import os, tempfile
+    >>> from valio import Validator
+    >>> path = os.path.join(tempfile.mkdtemp(), "emails.cache")
+    >>> cache = SharedValidationCache(path, slots=1024)
+    >>> validator = Validator(name="email", min_length=3, cache_validation=True,
+    ...                       cache_backend=cache, logger=False)
+    >>> key = cache.key(validator, "a@b.c")
+    >>> cache.put(key, None)
+    >>> SharedValidationCache(path).get(key, "missing") is None
+    True
+    """
+
+    def __init__(
+            self,
+            path: typing.Optional[str] = None,
+            slots: int = 1 << 16,
+            ttl: typing.Optional[float] = None,
+            payload_size: int = 96,
+            probes: int = 8,
+    ):
+        if fcntl is None:
+            raise RuntimeError(f"{type(self).__name__} needs fcntl, only available on unix")
+        if slots <= 0:
+            raise ValueError(f"expect slots to be greater than 0, got {slots} instead")
+
+        self.path = path or os.path.join(_shared_dir(), "valio-validation-cache")
+        self.ttl = ttl
+        self.probes = max(1, min(probes, slots))
+        self.hits = self.misses = self.evictions = 0
+        # lockf locks are held per process, threads take this one
+        self._lock = threading.Lock()
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, _HEADER.size, 0)
+        try:
+            header = os.pread(self._fd, _HEADER.size, 0)
+            if len(header) == _HEADER.size and header.startswith(_MAGIC):
+                # an existing table keeps its own geometry
+                _, slots, payload_size = _HEADER.unpack(header)
+            else:
+                os.ftruncate(self._fd, _HEADER.size + slots * (_SLOT.size + payload_size))
+                os.pwrite(self._fd, _HEADER.pack(_MAGIC, slots, payload_size), 0)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, _HEADER.size, 0)
+
+        self.slots, self.payload_size = slots, payload_size
+        self._slot_size = _SLOT.size + payload_size
+        self._map = mmap.mmap(self._fd, _HEADER.size + slots * self._slot_size)
+
+    def key(self, validator, value) -> typing.Optional[bytes]:
+        """digest of the validator fingerprint and the value, ``None`` when
+        the outcome can not be shared"""
+        if type(value) not in _SHAREABLE:
+            return None
+        fingerprint = validator._cache_fingerprint()
+        if fingerprint is None:
+            return None
+        digest = hashlib.blake2b(fingerprint, digest_size=_KEY_SIZE)
+        digest.update(pickle.dumps(value, protocol=4))
+        return digest.digest()
+
+    def _offset(self, slot: int) -> int:
+        return _HEADER.size + slot * self._slot_size
+
+    def _candidates(self, key: bytes) -> typing.Iterator[int]:
+        home = int.from_bytes(key[:8], "little") % self.slots
+        return ((home + probe) % self.slots for probe in range(self.probes))
+
+    def _read(self, offset):
+        sequence, length, expires, key = _SLOT.unpack_from(self._map, offset)
+        if sequence & 1:
+            return None  # being written
+        payload = self._map[offset + _SLOT.size: offset + _SLOT.size + length]
+        if _SLOT.unpack_from(self._map, offset)[0] != sequence:
+            return None
+        return key, expires, length, payload
+
+    def get(self, key: typing.Optional[bytes], default=None):
+        if key is None:
+            return default
+        for slot in self._candidates(key):
+            read = self._read(self._offset(slot))
+            if read is None:
+                continue
+            stored_key, expires, length, payload = read
+            if stored_key != key:
+                continue
+            if expires and expires <= time.time():
+                break
+            outcome = _load_error(payload) if length else None
+            if length and outcome is None:  # not an error any more
+                break
+            self.hits += 1
+            return outcome
+        self.misses += 1
+        return default
+
+    def put(self, key: typing.Optional[bytes], outcome):
+        if key is None:
+            return
+        payload = b""
+        if outcome is not None:
+            payload = _dump_error(outcome)
+            if payload is None or len(payload) > self.payload_size:
+                return
+
+        candidates = list(self._candidates(key))
+        target, now = candidates[0], time.time()
+        for slot in candidates:
+            read = self._read(self._offset(slot))
+            if read is None:
+                continue
+            stored_key, expires, _, _ = read
+            if stored_key == key or stored_key == bytes(_KEY_SIZE) or (expires and expires <= now):
+                target = slot
+                break
+        else:
+            self.evictions += 1
+
+        offset = self._offset(target)
+        expires = now + self.ttl if self.ttl else 0.0
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, self._slot_size, offset)
+            try:
+                sequence = _SLOT.unpack_from(self._map, offset)[0] | 1
+                struct.pack_into("<I", self._map, offset, sequence)
+                self._map[offset + _SLOT.size: offset + _SLOT.size + len(payload)] = payload
+                _SLOT.pack_into(self._map, offset, sequence, len(payload), expires, key)
+                struct.pack_into("<I", self._map, offset, (sequence + 1) & 0xFFFFFFFF)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, self._slot_size, offset)
+
+    def clear(self):
+        """empty the table, for every process using it"""
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                for slot in range(self.slots):
+                    offset = self._offset(slot)
+                    sequence = _SLOT.unpack_from(self._map, offset)[0] | 1
+                    _SLOT.pack_into(self._map, offset, sequence, 0, 0.0, bytes(_KEY_SIZE))
+                    struct.pack_into("<I", self._map, offset, (sequence + 1) & 0xFFFFFFFF)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    def __len__(self):
+        empty = bytes(_KEY_SIZE)
+        return sum(
+            _SLOT.unpack_from(self._map, self._offset(slot))[3] != empty
+            for slot in range(self.slots)
+        )
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self), self.slots, self.ttl)
+
+    def close(self):
+        self._map.close()
+        os.close(self._fd)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path!r}, slots={self.slots}, ttl={self.ttl})"
@@ -0,0 +1,82 @@
+# Copyright (c) 2022 Valio
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Validator options checked once, shared by every validator built with them.
+
+Building a validator checks each of its options through the ``__init__``
+of every class of its (long) MRO. A :class:`ValidatorSpec` does it once, for
+a template validator; :meth:`ValidatorSpec.build` then copies the template,
+which costs about a dict copy whatever the class, and sets the few
+attributes given (``name``, ``default``, ``doc``...) as any validator
+attribute is set. :meth:`~valio.field.fields.FieldMixin.from_spec` builds
+fields the same way.
+"""
+
+import types
+import typing
+
+from . import validators
+
+__all__ = ["ValidatorSpec"]
+
+
+class ValidatorSpec(object):
+    """Immutable options of a ``validator_class`` validator. The built
+    validators get copies of the containers among them, other objects
+    (item validators, compiled patterns...) are shared.
+
+    >>> from valio import StringValidator
+    >>> spec = ValidatorSpec(StringValidator, min_length=3, logger=False, debug=True)
+    >>> name = spec.build(name="name")
+    >>> name.check("Ajay")
+    Ok('Ajay')
+    >>> name.check("A")
+    Violation(field='name', code='min_length', params={'min_length': 3, 'length': 1})
+    >>> spec.replace(min_length=1).build().check("A")
+    Ok('A')
+    """
+
+    __slots__ = ("validator_class", "options", "_template", "_copied_keys")
+
+    def __init__(self, validator_class: typing.Type[validators.Validator] = validators.Validator, **options):
+        if not isinstance(validator_class, type) or not issubclass(validator_class, validators.Validator):
+            raise TypeError(
+                f"expect validator_class to be a {validators.Validator.__name__} subclass, "
+                f"got {validator_class!r} instead"
+            )
+        object.__setattr__(self, "validator_class", validator_class)
+        object.__setattr__(self, "options", types.MappingProxyType(dict(options)))
+        # options are checked here, once
+        template = validator_class(**options)
+        object.__setattr__(self, "_template", template)
+        object.__setattr__(self, "_copied_keys", template._copied_keys())
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def build(self, **attributes) -> validators.Validator:
+        """a new validator of the spec, given ``attributes`` set on it"""
+        validator = self._template._copy(self._copied_keys)
+        for key, value in attributes.items():
+            setattr(validator, key, value)
+        return validator
+
+    def replace(self, **options) -> "ValidatorSpec":
+        """a new spec, with ``options`` replacing those of this one"""
+        return type(self)(self.validator_class, **{**self.options, **options})
+
+    def __eq__(self, other):
+        if not isinstance(other, ValidatorSpec):
+            return NotImplemented
+        return self.validator_class is other.validator_class and self.options == other.options
+
+    __hash__ = None
+
+    def __repr__(self):
+        options = ", ".join(f"{key}={value!r}" for key, value in self.options.items())
+        return f"{type(self).__name__}({self.validator_class.__name__}{', ' if options else ''}{options})"
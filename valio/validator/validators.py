@@ -14,6 +14,7 @@ import asyncio
 import cProfile
 import datetime
 import decimal
+import hashlib
 import io
 import ipaddress
 import os
@@ -21,9 +22,13 @@ import pathlib
 import pstats
 import re
 import sys
+import threading
+import time
+import types
 import typing
+import unicodedata
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from enum import Enum, IntEnum
 from functools import partial, wraps
@@ -63,13 +68,17 @@ from uuid import UUID
 
 import phonenumbers as phn
 from typingx import isinstancex
-from valio.descriptor import DEBUG, DEFAULT, DOC, NAME, descriptors
+from valio.descriptor import (DEBUG, DEFAULT, DOC, NAME, STORAGE, descriptors,
+                              storages)
+from valio.error import errors
 from valio.regexer import regexps, relib
 from valio.regexer.relib.dates import (day_numbers, eu_date, get_date,
                                        ind_date, months_numbers)
 
 __all__ = [
     "ValidateProperty",
+    "TypePredicate",
+    "type_predicate",
     "TypeValidator",
     "RequiredValidator",
     "PatternValidator",
@@ -78,9 +87,15 @@ __all__ = [
     "ValueValidator",
     "LengthValidator",
     "ExpiryValidator",
+    "ChoiceIndex",
+    "choice_key",
     "ChoiceValidator",
+    "ItemValidator",
     "TaskValidator",
+    "ValidationCache",
+    "CacheInfo",
     "Validator",
+    "validate_now",
     "IntegerValidator",
     "FloatValidator",
     "DecimalValidator",
@@ -99,6 +114,7 @@ __all__ = [
     "PhoneNumberValidator",
     "AadhaarCardValidator",
     "PANCardValidator",
+    "IPAddressValidator",
     "IP4AddressValidator",
     "IP6AddressValidator",
     "IPAnyAddressValidator",
@@ -122,7 +138,10 @@ __all__ = [
     "DATE_TIME_DELTA",
     "TYPE",
     "UUID_Type",
-    "CHOICE"
+    "CHOICE",
+    "NETWORKS",
+    "SECONDS",
+    "CACHE_BACKEND",
 ]
 
 
@@ -168,6 +187,88 @@ def timed_lru_cache(seconds: int, maxsize: int = 128) -> typing.Callable[[F], ty
     return wrapper_cache
 
 
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+    ttl: typing.Optional[float]
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ValidationCache(object):
+    """Thread safe LRU cache of validation outcomes with an optional time to
+    live, ``None`` for a value that validated or the error it raised.
+
+    >>> cache = ValidationCache(maxsize=2)
+    >>> cache.put("a", None)
+    >>> cache.get("a") is None, cache.get("b", "missing")
+    (True, 'missing')
+    >>> cache.info().hit_rate
+    0.5
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: typing.Optional[float] = None):
+        if maxsize <= 0:
+            raise ValueError(f"expect maxsize to be greater than 0, got {maxsize} instead")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = self.misses = self.evictions = 0
+        self._entries: "OrderedDict[typing.Hashable, typing.Tuple[typing.Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, validator, value) -> typing.Optional[typing.Hashable]:
+        """the key of ``value``, ``None`` when it can not be cached"""
+        key = (type(value), value)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                outcome, expires = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires and expires <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return outcome
+
+    def put(self, key, outcome):
+        expires = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._entries[key] = (outcome, expires)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize, self.ttl)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(maxsize={self.maxsize}, ttl={self.ttl})"
+
+
 class ValidateProperty(descriptors.Property, ABC):
     """Validation base class, it has abstract validate method
     which must be implemented by every inherited class.
@@ -333,6 +434,7 @@ BYTES = Union[bytes, V]
 BOOL = Union[bool, V]
 STR = Union[str, V]
 CHOICE = Union[typing.Any, V]
+NETWORKS = Union[typing.Iterable[typing.Union[str, ipaddress.IPv4Network, ipaddress.IPv6Network]], V]
 PHONE_NUM = Union[str, V]
 PATTERN = Union[typing.Union[str, regexps.PatternType], V]
 VALUE = Union[typing.Union[int, float, bytes, str], V]
@@ -345,6 +447,8 @@ DATE_TIME_DELTA = Union[
         str], V]
 
 TYPE = Union[typing.Any, V]
+SECONDS = Union[typing.Union[int, float], V]
+CACHE_BACKEND = Union[typing.Any, V]
 LIST = Union[list, V]
 DICT = Union[dict, V]
 SET = Union[set, V]
@@ -353,6 +457,101 @@ ENUM = Union[Enum, V]
 INT_ENUM = Union[IntEnum, V]
 STR_ENUM = Union[typing.Union[str, Enum], V]
 UUID_Type = Union[UUID, V]
+ITEM_VALIDATOR = Union[typing.Any, V]
+
+
+def _union_members(annotation):
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        for arg in typing.get_args(annotation):
+            yield from _union_members(arg)
+    else:
+        yield annotation
+
+
+def _is_plain_class(annotation) -> bool:
+    # TypedDicts and non runtime protocols can not be used with isinstance
+    return isinstance(annotation, type) \
+        and not typing.get_args(annotation) \
+        and not typing.is_typeddict(annotation) \
+        and not getattr(annotation, "_is_protocol", False)
+
+
+def _may_match(value_type, annotation) -> bool:
+    # only builtin origins (list[int], dict[str, int]...) are used to rule
+    # out value types, isinstancex is looser than isinstance for the abcs.
+    origin = typing.get_origin(annotation) or annotation
+    if isinstance(origin, type) and origin.__module__ == "builtins":
+        return issubclass(value_type, origin)
+    return True
+
+
+class TypePredicate(object):
+    """An annotation compiled once into a fast ``isinstance`` predicate.
+
+    Unions are flattened, plain classes (``NoneType`` included) become a
+    single ``isinstance`` tuple check, TypeVars (such as the ``V`` bound to
+    ValidateProperty in ``INT``, ``STR``...) never match and are dropped,
+    and ``typing.Any`` matches everything. Generic members such as
+    ``list[int]`` fall back to ``isinstancex``, and only for the value
+    types that can match them (cached per ``type(value)``).
+
+    >>> is_int = TypePredicate(INT)
+    >>> is_int(1), is_int(None), is_int("1")
+    (True, True, False)
+    """
+
+    __slots__ = ("annotation", "_any", "_classes", "_generics", "_candidates")
+
+    _max_candidates = 1024
+
+    def __init__(self, annotation):
+        self.annotation = annotation
+        self._any = False
+        classes, generics = [], []
+        for member in _union_members(annotation):
+            if member is typing.Any:
+                self._any = True
+            elif isinstance(member, typing.TypeVar):
+                continue
+            elif _is_plain_class(member):
+                classes.append(member)
+            else:
+                generics.append(member)
+        self._classes = tuple(dict.fromkeys(classes))
+        self._generics = tuple(generics)
+        self._candidates: typing.Dict[type, bool] = {}
+
+    def __call__(self, value) -> bool:
+        if self._any or isinstance(value, self._classes):
+            return True
+        if not self._generics:
+            return False
+        value_type = type(value)
+        candidates = self._candidates.get(value_type)
+        if candidates is None:
+            if len(self._candidates) >= self._max_candidates:
+                self._candidates.clear()
+            candidates = self._candidates[value_type] = any(
+                _may_match(value_type, generic) for generic in self._generics
+            )
+        return candidates and isinstancex(value, self.annotation)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.annotation!r})"
+
+
+_type_predicates: typing.Dict[typing.Any, TypePredicate] = {}
+
+
+def type_predicate(annotation) -> TypePredicate:
+    """Return the cached :class:`TypePredicate` of ``annotation``."""
+    try:
+        return _type_predicates[annotation]
+    except KeyError:
+        predicate = _type_predicates[annotation] = TypePredicate(annotation)
+        return predicate
+    except TypeError:  # unhashable annotation
+        return TypePredicate(annotation)
 
 
 @dataclass
@@ -387,6 +586,8 @@ class TypeValidator(ValidateProperty):
     ...         ...
     ...
     """
+    _type_predicate = None
+    _type_predicate_annotation = None
 
     def __init__(
             self,
@@ -400,16 +601,46 @@ class TypeValidator(ValidateProperty):
     def validate(self, instance=None, value=None):
         self._validate_type(instance, value)
 
+    def __set_name__(self, owner, name):
+        super(TypeValidator, self).__set_name__(owner, name)
+        self._compile_type_predicate()
+
+    def __get__(self, obj, obj_type=None):
+        # option descriptors (``required = TypeValidator(logger=False)``...)
+        # have no get hooks to run, their value is read straight away.
+        if obj is not None and type(self) is TypeValidator and not self.logger \
+                and self.storage is None:
+            try:
+                return obj.__dict__[self.name]
+            except KeyError:
+                pass
+        return super(TypeValidator, self).__get__(obj, obj_type)
+
+    def _compile_type_predicate(self):
+        annotation = self.annotation
+        self._type_predicate = type_predicate(annotation) if annotation is not None else None
+        self._type_predicate_annotation = annotation
+        return self._type_predicate
+
     def _validate_type(self, instance, value):  # noqa
         if logger := self.logger:
             logger.info(f"{self.name}: Type: {self.annotation}")
         
+        violation = self._check_type(value)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_type(self, value) -> typing.Optional[errors.Violation]:
         if self.annotation is not None:
-            if value is not None and not isinstancex(value, self.annotation):
-                raise TypeError(
-                    f"{self.name} expect {self.annotation} type, "
-                    f"got {type(value).__name__} type instead"
+            predicate = self._type_predicate
+            if self._type_predicate_annotation is not self.annotation:
+                predicate = self._compile_type_predicate()
+            if value is not None and not predicate(value):
+                return errors.Violation(
+                    self.name, "type", {"annotation": self.annotation, "value_type": type(value).__name__},
+                    "{field} expect {annotation} type, got {value_type} type instead", errors.FieldTypeError,
                 )
+        return None
                 
 
 
@@ -450,11 +681,17 @@ class RequiredValidator(ValidateProperty):
         if required:
             if logger := self.logger:
                 logger.info(f"{self.name}: Required: {required}")
-                
-            if value is None:
-                raise ValueError(
-                    f"{self.name} requires value, got {value} instead"
-                )
+
+        violation = self._check_required(value)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_required(self, value) -> typing.Optional[errors.Violation]:
+        if value is None and self.__dict__.get("required"):
+            return errors.Violation(
+                self.name, "required", {"value": value}, "{field} requires value, got {value} instead",
+            )
+        return None
 
 
 @dataclass
@@ -501,15 +738,23 @@ class PatternValidator(ValidateProperty):
             if logger := self.logger:
                 logger.info(f"{self.name}: Regexp: {self.pattern}")
 
-            if value is not None:
-                value = value if isinstance(value, str) else str(value)
-                get_pattern = re.compile(pattern).findall
-                pattern = get_pattern(value)
-                if not any(pattern):
-                    raise ValueError(
-                        f"{self.name} must have the pattern "
-                        f"{self.pattern if not hasattr(self.pattern,'alias') else self.pattern.alias}"
-                    )
+        violation = self._check_pattern(value)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_pattern(self, value) -> typing.Optional[errors.Violation]:
+        pattern = self.__dict__.get("pattern")
+        if isinstance(pattern, regexps.PatternType):
+            pattern = pattern.pattern
+        if pattern and value is not None:
+            value = value if isinstance(value, str) else str(value)
+            if not any(re.compile(pattern).findall(value)):
+                return errors.Violation(
+                    self.name, "pattern",
+                    {"pattern": self.pattern if not hasattr(self.pattern, 'alias') else self.pattern.alias},
+                    "{field} must have the pattern {pattern}",
+                )
+        return None
 
 
 @dataclass
@@ -567,9 +812,9 @@ class ReassignValidator(ValidateProperty):
                 logger.info(f"{self.name}: Reassign: {reassign}")
                 
             if id(instance) in self.__dict__ and self.__dict__[id(instance)] >= 1:
-                raise AttributeError(
-                    f"{self.name} can be assignend only once, "
-                    f"attempted to reassign with value '{value}' instead"
+                raise errors.FieldAttributeError(
+                    self.name, "reassign", {"value": value},
+                    "{field} can be assignend only once, attempted to reassign with value '{value}' instead",
                 )
 
 
@@ -610,13 +855,18 @@ class MultipleValidator(ValidateProperty):
             if logger := self.logger:
                 logger.info(f"{self.name}: Multiple of :{multiple_of}")
 
-            if value is not None:
-                if not (value//self.multiple_of) == 0:
-                    raise ValueError(
-                        f"{self.name} "
-                        f"expect the value multiple of {multiple_of}, "
-                        f"got {value} instead"
-                    )
+        violation = self._check_multiple_of(value)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_multiple_of(self, value) -> typing.Optional[errors.Violation]:
+        multiple_of = self.__dict__.get("multiple_of")
+        if multiple_of and value is not None and not (value // multiple_of) == 0:
+            return errors.Violation(
+                self.name, "multiple_of", {"multiple_of": multiple_of, "value": value},
+                "{field} expect the value multiple of {multiple_of}, got {value} instead",
+            )
+        return None
 
 
 @dataclass
@@ -661,14 +911,19 @@ class MinValueValidator(ValidateProperty):
         if min_value is not None:
             if logger := self.logger:
                 logger.info(f"{self.name}: MinValue: min_value = {min_value}")
-            
-            if value is not None:
-                if value < min_value:
-                    raise ValueError(
-                        f"{self.name} "
-                        f"expect the minimum value of {min_value}, "
-                        f"got {value} instead"
-                    )
+
+        violation = self._check_min_value(value)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_min_value(self, value) -> typing.Optional[errors.Violation]:
+        min_value = self.__dict__.get("min_value")
+        if min_value and value is not None and value < min_value:
+            return errors.Violation(
+                self.name, "min_value", {"min_value": min_value, "value": value},
+                "{field} expect the minimum value of {min_value}, got {value} instead",
+            )
+        return None
 
 
 @dataclass
@@ -714,14 +969,19 @@ class MaxValueValidator(ValidateProperty):
         if max_value is not None:
             if logger := self.logger:
                 logger.info(f"{self.name}: MaxValue: " f"max_value = {max_value}")
-        
-            if value is not None:
-                if value > max_value:
-                    raise ValueError(
-                        f"{self.name} "
-                        f"expect the maximum value of {max_value}, "
-                        f"got {value} instead"
-                    )
+
+        violation = self._check_max_value(value)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_max_value(self, value) -> typing.Optional[errors.Violation]:
+        max_value = self.__dict__.get("max_value")
+        if max_value and value is not None and value > max_value:
+            return errors.Violation(
+                self.name, "max_value", {"max_value": max_value, "value": value},
+                "{field} expect the maximum value of {max_value}, got {value} instead",
+            )
+        return None
 
 
 @dataclass
@@ -803,13 +1063,24 @@ class ValueValidator(MinValueValidator, MaxValueValidator):
             if logger := self.logger:
                 logger.info(f"{self.name}: Value: " f"value = {self.value}")
 
-            if value is not None:
-                if value != of_value:
-                    raise ValueError(
-                        f"{self.name} "
-                        f"expect the value {of_value}, "
-                        f"got {value} as value instead"
-                    )
+        violation = self._check_value(value, bounds=False)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_value(self, value, bounds=True) -> typing.Optional[errors.Violation]:
+        if bounds:
+            violation = self._check_min_value(value)
+            if violation is None:
+                violation = self._check_max_value(value)
+            if violation is not None:
+                return violation
+        of_value = self.__dict__.get("value")
+        if of_value and value is not None and value != of_value:
+            return errors.Violation(
+                self.name, "value", {"expected": of_value, "value": value},
+                "{field} expect the value {expected}, got {value} as value instead",
+            )
+        return None
 
 
 @dataclass
@@ -850,14 +1121,18 @@ class MinLengthValidator(ValidateProperty):
             if logger := self.logger:
                 logger.info(f"{self.name}: MinLength: " f"min_length = {min_length}")
 
-            if value is not None:
-                value_length = len(value)
-                if value_length < min_length:
-                    raise ValueError(
-                        f"{self.name} "
-                        f"expect the value of minimum length {min_length}, "
-                        f"got length {value_length} value instead"
-                    )
+        violation = self._check_min_length(value)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_min_length(self, value) -> typing.Optional[errors.Violation]:
+        min_length = self.__dict__.get("min_length")
+        if min_length and value is not None and len(value) < min_length:
+            return errors.Violation(
+                self.name, "min_length", {"min_length": min_length, "length": len(value)},
+                "{field} expect the value of minimum length {min_length}, got length {length} value instead",
+            )
+        return None
 
 
 @dataclass
@@ -899,14 +1174,18 @@ class MaxLengthValidator(ValidateProperty):
             if logger := self.logger:
                 logger.info(f"{self.name}: MaxLength: " f"max_length = {max_length}")
 
-            if value is not None:
-                value_length = len(value)
-                if value_length > max_length:
-                    raise ValueError(
-                        f"{self.name} "
-                        f"expect the value of maximum length {max_length}, "
-                        f"got length {value_length} value instead"
-                    )
+        violation = self._check_max_length(value)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_max_length(self, value) -> typing.Optional[errors.Violation]:
+        max_length = self.__dict__.get("max_length")
+        if max_length and value is not None and len(value) > max_length:
+            return errors.Violation(
+                self.name, "max_length", {"max_length": max_length, "length": len(value)},
+                "{field} expect the value of maximum length {max_length}, got length {length} value instead",
+            )
+        return None
 
 
 @dataclass
@@ -973,14 +1252,24 @@ class LengthValidator(MinLengthValidator, MaxLengthValidator):
             if logger := self.logger:
                 logger.info(f"{self.name}: Length: " f"length = {length}")
 
-            if value is not None:
-                value_length = len(value)
-                if value_length != length:
-                        raise ValueError(
-                            f"{self.name} "
-                            f"expect the value of length {length}, "
-                            f"got length {value_length} value instead"
-                        )
+        violation = self._check_length(value, bounds=False)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_length(self, value, bounds=True) -> typing.Optional[errors.Violation]:
+        if bounds:
+            violation = self._check_min_length(value)
+            if violation is None:
+                violation = self._check_max_length(value)
+            if violation is not None:
+                return violation
+        length = self.__dict__.get("length")
+        if length and value is not None and len(value) != length:
+            return errors.Violation(
+                self.name, "length", {"expected": length, "length": len(value)},
+                "{field} expect the value of length {expected}, got length {length} value instead",
+            )
+        return None
 
 
 @dataclass
@@ -1095,22 +1384,127 @@ class ExpiryValidator(ValidateProperty):
                     msg = "expiry condition not yet found"
                     raise ValueError(msg)
                 if cond:
-                    msg = f"{self.name} expired {self.timeline} {self.expiry}"
-                    raise ValueError(msg)
+                    raise errors.FieldValueError(
+                        self.name, "expiry", {"timeline": self.timeline, "expiry": self.expiry},
+                        "{field} expired {timeline} {expiry}",
+                    )
+
+
+class ChoiceIndex(object):
+    """Hashed index over choices, hashable choices go in a set and the
+    unhashable ones in a fallback list, so membership is a hash lookup for
+    the usual lists of strings or numbers.
+
+    ``key`` is applied once to every choice and to every looked up value,
+    see :func:`choice_key` for case insensitive and unicode normalised keys.
+
+    >>> index = ChoiceIndex(["IN", "US", ["any"]], key=choice_key(case_insensitive=True))
+    >>> "in" in index, ["any"] in index, "uk" in index
+    (True, True, False)
+    """
+
+    def __init__(self, choices: typing.Iterable = (), key: typing.Callable = None):
+        self.key = key
+        self._hashed = {}
+        self._unhashable = []
+        self.add(*choices)
+
+    def add(self, *choices):
+        key = self.key
+        for choice in choices:
+            choice_key_ = key(choice) if key is not None else choice
+            try:
+                self._hashed.setdefault(choice_key_, choice)
+            except TypeError:
+                if choice_key_ not in self._unhashable:
+                    self._unhashable.append(choice_key_)
+        return self
+
+    def discard(self, *choices):
+        key = self.key
+        for choice in choices:
+            choice_key_ = key(choice) if key is not None else choice
+            try:
+                self._hashed.pop(choice_key_, None)
+            except TypeError:
+                if choice_key_ in self._unhashable:
+                    self._unhashable.remove(choice_key_)
+        return self
+
+    def update(self, choices: typing.Iterable):
+        """Make the index hold ``choices``, only the difference with the
+        current choices is applied."""
+        new = ChoiceIndex(choices, key=self.key)
+        for choice_key_ in [k for k in self._hashed if k not in new._hashed]:
+            del self._hashed[choice_key_]
+        for choice_key_, choice in new._hashed.items():
+            self._hashed.setdefault(choice_key_, choice)
+        self._unhashable = new._unhashable
+        return self
+
+    def choices(self) -> list:
+        return [*self._hashed.values(), *self._unhashable]
+
+    def __contains__(self, value) -> bool:
+        if self.key is not None:
+            value = self.key(value)
+        try:
+            if value in self._hashed:
+                return True
+        except TypeError:
+            pass
+        return bool(self._unhashable) and value in self._unhashable
+
+    def __len__(self):
+        return len(self._hashed) + len(self._unhashable)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.choices()!r})"
+
+
+def choice_key(case_insensitive: bool = None, normalize_unicode: str = None):
+    """Key function matching strings case insensitively and/or after unicode
+    normalisation (``"NFC"``, ``"NFKC"``, ``"NFD"`` or ``"NFKD"``), other
+    values are left as they are. Returns ``None`` when no key is needed."""
+    if not case_insensitive and not normalize_unicode:
+        return None
+    if normalize_unicode is not None:
+        unicodedata.normalize(normalize_unicode, "")  # fail early on unknown forms
+
+    def key(value):
+        if isinstance(value, str):
+            if normalize_unicode:
+                value = unicodedata.normalize(normalize_unicode, value)
+            if case_insensitive:
+                value = value.casefold()
+                if normalize_unicode:
+                    value = unicodedata.normalize(normalize_unicode, value)
+        return value
+
+    return key
 
 
 class ChoiceValidator(ValidateProperty):
-    in_choice: CHOICE = None
-    not_in_choice: CHOICE = None
+    """``in_choice`` and ``not_in_choice`` are compiled once to a
+    :class:`ChoiceIndex`, assigning them rebuilds the index and
+    :meth:`add_choices`/:meth:`discard_choices` update it in place.
+    ``case_insensitive`` and ``normalize_unicode`` change how strings are
+    matched."""
 
     def __init__(
             self,
             in_choice: CHOICE = None,
             not_in_choice: CHOICE = None,
+            case_insensitive: BOOL = None,
+            normalize_unicode: STR = None,
             doc: DOC = None,
             debug: BOOL = None,
             **kwargs
     ):
+        # kept for the cache fingerprint, strings are matched by the key
+        self.case_insensitive = case_insensitive
+        self.normalize_unicode = normalize_unicode
+        self._choice_key = choice_key(case_insensitive, normalize_unicode)
         self.in_choice = in_choice
         self.not_in_choice = not_in_choice
             
@@ -1137,6 +1531,61 @@ class ChoiceValidator(ValidateProperty):
                     self.doc = f"not_in_choice: {self.not_in_choice}"
         except KeyError as ke:
             pass 
+
+    @property
+    def in_choice(self):
+        return self._in_choice
+
+    @in_choice.setter
+    def in_choice(self, choices: CHOICE):
+        self._in_choice = choices
+        self._in_choice_index = self._choice_index(choices)
+
+    @property
+    def not_in_choice(self):
+        return self._not_in_choice
+
+    @not_in_choice.setter
+    def not_in_choice(self, choices: CHOICE):
+        self._not_in_choice = choices
+        self._not_in_choice_index = self._choice_index(choices)
+
+    def _choice_index(self, choices):
+        if choices is None or not choices:
+            return None
+        # strings, ranges and custom containers keep their own `in`
+        if self._choice_key is None and not isinstance(choices, (list, tuple, set, frozenset, dict)):
+            return choices
+        return ChoiceIndex(choices, key=self._choice_key)
+
+    def _choice_index_for_update(self, not_in_choice):
+        name = "not_in_choice" if not_in_choice else "in_choice"
+        index = getattr(self, f"_{name}_index")
+        if not isinstance(index, ChoiceIndex):
+            index = ChoiceIndex(index or (), key=self._choice_key)
+        return name, index
+
+    def _set_updated_choices(self, name, index):
+        setattr(self, f"_{name}", index.choices())
+        setattr(self, f"_{name}_index", index if len(index) else None)
+
+    def add_choices(self, *choices, not_in_choice: bool = False):
+        """Add choices to ``in_choice`` (or ``not_in_choice``) without
+        rebuilding the whole index."""
+        name, index = self._choice_index_for_update(not_in_choice)
+        self._set_updated_choices(name, index.add(*choices))
+
+    def discard_choices(self, *choices, not_in_choice: bool = False):
+        """Remove choices from ``in_choice`` (or ``not_in_choice``) without
+        rebuilding the whole index."""
+        name, index = self._choice_index_for_update(not_in_choice)
+        self._set_updated_choices(name, index.discard(*choices))
+
+    def update_choices(self, choices: CHOICE, not_in_choice: bool = False):
+        """Replace ``in_choice`` (or ``not_in_choice``), only the difference
+        with the current choices is applied to the index."""
+        name, index = self._choice_index_for_update(not_in_choice)
+        self._set_updated_choices(name, index.update(choices or ()))
         
     def validate(self, instance=None, value=None):
         self._validate_choice(instance, value)
@@ -1146,41 +1595,48 @@ class ChoiceValidator(ValidateProperty):
         self._validate_not_in_choice(instance, value)
 
     def _validate_in_choice(self, instance, value):
-        in_choice = None 
-        try:
-            if self.in_choice is not None and self.in_choice:
-                in_choice = self.in_choice
-        except KeyError as ke:
-            pass
+        in_choice = self._in_choice_index
         
         if in_choice is not None:
             if logger := self.logger:
-                logger.info(f"{self.name}: In-Choice: {in_choice}")
-
-            if value is not None:
-                if value not in in_choice:
-                    raise ValueError(
-                        f"{self.name} expect values in {in_choice}, "
-                        f"got {value} as value instead"
-                    )
+                logger.info(f"{self.name}: In-Choice: {self.in_choice}")
+
+        violation = self._check_in_choice(value)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_in_choice(self, value) -> typing.Optional[errors.Violation]:
+        in_choice = self._in_choice_index
+        if in_choice is not None and value is not None and value not in in_choice:
+            return errors.Violation(
+                self.name, "in_choice", {"choices": self.in_choice, "value": value},
+                "{field} expect values in {choices}, got {value} as value instead",
+            )
+        return None
 
     def _validate_not_in_choice(self, instance, value):
-        not_in_choice = None 
-        try:
-            if self.not_in_choice is not None and self.not_in_choice:
-                not_in_choice = self.not_in_choice
-        except KeyError as ke:
-            pass
+        not_in_choice = self._not_in_choice_index
         
         if not_in_choice is not None:
             if logger := self.logger:
-                logger.info(f"{self.name}: Not-In-Choice: {not_in_choice}")
+                logger.info(f"{self.name}: Not-In-Choice: {self.not_in_choice}")
+
+        violation = self._check_not_in_choice(value)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_not_in_choice(self, value) -> typing.Optional[errors.Violation]:
+        not_in_choice = self._not_in_choice_index
+        if not_in_choice is not None and value in not_in_choice:
+            return errors.Violation(
+                self.name, "not_in_choice", {"choices": self.not_in_choice, "value": value},
+                "{field} does not expect values in {choices}, got {value} as value instead",
+            )
+        return None
 
-            if value in not_in_choice:
-                raise ValueError(
-                    f"{self.name} does not expect values in {not_in_choice}, "
-                    f"got {value} as value instead"
-                )
+    def _check_choice(self, value) -> typing.Optional[errors.Violation]:
+        violation = self._check_in_choice(value)
+        return violation if violation is not None else self._check_not_in_choice(value)
 
 
 @dataclass
@@ -1220,11 +1676,152 @@ class AttributeValidator(ValidateProperty):
             if logger := self.logger:
                 logger.info(f"{self.name}: Has Attributes: {has_attributes}")
 
-            if value is not None:
-                for attr in has_attributes:
-                    if not hasattr(value, attr):
-                        raise AttributeError(f"{self.name} must have an attribute "
-                                             f"'{has_attributes}'")
+        violation = self._check_attribute(value)
+        if violation is not None:
+            raise violation.to_error()
+
+    def _check_attribute(self, value) -> typing.Optional[errors.Violation]:
+        has_attributes = self.__dict__.get("has_attributes")
+        if has_attributes and value is not None:
+            for attr in has_attributes:
+                if not hasattr(value, attr):
+                    return errors.Violation(
+                        self.name, "has_attributes", {"has_attributes": has_attributes, "attribute": attr},
+                        "{field} must have an attribute '{has_attributes}'", errors.FieldAttributeError,
+                    )
+        return None
+
+
+def _item_check(spec, label):
+    """compile an item/key/value validator spec into a callable raising on
+    invalid values: Validator instances and classes run their validation,
+    anything else is a type annotation."""
+    if spec is None:
+        return None
+    if isinstance(spec, type) and issubclass(spec, ValidateProperty):
+        spec = spec(debug=True, logger=False)
+    if isinstance(spec, ValidateProperty):
+        if spec.name is None:
+            spec.name = label
+        validate = spec.validate
+
+        def check(value):
+            validate(None, value)
+
+        return check
+
+    predicate = type_predicate(spec)
+    spec_name = getattr(spec, "__name__", str(spec))
+
+    def check(value):
+        if not predicate(value):
+            raise TypeError(f"expect {spec_name} type, got {type(value).__name__} type instead")
+
+    return check
+
+
+@dataclass
+class ItemValidator(ValidateProperty):
+    """Validates the items of containers. ``item_validator`` checks every
+    item (the keys of a mapping), ``key_validator`` and ``value_validator``
+    the keys and values of a mapping; each may be a Validator, a Validator
+    class or a type annotation.
+
+    Items are checked in place in a single loop, which stops at the first
+    invalid item, or after ``max_item_errors`` of them. An
+    :class:`~valio.error.errors.ItemValidationError` is raised with all the
+    errors found.
+    """
+    max_item_errors: INT = TypeValidator(logger=False, debug=True)
+
+    def __init__(
+            self,
+            item_validator: ITEM_VALIDATOR = None,
+            key_validator: ITEM_VALIDATOR = None,
+            value_validator: ITEM_VALIDATOR = None,
+            max_item_errors: INT = None,
+            doc: DOC = None,
+            debug: DEBUG = None,
+            **kwargs,
+    ):
+        if max_item_errors is not None and max_item_errors < 1:
+            raise ValueError(f"max_item_errors must be at least 1, got {max_item_errors} instead")
+        self.item_validator = item_validator
+        self.key_validator = key_validator
+        self.value_validator = value_validator
+        self.max_item_errors = max_item_errors
+        super(ItemValidator, self).__init__(doc=doc, debug=debug, **kwargs)
+        for option in ("item_validator", "key_validator", "value_validator"):
+            if getattr(self, option) is not None:
+                if self.doc is not None:
+                    self.doc += f", {option}: {getattr(self, option)!r}"
+                else:
+                    self.doc = f"{option}: {getattr(self, option)!r}"
+
+    @property
+    def item_validator(self):
+        return self._item_validator
+
+    @item_validator.setter
+    def item_validator(self, spec: ITEM_VALIDATOR):
+        self._item_validator, self._item_check = spec, _item_check(spec, "item")
+
+    @property
+    def key_validator(self):
+        return self._key_validator
+
+    @key_validator.setter
+    def key_validator(self, spec: ITEM_VALIDATOR):
+        self._key_validator, self._key_check = spec, _item_check(spec, "key")
+
+    @property
+    def value_validator(self):
+        return self._value_validator
+
+    @value_validator.setter
+    def value_validator(self, spec: ITEM_VALIDATOR):
+        self._value_validator, self._value_check = spec, _item_check(spec, "value")
+
+    def validate(self, instance=None, value=None):
+        self._validate_items(instance, value)
+
+    def _validate_items(self, instance, value):
+        item_check, key_check, value_check = self._item_check, self._key_check, self._value_check
+        if item_check is None and key_check is None and value_check is None:
+            return
+        if logger := self.logger:
+            logger.info(f"{self.name}: Items")
+        if value is None:
+            return
+
+        max_errors = self.__dict__.get("max_item_errors") or 1
+        found = []
+        if item_check is not None:
+            for index, item in enumerate(value):
+                try:
+                    item_check(item)
+                except Exception as error:
+                    found.append((index, error))
+                    if len(found) >= max_errors:
+                        break
+
+        if (key_check is not None or value_check is not None) and len(found) < max_errors:
+            for key, item in value.items():
+                try:
+                    if key_check is not None:
+                        key_check(key)
+                    if value_check is not None:
+                        value_check(item)
+                except Exception as error:
+                    found.append((key, error))
+                    if len(found) >= max_errors:
+                        break
+
+        if found:
+            message = "; ".join(f"{self.name}[{location!r}]: {error}" for location, error in found)
+            if len(found) >= max_errors > 1:
+                message += f" (stopped after {max_errors} errors)"
+            raise errors.ItemValidationError(message, errors=found)
 
 
 @dataclass
@@ -1353,6 +1950,7 @@ class Validator(
     ExpiryValidator,
     ChoiceValidator,
     AttributeValidator,
+    ItemValidator,
     TaskValidator
 ):
     """Validator: base class for validation of different Properties.
@@ -1371,12 +1969,47 @@ class Validator(
     ...         expire_before="2020-08-14",
     ...     )
     ...     password: str = Validator(reassign=False, min_length=3, default="sks")
+
+    With ``cache_validation=True`` the outcome of validating a hashable value
+    is kept in a :class:`ValidationCache` of ``cache_size`` entries (1024 by
+    default) living ``cache_ttl`` seconds, dropped whenever an option
+    changes. Validators tracking reassignment or expiry, logging, with
+    custom validators for the instance class, or checking more than the
+    value (phone numbers by the region of the instance, paths) always
+    validate.
+
+    Assigning an instance an immutable value equal to the one it holds is a
+    no-op, unless the value was set before an option changed or the
+    validator would validate it again anyway (as above, or with
+    processors and tasks for the instance class). Values set by a
+    :func:`~valio.model.model` ``__init__`` are validated again once.
+
+    Validation stops at the first failed check unless ``collect_errors=True``,
+    then every check runs and the failures are raised together as one
+    :class:`~valio.error.errors.ValidationError`, whose ``structured()``
+    gives ``(field, code, params)`` tuples. Messages are only formatted when
+    an error is shown.
     """
 
     enable_async: BOOL = TypeValidator(logger=False, debug=True)
     allow_validation: BOOL = TypeValidator(logger=False, debug=True)
-    # cache_validation: BOOL = TypeValidator(logger=False, debug=True)
+    lazy: BOOL = TypeValidator(logger=False, debug=True)
+    collect_errors: BOOL = TypeValidator(logger=False, debug=True)
+    cache_validation: BOOL = TypeValidator(logger=False, debug=True)
+    cache_size: INT = TypeValidator(logger=False, debug=True)
+    cache_ttl: SECONDS = TypeValidator(logger=False, debug=True)
+    cache_backend: CACHE_BACKEND = TypeValidator(logger=False, debug=True)
     default: DEFAULT = None
+    _plan = None
+    _checks = None
+    _cache = None
+    _fingerprint = None
+    # the ``_validate_*`` methods checking the values of a validator type,
+    # run after the checks of the options; those of the base classes too
+    _type_checks = ()
+    # whether they only depend on the value, not on the instance nor on
+    # anything outside (the outcome is then cached and reused)
+    _type_checks_value_only = True
     
     def __init__(
             self,
@@ -1401,13 +2034,25 @@ class Validator(
             expire_before: DATE_TIME_DELTA = None,
             in_choice: CHOICE = None,
             not_in_choice: CHOICE = None,
+            case_insensitive: BOOL = None,
+            normalize_unicode: STR = None,
             has_attributes: list[STR] = None,
+            item_validator: ITEM_VALIDATOR = None,
+            key_validator: ITEM_VALIDATOR = None,
+            value_validator: ITEM_VALIDATOR = None,
+            max_item_errors: INT = None,
             task_interval: INT = None,
             cache_task: BOOL = True,
             debug: DEBUG = None,
-            # cache_validation: BOOL = None,
+            cache_validation: BOOL = None,
+            cache_size: INT = None,
+            cache_ttl: SECONDS = None,
+            cache_backend: CACHE_BACKEND = None,
             enable_async: BOOL = None,
             allow_validation: BOOL = True,
+            lazy: BOOL = None,
+            collect_errors: BOOL = None,
+            storage: STORAGE = None,
             **kwargs,
     ):
 
@@ -1433,10 +2078,17 @@ class Validator(
             expire_before=expire_before,
             in_choice=in_choice,
             not_in_choice=not_in_choice,
+            case_insensitive=case_insensitive,
+            normalize_unicode=normalize_unicode,
             has_attributes=has_attributes,
+            item_validator=item_validator,
+            key_validator=key_validator,
+            value_validator=value_validator,
+            max_item_errors=max_item_errors,
             task_interval=task_interval,
             cache_task=cache_task,
             debug=debug,
+            storage=storage,
             **kwargs,
         )
         self._dict = None
@@ -1450,19 +2102,272 @@ class Validator(
         self._custom_pre_delete_processor: typing.DefaultDict = defaultdict(list)
         self._custom_post_delete_processor: typing.DefaultDict = defaultdict(list)
         self.allow_validation = allow_validation
-        # self.cache_validation = cache_validation
-
-        # if self.cache_validation:
-        #     self._validate_field = timed_lru_cache(seconds=30, maxsize=128)(self._validate_field)
-        #     self._async_validate_field = timed_lru_cache(seconds=30, maxsize=128)(self._async_validate_field)
-
+        self.lazy = lazy
+        self.collect_errors = collect_errors
+        self.cache_validation = cache_validation
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.cache_backend = cache_backend
 
     def validate(self, instance=None, value=None):
         if self.allow_validation is not None and self.allow_validation:
-            if not self.enable_async:
+            if self.enable_async:
+                self._async_validate_field(instance, value)
+            elif self.__dict__.get("cache_validation") and self._cacheable(instance):
+                self._cached_validate_field(instance, value)
+            else:
+                self._validate_field(instance, value)
+
+    def _cacheable(self, instance):
+        # outcomes depending on more than the value itself are never cached:
+        # reassignment, expiry, logging and the custom validators.
+        options = self.__dict__
+        return (
+            options.get("reassign") is None
+            and options.get("expiry") is None
+            and not options.get("logger")
+            and not self._custom_validators.get(instance.__class__.__name__)
+            and type(self)._type_checks_value_only
+        )
+
+    def _validation_cache(self) -> ValidationCache:
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = self.__dict__.get("cache_backend")
+        if cache is None:
+            cache = self._cache = ValidationCache(
+                maxsize=self.__dict__.get("cache_size") or 1024,
+                ttl=self.__dict__.get("cache_ttl"),
+            )
+        return cache
+
+    def _cache_fingerprint(self) -> typing.Optional[bytes]:
+        """digest of the options the outcome of a validation depends on, the
+        same in every process; ``None`` when an option has no stable repr"""
+        fingerprint = self._fingerprint
+        if fingerprint is None:
+            options = sorted(
+                (key, _stable_repr(value)) for key, value in self.__dict__.items()
+                if key in _FINGERPRINT_OPTIONS and value is not None
+            )
+            text = repr((type(self).__module__, type(self).__qualname__, self.name, options))
+            unstable = " at 0x" in text or any(
+                isinstance(value, descriptors.Property) for key, value in self.__dict__.items()
+                if key in _FINGERPRINT_OPTIONS
+            )
+            fingerprint = self._fingerprint = b"" if unstable \
+                else hashlib.blake2b(text.encode(), digest_size=16).digest()
+        return fingerprint or None
+
+    def _cached_validate_field(self, instance, value):
+        cache = self._validation_cache()
+        key = cache.key(self, value)
+        if key is None:
+            return self._validate_field(instance, value)
+
+        outcome = cache.get(key, _MISSING)
+        if outcome is _MISSING:
+            try:
                 self._validate_field(instance, value)
+            except Exception as error:
+                cache.put(key, error)
+                raise
+            cache.put(key, None)
+        elif outcome is not None:
+            raise outcome.with_traceback(None)
+
+    def cache_info(self) -> typing.Optional[CacheInfo]:
+        """hits, misses and size of the validation cache, ``None`` until
+        values are validated with ``cache_validation=True``"""
+        return self._cache.info() if self._cache is not None else None
+
+    def cache_clear(self):
+        if self._cache is not None:
+            self._cache.clear()
+
+    def __set__(self, obj, value):
+        """with ``lazy=True`` the raw value is only stored, it is validated
+        and processed on the first read (or by :func:`validate_now`). A
+        value overwritten before being read is never validated. Validators
+        tracking reassignment always validate straight away."""
+        if self.__dict__.get("lazy") and self.__dict__.get("reassign") is None:
+            storage = self._storage()
+            stored = storage.get(obj, self.name, _MISSING)
+            if type(stored) is _Pending:
+                stored = stored.previous
+            storage.set(obj, self.name, _Pending(value, stored))
+            return
+        super(Validator, self).__set__(obj, value)
+
+    def __get__(self, obj, obj_type=None):
+        if obj is not None:
+            pending = self._storage().get(obj, self.name, None)
+            if type(pending) is _Pending:
+                self._resolve_pending(obj, pending)
+        return super(Validator, self).__get__(obj, obj_type)
+
+    def _resolve_pending(self, obj, pending):
+        # put back the value the pending one replaced, a failing
+        # validation then leaves it in place as an eager __set__ would.
+        storage = self._storage()
+        if pending.previous is _MISSING:
+            storage.delete(obj, self.name)
+        else:
+            storage.set(obj, self.name, pending.previous)
+        super(Validator, self).__set__(obj, pending.value)
+
+    def _storage(self) -> storages.Storage:
+        return self.storage if self.storage is not None else _dict_storage
+
+    def _copy(self, keys: typing.Optional[typing.Iterable[str]] = None) -> "Validator":
+        """a new validator with the options of this one: containers are
+        copied, the methods of this one it holds are bound to the copy and
+        nothing validated, cached or named is kept. ``keys`` are those of
+        :meth:`_copied_keys`, given when known."""
+        copied = object.__new__(type(self))
+        options = copied.__dict__
+        options.update(self.__dict__)
+        for key in self._copied_keys() if keys is None else keys:
+            value = options[key]
+            if isinstance(value, defaultdict):
+                options[key] = defaultdict(value.default_factory, {
+                    namespace: [_rebind(func, self, copied) for func in funcs]
+                    for namespace, funcs in value.items()
+                })
+            elif type(value) in (list, dict, set):
+                options[key] = type(value)(value)
             else:
-                self._async_validate_field(instance, value)
+                options[key] = _rebind(value, self, copied)
+        for key in _COPY_RESETS:
+            if key in options:
+                options[key] = None
+        for key, source, build in _COPY_INDEXES:
+            if options.get(key) is not None:
+                options[key] = build(copied, options[source])
+        return copied
+
+    def _copied_keys(self) -> typing.Tuple[str, ...]:
+        """the options a copy can not share with this validator"""
+        return tuple(
+            key for key, value in self.__dict__.items()
+            if isinstance(value, (defaultdict, list, dict, set, types.MethodType))
+        )
+
+    def _unchanged_token(self, obj):
+        # setting an equal value again only does nothing when its outcome
+        # depends on the value alone, as for the validation cache, and no
+        # processor nor task of the class of obj would run.
+        options = self.__dict__
+        if (
+                options.get("reassign") is not None
+                or options.get("expiry") is not None
+                or options.get("logger")
+                or options.get("lazy")
+                or options.get("enable_async")
+                or not options.get("allow_validation")
+                or not type(self)._type_checks_value_only
+        ):
+            return None
+        class_name = obj.__class__.__name__
+        for hooks in _SET_HOOKS:
+            if options[hooks].get(class_name):
+                return None
+        token = options.get("_options_token")
+        if token is None:
+            token = options["_options_token"] = object()
+        return token
+
+    def __setattr__(self, key, value):
+        super(Validator, self).__setattr__(key, value)
+        if key in _PLAN_OPTIONS:
+            self.__dict__["_plan"] = self.__dict__["_checks"] = None
+            self.__dict__["_cache"] = self.__dict__["_fingerprint"] = None
+        elif key in _CACHE_OPTIONS or key in _FINGERPRINT_OPTIONS:
+            self.__dict__["_cache"] = self.__dict__["_fingerprint"] = None
+        if key in _PLAN_OPTIONS or key in _FINGERPRINT_OPTIONS or key == "allow_validation":
+            # values set before are validated again, even when equal
+            self.__dict__["_options_token"] = None
+
+    def _validation_plan(self):
+        """The ``_validate_*`` checks that can fail with the current options,
+        built once and rebuilt only when one of the options changes."""
+        plan = self._plan
+        if plan is None:
+            plan = self._plan = tuple(self._build_validation_plan())
+        return plan
+
+    def _build_validation_plan(self):
+        options = self.__dict__
+        for check, _, methods, is_active in _VALIDATION_CHECKS:
+            # checks overridden by subclasses are always run
+            if is_active(self, options) or any(
+                    getattr(type(self), method) is not getattr(Validator, method) for method in methods
+            ):
+                yield getattr(self, check)
+        seen = set()
+        for klass in reversed(type(self).__mro__):
+            for check in klass.__dict__.get("_type_checks", ()):
+                if check not in seen:
+                    seen.add(check)
+                    yield getattr(self, check)
+
+    def _check_plan(self):
+        """The validation plan as ``(check, raises)`` pairs: ``check(value)``
+        returns a :class:`~valio.error.errors.Violation` or ``None``, the
+        checks that ``raises`` are the ``_validate_*`` methods themselves."""
+        plan = self._checks
+        if plan is None:
+            plan = self._checks = tuple(self._build_check_plan())
+        return plan
+
+    def _build_check_plan(self):
+        # logging validators, and checks overridden by subclasses, keep
+        # going through the raising methods
+        logs = bool(self.__dict__.get("logger"))
+        for validate in self._validation_plan():
+            # the checks of validator types have no tester
+            tester, methods = _CHECK_TESTERS.get(validate.__name__, (None, ()))
+            if tester is None or logs or any(
+                    getattr(type(self), method) is not getattr(Validator, method) for method in methods
+            ):
+                yield validate, True
+            else:
+                yield getattr(self, tester), False
+
+    def check(self, value, instance=None) -> typing.Union[errors.Ok, errors.Violation]:
+        """Validate ``value`` without raising nor setting anything: the
+        :class:`~valio.error.errors.Violation` of the first failed check,
+        :class:`~valio.error.errors.Ok` when there is none. The custom
+        validators run are those of the class of ``instance``.
+
+        >>> validator = Validator(name="age", min_value=18, logger=False)
+        >>> validator.check(30)
+        Ok(30)
+        >>> validator.check(3)
+        Violation(field='age', code='min_value', params={'min_value': 18, 'value': 3})
+        """
+        if not self.allow_validation:
+            return errors.Ok(value)
+        try:
+            if type(self).validate is not Validator.validate:
+                # subclasses adding their checks on validate
+                self.validate(instance, value)
+                return errors.Ok(value)
+            for check, raises in self._check_plan():
+                if raises:
+                    check(instance, value)
+                else:
+                    violation = check(value)
+                    if violation is not None:
+                        return violation
+            for func in self._custom_validators.get(instance.__class__.__name__, ()):
+                if asyncio.iscoroutinefunction(func):
+                    asyncio.get_event_loop().run_until_complete(func(instance, value))
+                else:
+                    func(instance, value)
+        except Exception as error:
+            return errors.Violation.from_error(error, self.name)
+        return errors.Ok(value)
 
     def _validate_field(self, instance, value):
         """
@@ -1470,18 +2375,17 @@ class Validator(
         to be validated synchronously.
         :return: if value is not validated, this method raises errors
         """
-        _validators = [
-            self._validate_reassignment(instance, value),
-            self._validate_type(instance, value),
-            self._validate_required(instance, value),
-            self._validate_pattern(instance, value),
-            self._validate_multiple_of(instance, value),
-            self._validate_length(instance, value),
-            self._validate_value(instance, value),
-            self._validate_expiry(instance, value),
-            self._validate_choice(instance, value),
-            self._validate_attribute(instance, value)
-        ]
+        if self.__dict__.get("collect_errors"):
+            return self._collect_field_errors(instance, value)
+        _validators = []
+        for check, raises in self._check_plan():
+            if raises:
+                _validators.append(check(instance, value))
+            else:
+                violation = check(value)
+                if violation is not None:
+                    raise violation.to_error()
+                _validators.append(violation)
         for func in self._custom_validators[instance.__class__.__name__]:
             if asyncio.iscoroutinefunction(func):
                 _validators.extend(asyncio.get_event_loop().run_until_complete(func(instance, value)))
@@ -1489,19 +2393,35 @@ class Validator(
                 _validators.append(func(instance, value))
         return _validators
 
+    def _collect_field_errors(self, instance, value):
+        """run every check, all the failed ones are raised together as one
+        :class:`~valio.error.errors.ValidationError`. The checks with a
+        tester return their violation, only the others raise."""
+        _validators, found = [], []
+        checks = list(self._check_plan())
+        for func in self._custom_validators.get(instance.__class__.__name__, ()):
+            if asyncio.iscoroutinefunction(func):
+                checks.append((lambda instance, value, func=func:
+                               asyncio.get_event_loop().run_until_complete(func(instance, value)), True))
+            else:
+                checks.append((func, True))
+        for check, raises in checks:
+            if not raises:
+                violation = check(value)
+                if violation is not None:
+                    found.append((self.name, violation.to_error()))
+                _validators.append(violation)
+                continue
+            try:
+                _validators.append(check(instance, value))
+            except Exception as error:
+                found.append((self.name, error))
+        if found:
+            raise errors.ValidationError(errors=found)
+        return _validators
+
     def _async_validate_field(self, instance, value):
-        _validators = [
-            async_wrap(self._validate_reassignment)(instance, value),
-            async_wrap(self._validate_type)(instance, value),
-            async_wrap(self._validate_required)(instance, value),
-            async_wrap(self._validate_pattern)(instance, value),
-            async_wrap(self._validate_multiple_of)(instance, value),
-            async_wrap(self._validate_length)(instance, value),
-            async_wrap(self._validate_value)(instance, value),
-            async_wrap(self._validate_expiry)(instance, value),
-            async_wrap(self._validate_choice)(instance, value),
-            async_wrap(self._validate_attribute)(instance, value)
-        ]
+        _validators = [async_wrap(check)(instance, value) for check in self._validation_plan()]
 
         _validators += [
             async_wrap(func)(instance, value)
@@ -1513,9 +2433,11 @@ class Validator(
 
     def add_validator(self, func, namespace=None):
         """custom validator functions and methods are accepted here
-        and validated"""
+        and validated, a function already added to the namespace is not
+        added again"""
         func_class_name = namespace or str(func.__qualname__).split(".")[0]
-        self._custom_validators[func_class_name].append(func)
+        if func not in self._custom_validators[func_class_name]:
+            self._custom_validators[func_class_name].append(func)
         return func
     
     def _processing(self, func_default_dict, task_default_dict, instance, value):
@@ -1628,6 +2550,121 @@ class Validator(
         return func
 
 
+_MISSING = object()
+
+
+_dict_storage = storages.DictStorage()
+
+
+class _Pending(object):
+    """a value stored by a lazy Validator, not validated yet"""
+    __slots__ = ("value", "previous")
+
+    def __init__(self, value, previous):
+        self.value = value
+        self.previous = previous
+
+
+def validate_now(instance):
+    """Validate every value a lazy Validator of ``instance`` still holds
+    unvalidated, errors are raised (or recorded) as on assignment."""
+    seen = set()
+    for klass in type(instance).__mro__:
+        for name, validator in vars(klass).items():
+            if name in seen or not isinstance(validator, Validator):
+                continue
+            seen.add(name)
+            pending = validator._storage().get(instance, validator.name, None)
+            if type(pending) is _Pending:
+                validator._resolve_pending(instance, pending)
+    return instance
+
+
+def _option(name):
+    return lambda validator, options: bool(options.get(name))
+
+
+# (check, its non raising version if any, methods it runs, whether the
+# current options make it do anything)
+_VALIDATION_CHECKS = (
+    ("_validate_reassignment", None, ("_validate_reassignment",),
+     lambda validator, options: options.get("reassign") is not None and not options.get("reassign")),
+    ("_validate_type", "_check_type", ("_validate_type",),  # logs the type even when there is none
+     lambda validator, options: options.get("annotation") is not None or bool(options.get("logger"))),
+    ("_validate_required", "_check_required", ("_validate_required",), _option("required")),
+    ("_validate_pattern", "_check_pattern", ("_validate_pattern",),
+     lambda validator, options: options.get("pattern") is not None),
+    ("_validate_multiple_of", "_check_multiple_of", ("_validate_multiple_of",), _option("multiple_of")),
+    ("_validate_length", "_check_length", ("_validate_length", "_validate_min_length", "_validate_max_length"),
+     lambda validator, options: any(options.get(name) for name in ("min_length", "length", "max_length"))),
+    ("_validate_value", "_check_value", ("_validate_value", "_validate_min_value", "_validate_max_value"),
+     lambda validator, options: any(options.get(name) for name in ("min_value", "value", "max_value"))),
+    ("_validate_expiry", None, ("_validate_expiry",), _option("expiry")),
+    ("_validate_choice", "_check_choice", ("_validate_choice", "_validate_in_choice", "_validate_not_in_choice"),
+     lambda validator, options: options.get("_in_choice_index") is not None
+                                or options.get("_not_in_choice_index") is not None),
+    ("_validate_attribute", "_check_attribute", ("_validate_attribute",), _option("has_attributes")),
+    ("_validate_items", None, ("_validate_items",),
+     lambda validator, options: any(options.get(name) is not None
+                                    for name in ("_item_check", "_key_check", "_value_check"))),
+)
+
+_CHECK_TESTERS = {check: (tester, methods) for check, tester, methods, _ in _VALIDATION_CHECKS}
+
+_PLAN_OPTIONS = frozenset({
+    "annotation", "logger", "reassign", "required", "pattern", "multiple_of",
+    "min_length", "length", "max_length", "min_value", "value", "max_value",
+    "expiry", "timeline", "_in_choice_index", "_not_in_choice_index", "has_attributes",
+    "_item_check", "_key_check", "_value_check",
+})
+
+
+def _stable_repr(value) -> str:
+    # compiled patterns (re and regexps.PatternType) by their pattern text
+    flags = getattr(value, "flags", None)
+    while not isinstance(value, (str, bytes)) and hasattr(value, "pattern"):
+        value = value.pattern
+    return repr((value, flags)) if flags is not None else repr(value)
+
+
+_CACHE_OPTIONS = frozenset({"cache_validation", "cache_size", "cache_ttl", "cache_backend"})
+
+# what a copy of a validator starts without
+_COPY_RESETS = ("_plan", "_checks", "_cache", "_fingerprint", "_options_token", "errors", "_dict")
+
+# the indexes a copy builds again from its own copy of the options they
+# index, updating them in place must not reach the validator copied
+_COPY_INDEXES = (
+    ("_in_choice_index", "_in_choice", lambda validator, choices: validator._choice_index(choices)),
+    ("_not_in_choice_index", "_not_in_choice", lambda validator, choices: validator._choice_index(choices)),
+    ("_in_networks_index", "_in_networks", lambda validator, networks: relib.NetworkIndex(networks) if networks else None),
+    ("_not_in_networks_index", "_not_in_networks", lambda validator, networks: relib.NetworkIndex(networks) if networks else None),
+)
+
+
+def _rebind(value, old, new):
+    if isinstance(value, types.MethodType) and value.__self__ is old:
+        return types.MethodType(value.__func__, new)
+    return value
+
+
+# the validators, processors and tasks run on setting a value
+_SET_HOOKS = (
+    "_custom_validators", "_custom_pre_validator", "_custom_post_validator", "_custom_post_set_processor",
+    "_pre_validate_tasks", "_post_validate_tasks", "_post_set_tasks",
+)
+
+# the options, by the name they are stored under, a validation outcome
+# depends on; item validators given as Validator instances have no stable
+# repr, validators using them are not shared.
+_FINGERPRINT_OPTIONS = frozenset({
+    "annotation", "required", "pattern", "multiple_of", "min_length", "length", "max_length",
+    "min_value", "value", "max_value", "_in_choice", "_not_in_choice", "case_insensitive",
+    "normalize_unicode", "has_attributes", "_item_validator", "_key_validator",
+    "_value_validator", "max_item_errors", "_in_networks", "_not_in_networks", "version",
+})
+
+
 def async_wrap(func):
     @wraps(func)
     async def run(*args, loop=None, executor=None, **kwargs):
@@ -1707,10 +2744,7 @@ class StringValidator(Validator):
 
 class HexShortColorValidator(StringValidator):
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_hex_short_color_pattern,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(HexShortColorValidator, self).validate(instance=instance, value=value)
+    _type_checks = ("_validate_hex_short_color_pattern",)
 
     def _validate_hex_short_color_pattern(self, instance, value):
         if not re.compile(relib.r_hex_short.pattern, re.IGNORECASE).fullmatch(value):
@@ -1719,10 +2753,7 @@ class HexShortColorValidator(StringValidator):
  
 class HexLongColorValidator(StringValidator):
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_hex_long_color_pattern,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(HexLongColorValidator, self).validate(instance=instance, value=value)
+    _type_checks = ("_validate_hex_long_color_pattern",)
 
     def _validate_hex_long_color_pattern(self, instance, value):
         if not re.compile(relib.r_hex_long.pattern, re.IGNORECASE).fullmatch(value):
@@ -1731,10 +2762,7 @@ class HexLongColorValidator(StringValidator):
 
 class HexColorValidator(StringValidator):
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_hex_short_or_hex_long_color_pattern,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(HexColorValidator, self).validate(instance=instance, value=value)
+    _type_checks = ("_validate_hex_short_or_hex_long_color_pattern",)
 
     def _validate_hex_short_or_hex_long_color_pattern(self, instance, value):
         if not re.compile((relib.r_hex_long | relib.r_hex_short).pattern, re.IGNORECASE).fullmatch(value):
@@ -1743,10 +2771,7 @@ class HexColorValidator(StringValidator):
 
 class RGBOrRGBAColorValidator(StringValidator):
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_rgb_or_rgba_color_pattern,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(RGBOrRGBAColorValidator, self).validate(instance=instance, value=value)
+    _type_checks = ("_validate_rgb_or_rgba_color_pattern",)
 
     def _validate_rgb_or_rgba_color_pattern(self, instance, value):
         if not re.compile((relib.r_rgb | relib.r_rbga).pattern, re.IGNORECASE).fullmatch(value):
@@ -1756,10 +2781,7 @@ class RGBOrRGBAColorValidator(StringValidator):
 
 class HSLOrHSLAColorValidator(StringValidator):
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_hsl_or_hsla_color_pattern,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(HSLOrHSLAColorValidator, self).validate(instance=instance, value=value)
+    _type_checks = ("_validate_hsl_or_hsla_color_pattern",)
 
     def _validate_hsl_or_hsla_color_pattern(self, instance, value):
         if not re.compile((relib.r_rgb | relib.r_rbga).pattern, re.IGNORECASE).fullmatch(value):
@@ -1875,6 +2897,7 @@ class EmailIDValidator(StringValidator):
 
 @dataclass
 class PaymentCardValidator(StringValidator):
+    _type_checks = ("_validate_payment_card",)
 
     def __init__(
             self,
@@ -1896,11 +2919,6 @@ class PaymentCardValidator(StringValidator):
             **kwargs,
         )
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_payment_card,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(PaymentCardValidator, self).validate(instance=instance, value=value)
-
     def _validate_payment_card(self, instance=None, value=None):  # noqa
         if value is not None:
             if logger := self.logger:
@@ -1912,6 +2930,9 @@ class PaymentCardValidator(StringValidator):
 
 @dataclass
 class PhoneNumberValidator(StringValidator):
+    _type_checks = ("_validate_phone_number",)
+    # the region of the instance is read
+    _type_checks_value_only = False
 
     def __init__(
             self,
@@ -1933,11 +2954,6 @@ class PhoneNumberValidator(StringValidator):
             **kwargs,
         )
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_phone_number,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(PhoneNumberValidator, self).validate(instance=instance, value=value)
-
     def _validate_phone_number(self, instance=None, value=None):  # noqa
         if value is not None:
             if logger := self.logger:
@@ -1953,6 +2969,9 @@ class PhoneNumberValidator(StringValidator):
 class PathValidator(StringValidator):
     annotation = PATH
     path_exists: BOOL = TypeValidator(logger=False, debug=True)
+    _type_checks = ("_validate_file_path",)
+    # the file system is read
+    _type_checks_value_only = False
 
     def __init__(
             self,
@@ -1977,11 +2996,6 @@ class PathValidator(StringValidator):
             **kwargs,
         )
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_file_path,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(PathValidator, self).validate(instance=instance, value=value)
-
     def _validate_file_path(self, instance, value):
         if value is not None:
             if isinstance(value, str):
@@ -1994,59 +3008,127 @@ class PathValidator(StringValidator):
                     raise FileNotFoundError(f"{self.name} expects an existing file, found None")
 
 
-class IP4AddressValidator(StringValidator):
+class IPAddressValidator(StringValidator):
+    """Base class of the ip address validators, ``version`` is 4, 6 or
+    ``None`` for any of them.
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_ip4address,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(IP4AddressValidator, self).validate(instance=instance, value=value)
+    Addresses are checked without building ``ipaddress`` objects (see
+    :mod:`valio.regexer.relib.ipnetworks`). ``in_networks`` and
+    ``not_in_networks`` are allow and deny lists of CIDR networks, each
+    compiled to a sorted interval index. Assigning either option rebuilds
+    its index, :meth:`rebuild_networks` does it after in place changes.
+    """
+    version: typing.Optional[int] = None
+    _type_checks = ("_validate_ip_address",)
 
-    def _validate_ip4address(self, instance, value):
-        if value is not None:
-            try:
-                ipaddress.IPv4Address(value)
-            except (Exception,):
-                raise ValueError(f"{self.name} expects a valid ip4address,"
-                                 f" got {value} as value instead") from None
+    def __init__(
+            self,
+            in_networks: NETWORKS = None,
+            not_in_networks: NETWORKS = None,
+            doc: DOC = None,
+            **kwargs
+    ):
+        self.in_networks = in_networks
+        self.not_in_networks = not_in_networks
+        super(IPAddressValidator, self).__init__(doc=doc, **kwargs)
+        if self.in_networks is not None:
+            if self.doc is not None:
+                self.doc += f", in_networks: {self.in_networks}"
+            else:
+                self.doc = f"in_networks: {self.in_networks}"
+        if self.not_in_networks is not None:
+            if self.doc is not None:
+                self.doc += f", not_in_networks: {self.not_in_networks}"
+            else:
+                self.doc = f"not_in_networks: {self.not_in_networks}"
 
+    @property
+    def in_networks(self):
+        return self._in_networks
 
-class IP6AddressValidator(StringValidator):
+    @in_networks.setter
+    def in_networks(self, networks: NETWORKS):
+        self._in_networks = networks
+        self._in_networks_index = relib.NetworkIndex(networks) if networks else None
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_ip6address,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(IP6AddressValidator, self).validate(instance=instance, value=value)
+    @property
+    def not_in_networks(self):
+        return self._not_in_networks
+
+    @not_in_networks.setter
+    def not_in_networks(self, networks: NETWORKS):
+        self._not_in_networks = networks
+        self._not_in_networks_index = relib.NetworkIndex(networks) if networks else None
+
+    def rebuild_networks(self):
+        self.in_networks = self._in_networks
+        self.not_in_networks = self._not_in_networks
 
-    def _validate_ip6address(self, instance, value):
+    def _validate_ip_address(self, instance, value):
         if value is not None:
-            try:
-                ipaddress.IPv6Address(value)
-            except (Exception,):
-                raise ValueError(f"{self.name} expects a valid ip6address,"
+            if not _ip_checks[self.version](value):
+                raise ValueError(f"{self.name} expects a valid {_ip_names[self.version]},"
                                  f" got {value} as value instead") from None
+            self._validate_in_networks(instance, value)
+            self._validate_not_in_networks(instance, value)
 
+    def _validate_in_networks(self, instance, value):
+        if self._in_networks_index is not None:
+            if logger := self.logger:
+                logger.info(f"{self.name}: In-Networks: {self.in_networks}")
+            if value not in self._in_networks_index:
+                raise ValueError(
+                    f"{self.name} expect addresses in {self.in_networks}, "
+                    f"got {value} as value instead"
+                )
 
-class IPAnyAddressValidator(StringValidator):
+    def _validate_not_in_networks(self, instance, value):
+        if self._not_in_networks_index is not None:
+            if logger := self.logger:
+                logger.info(f"{self.name}: Not-In-Networks: {self.not_in_networks}")
+            if value in self._not_in_networks_index:
+                raise ValueError(
+                    f"{self.name} does not expect addresses in {self.not_in_networks}, "
+                    f"got {value} as value instead"
+                )
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_ip46address,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(IPAnyAddressValidator, self).validate(instance=instance, value=value)
+    def is_valid_many(self, values: typing.Iterable) -> typing.List[bool]:
+        """Batch check for columns of addresses, only the address and the
+        network constraints are checked, returns one bool per value.
+        """
+        check = _ip_checks[self.version]
+        allowed, denied = self._in_networks_index, self._not_in_networks_index
+        if allowed is None and denied is None:
+            return [value is None or check(value) for value in values]
+        return [
+            value is None or (
+                check(value)
+                and (allowed is None or value in allowed)
+                and (denied is None or value not in denied)
+            )
+            for value in values
+        ]
+
+
+_ip_checks = {4: relib.is_ipv4_address, 6: relib.is_ipv6_address, None: relib.is_ip_address}
+_ip_names = {4: "ip4address", 6: "ip6address", None: "ipaddress"}
+
+
+class IP4AddressValidator(IPAddressValidator):
+    version = 4
 
-    def _validate_ip46address(self, instance, value):
-        if value is not None:
-            try:
-                try:
-                    ipaddress.IPv4Address(value)
-                except (Exception,):
-                    ipaddress.IPv6Address(value)
-            except (Exception,):
-                raise ValueError(f"{self.name} expects a valid ipaddress,"
-                                 f" got {value} as value instead")
+
+class IP6AddressValidator(IPAddressValidator):
+    version = 6
+
+
+class IPAnyAddressValidator(IPAddressValidator):
+    version = None
 
 
 @dataclass
 class AadhaarCardValidator(StringValidator):
+    _type_checks = ("_validate_aadhaar_number",)
 
     def __init__(
             self,
@@ -2064,11 +3146,6 @@ class AadhaarCardValidator(StringValidator):
             **kwargs
         )
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_aadhaar_number,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(AadhaarCardValidator, self).validate(instance=instance, value=value)
-
     def _validate_aadhaar_number(self, instance=None, value=None):  # noqa
         if value is not None:
             if logger := self.logger:
@@ -2080,6 +3157,7 @@ class AadhaarCardValidator(StringValidator):
 
 
 class PANCardValidator(Validator):
+    _type_checks = ("_validate_pan",)
 
     def __init__(
             self,
@@ -2097,11 +3175,6 @@ class PANCardValidator(Validator):
             **kwargs
         )
 
-    def validate(self, instance=None, value=None):
-        self.add_validator(self._validate_pan,
-                           namespace=instance.__class__.__name__ if instance is not None else None)
-        super(PANCardValidator, self).validate(instance=instance, value=value)
-
     def _validate_pan(self, instance=None, value=None):  # noqa
         if value is not None:
             if logger := self.logger: